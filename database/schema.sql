@@ -41,7 +41,9 @@ CREATE FUNCTION public.doc_chunks_fts_trigger() RETURNS trigger
     LANGUAGE plpgsql
     AS $$
                 BEGIN
-                    NEW.fts_vector := to_tsvector('simple', NEW.chunk_text);
+                    IF TG_OP = 'UPDATE' OR NEW.fts_vector IS NULL THEN
+                        NEW.fts_vector := to_tsvector('simple', NEW.chunk_text);
+                    END IF;
                     RETURN NEW;
                 END
                 $$;
@@ -68,7 +70,8 @@ CREATE TABLE public.annc_all (
     annc_pblsh_dt character varying(50) NOT NULL,
     annc_deadline_dt character varying(50) NOT NULL,
     annc_status character varying(20) NOT NULL,
-    service_status character varying(20) NOT NULL
+    service_status character varying(20) NOT NULL,
+    active_generation integer
 );
 
 
@@ -86,6 +89,37 @@ ALTER TABLE public.annc_all ALTER COLUMN annc_id ADD GENERATED BY DEFAULT AS IDE
 );
 
 
+--
+-- Name: annc_eligibility; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.annc_eligibility (
+    rule_id bigint NOT NULL,
+    generation integer NOT NULL,
+    group_name character varying(50),
+    min_age smallint,
+    max_age smallint,
+    marital_status character varying(10),
+    max_income_pct smallint,
+    min_children smallint,
+    annc_id bigint NOT NULL
+);
+
+
+--
+-- Name: annc_eligibility_rule_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+ALTER TABLE public.annc_eligibility ALTER COLUMN rule_id ADD GENERATED BY DEFAULT AS IDENTITY (
+    SEQUENCE NAME public.annc_eligibility_rule_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
+
 --
 -- Name: annc_files; Type: TABLE; Schema: public; Owner: -
 --
@@ -97,7 +131,8 @@ CREATE TABLE public.annc_files (
     file_path character varying(2000),
     file_ext character varying(10) NOT NULL,
     file_size integer NOT NULL,
-    annc_id bigint NOT NULL
+    annc_id bigint NOT NULL,
+    generation integer NOT NULL
 );
 
 
@@ -115,6 +150,72 @@ ALTER TABLE public.annc_files ALTER COLUMN file_id ADD GENERATED BY DEFAULT AS I
 );
 
 
+--
+-- Name: annc_profile; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.annc_profile (
+    profile_id bigint NOT NULL,
+    generation integer NOT NULL,
+    eligibility jsonb,
+    rent jsonb,
+    area jsonb,
+    schedule jsonb,
+    documents jsonb,
+    model_name character varying(50) NOT NULL,
+    created_at timestamp with time zone NOT NULL,
+    annc_id bigint NOT NULL
+);
+
+
+--
+-- Name: annc_profile_profile_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+ALTER TABLE public.annc_profile ALTER COLUMN profile_id ADD GENERATED BY DEFAULT AS IDENTITY (
+    SEQUENCE NAME public.annc_profile_profile_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
+
+--
+-- Name: annc_unit; Type: TABLE; Schema: public; Owner: -
+--
+
+CREATE TABLE public.annc_unit (
+    unit_id bigint NOT NULL,
+    generation integer NOT NULL,
+    complex_name character varying(200),
+    unit_type character varying(50),
+    exclusive_area numeric(8,2),
+    supply_area numeric(8,2),
+    deposit bigint,
+    monthly_rent bigint,
+    supply_count integer,
+    page_num smallint NOT NULL,
+    annc_id bigint NOT NULL,
+    file_id bigint
+);
+
+
+--
+-- Name: annc_unit_unit_id_seq; Type: SEQUENCE; Schema: public; Owner: -
+--
+
+ALTER TABLE public.annc_unit ALTER COLUMN unit_id ADD GENERATED BY DEFAULT AS IDENTITY (
+    SEQUENCE NAME public.annc_unit_unit_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
+
 --
 -- Name: annc_lh_temp; Type: TABLE; Schema: public; Owner: -
 --
@@ -252,7 +353,12 @@ CREATE TABLE public.doc_chunks (
     metadata jsonb NOT NULL,
     fts_vector tsvector,
     annc_id bigint NOT NULL,
-    file_id bigint NOT NULL
+    file_id bigint NOT NULL,
+    chunk_text_hash character varying(64),
+    generation integer NOT NULL,
+    section_path character varying(500),
+    section_category character varying(20),
+    has_numeric_table boolean
 );
 
 
@@ -286,6 +392,14 @@ ALTER TABLE ONLY public.annc_all
     ADD CONSTRAINT annc_all_pkey PRIMARY KEY (annc_id);
 
 
+--
+-- Name: annc_eligibility annc_eligibility_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_eligibility
+    ADD CONSTRAINT annc_eligibility_pkey PRIMARY KEY (rule_id);
+
+
 --
 -- Name: annc_files annc_files_file_id_annc_id_d8167e21_uniq; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -302,6 +416,30 @@ ALTER TABLE ONLY public.annc_files
     ADD CONSTRAINT annc_files_pkey PRIMARY KEY (file_id);
 
 
+--
+-- Name: annc_profile annc_profile_annc_id_generation_uniq; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_profile
+    ADD CONSTRAINT annc_profile_annc_id_generation_uniq UNIQUE (annc_id, generation);
+
+
+--
+-- Name: annc_profile annc_profile_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_profile
+    ADD CONSTRAINT annc_profile_pkey PRIMARY KEY (profile_id);
+
+
+--
+-- Name: annc_unit annc_unit_pkey; Type: CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_unit
+    ADD CONSTRAINT annc_unit_pkey PRIMARY KEY (unit_id);
+
+
 --
 -- Name: annc_lh_temp annc_lh_temp_pkey; Type: CONSTRAINT; Schema: public; Owner: -
 --
@@ -373,6 +511,13 @@ ALTER TABLE ONLY public.doc_chunks
 CREATE INDEX annc_all_annc_url_2d790bc7_like ON public.annc_all USING btree (annc_url varchar_pattern_ops);
 
 
+--
+-- Name: annc_elig_annc_gen_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX annc_elig_annc_gen_idx ON public.annc_eligibility USING btree (annc_id, generation);
+
+
 --
 -- Name: annc_files_annc_id_4962fe44; Type: INDEX; Schema: public; Owner: -
 --
@@ -380,6 +525,20 @@ CREATE INDEX annc_all_annc_url_2d790bc7_like ON public.annc_all USING btree (ann
 CREATE INDEX annc_files_annc_id_4962fe44 ON public.annc_files USING btree (annc_id);
 
 
+--
+-- Name: annc_files_annc_gen_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX annc_files_annc_gen_idx ON public.annc_files USING btree (annc_id, generation);
+
+
+--
+-- Name: annc_unit_annc_gen_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX annc_unit_annc_gen_idx ON public.annc_unit USING btree (annc_id, generation);
+
+
 --
 -- Name: chat_message_chat_id_21483fa7; Type: INDEX; Schema: public; Owner: -
 --
@@ -401,6 +560,35 @@ CREATE INDEX doc_chunks_annc_id_7049600c ON public.doc_chunks USING btree (annc_
 CREATE INDEX doc_chunks_file_id_e1ca55b2 ON public.doc_chunks USING btree (file_id);
 
 
+--
+-- Name: doc_chunks_chunk_text_hash_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX doc_chunks_chunk_text_hash_idx ON public.doc_chunks USING btree (chunk_text_hash);
+
+
+--
+-- Name: doc_chunks_annc_gen_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX doc_chunks_annc_gen_idx ON public.doc_chunks USING btree (annc_id, generation);
+
+
+--
+-- Name: doc_chunks_annc_gen_cat_idx; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX doc_chunks_annc_gen_cat_idx ON public.doc_chunks USING btree (annc_id, generation, section_category);
+
+
+--
+-- Name: annc_eligibility annc_eligibility_annc_id_fk_annc_all_annc_id; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_eligibility
+    ADD CONSTRAINT annc_eligibility_annc_id_fk_annc_all_annc_id FOREIGN KEY (annc_id) REFERENCES public.annc_all(annc_id) DEFERRABLE INITIALLY DEFERRED;
+
+
 --
 -- Name: annc_files annc_files_annc_id_4962fe44_fk_annc_all_annc_id; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
@@ -409,6 +597,30 @@ ALTER TABLE ONLY public.annc_files
     ADD CONSTRAINT annc_files_annc_id_4962fe44_fk_annc_all_annc_id FOREIGN KEY (annc_id) REFERENCES public.annc_all(annc_id) DEFERRABLE INITIALLY DEFERRED;
 
 
+--
+-- Name: annc_profile annc_profile_annc_id_fk_annc_all_annc_id; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_profile
+    ADD CONSTRAINT annc_profile_annc_id_fk_annc_all_annc_id FOREIGN KEY (annc_id) REFERENCES public.annc_all(annc_id) DEFERRABLE INITIALLY DEFERRED;
+
+
+--
+-- Name: annc_unit annc_unit_annc_id_fk_annc_all_annc_id; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_unit
+    ADD CONSTRAINT annc_unit_annc_id_fk_annc_all_annc_id FOREIGN KEY (annc_id) REFERENCES public.annc_all(annc_id) DEFERRABLE INITIALLY DEFERRED;
+
+
+--
+-- Name: annc_unit annc_unit_file_id_fk_annc_files_file_id; Type: FK CONSTRAINT; Schema: public; Owner: -
+--
+
+ALTER TABLE ONLY public.annc_unit
+    ADD CONSTRAINT annc_unit_file_id_fk_annc_files_file_id FOREIGN KEY (file_id) REFERENCES public.annc_files(file_id) DEFERRABLE INITIALLY DEFERRED;
+
+
 --
 -- Name: chat_message chat_message_chat_id_21483fa7_fk_chat_id; Type: FK CONSTRAINT; Schema: public; Owner: -
 --
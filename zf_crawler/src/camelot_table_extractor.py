@@ -1,9 +1,14 @@
-"""Camelot 기반 PDF 테이블 추출"""
+"""Camelot 기반 PDF 테이블 추출
+
+표 추출/마크다운 변환 결과가 바뀌면 parser.TABLE_PIPELINE_VERSION을 올릴 것 (파싱 캐시 무효화)
+"""
 import camelot
 import pandas as pd
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from .config import MAX_WORKERS
 
 
 @dataclass
@@ -18,25 +23,31 @@ class ExtractedTable:
     metadata: Dict = field(default_factory=dict)
 
 
+# 제어 문자 제거(탭/줄바꿈/CR 제외) 변환 테이블
+_CONTROL_CHARS = {i: None for i in range(32) if chr(i) not in '\t\n\r'}
+
+# 데이터 셀용: 제어 문자 제거 + 파이프 이스케이프 + 줄바꿈 공백 변환을 한 번에 처리
+_CELL_TRANSLATE = str.maketrans({**_CONTROL_CHARS, '|': '\\|', '\n': ' '})
+
+_HEADER_KEYWORDS = {
+    '구분', '항목', '유형', '자격', '기준', '요건', '내용', '순번', '번호',
+    '순위', '단지', '주소', '면적', '세대', '신청', '접수', '서류', '일정',
+    '기간', '대상', '조건', '공급', '타입', '호수', '층', '금액', '비고'
+}
+
+
 def detect_header_rows(df: pd.DataFrame) -> int:
     """헤더 행 수 감지"""
     if df.empty or len(df) < 2:
         return 1
 
-    header_keywords = {
-        '구분', '항목', '유형', '자격', '기준', '요건', '내용', '순번', '번호',
-        '순위', '단지', '주소', '면적', '세대', '신청', '접수', '서류', '일정',
-        '기간', '대상', '조건', '공급', '타입', '호수', '층', '금액', '비고'
-    }
-
     header_count = 0
-    for i in range(min(4, len(df))):
-        row_values = df.iloc[i].tolist()
+    for i, row_values in enumerate(df.head(4).to_numpy().tolist()):
         row_text = ' '.join(str(v) for v in row_values if v)
         numbers = sum(1 for v in row_values if str(v).replace(',', '').replace('.', '').isdigit())
         if numbers > len(row_values) // 2:
             break
-        if any(kw in row_text for kw in header_keywords):
+        if any(kw in row_text for kw in _HEADER_KEYWORDS):
             header_count = i + 1
         else:
             break
@@ -49,10 +60,10 @@ def merge_header_rows(df: pd.DataFrame, num_header_rows: int) -> List[str]:
         return df.iloc[0].tolist()
 
     merged = []
-    for col_idx in range(len(df.columns)):
+    for col_idx, (_, column) in enumerate(df.iloc[:num_header_rows].items()):
         parts = []
-        for row_idx in range(num_header_rows):
-            val = str(df.iloc[row_idx, col_idx]).strip()
+        for val in column.tolist():
+            val = str(val).strip()
             if val and val not in parts:
                 parts.append(val)
         merged.append(' - '.join(parts) if parts else f"col_{col_idx}")
@@ -60,55 +71,44 @@ def merge_header_rows(df: pd.DataFrame, num_header_rows: int) -> List[str]:
 
 
 def clean_text(text: str) -> str:
-    """NUL 문자 제거"""
+    """NUL 등 제어 문자 제거 (탭/줄바꿈/CR 유지)"""
     if not text:
         return ""
-    text = text.replace('\x00', '')
-    return ''.join(c for c in text if c >= ' ' or c in '\t\n\r')
+    return text.translate(_CONTROL_CHARS)
 
 
 def dataframe_to_markdown(df: pd.DataFrame) -> str:
-    """DataFrame을 마크다운 테이블로 변환"""
+    """DataFrame을 마크다운 테이블로 변환
+
+    빈 값/None/0은 빈 셀로 씁니다. iterrows로 변환하던 이전 구현은 None과 숫자가 섞인 object 열의
+    None을 'nan'으로 썼으므로 그런 DataFrame에서는 결과가 다릅니다. (Camelot의 table.df는 모든 셀이
+    문자열이라 실제 추출 결과는 같음)
+    """
     if df.empty:
         return ""
 
     num_header_rows = detect_header_rows(df)
     headers = merge_header_rows(df, num_header_rows)
-    data_df = df.iloc[num_header_rows:].reset_index(drop=True)
     headers = [clean_text(str(h).strip()) if h else f"col_{i}" for i, h in enumerate(headers)]
 
     lines = ["| " + " | ".join(headers) + " |"]
     lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
 
-    for _, row in data_df.iterrows():
-        cells = []
-        for val in row.tolist():
-            cell = clean_text(str(val).strip()) if val else ""
-            cell = cell.replace("|", "\\|").replace("\n", " ")
-            cells.append(cell)
-        lines.append("| " + " | ".join(cells) + " |")
-
-    return "\n".join(lines)
+    # 데이터 셀 전체를 1차원 object Series로 펼쳐 문자열 연산을 한 번에 적용
+    values = df.iloc[num_header_rows:].to_numpy()
+    if values.size:
+        flat = pd.Series(values.ravel().tolist(), dtype=object)
+        flat = flat.where(flat.to_numpy().astype(bool), "")  # 빈 값/None/0 -> ""
+        cells = flat.map(str).astype(object).str.strip().str.translate(_CELL_TRANSLATE)
 
+        for row in cells.to_numpy().reshape(values.shape).tolist():
+            lines.append("| " + " | ".join(row) + " |")
 
-def extract_tables_from_pdf(pdf_path: Path, pages: str = "all", flavor: str = "lattice") -> List[ExtractedTable]:
-    """PDF에서 테이블 추출"""
-    pdf_path = Path(pdf_path)
-    if not pdf_path.exists():
-        raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+    return "\n".join(lines)
 
-    try:
-        tables = camelot.read_pdf(str(pdf_path), pages=pages, flavor=flavor, copy_text=['v', 'h'])
-    except Exception as e:
-        print(f"Camelot 추출 실패: {e}")
-        if flavor == "lattice":
-            try:
-                tables = camelot.read_pdf(str(pdf_path), pages=pages, flavor="stream")
-            except:
-                return []
-        else:
-            return []
 
+def _to_extracted_tables(tables) -> List[ExtractedTable]:
+    """Camelot TableList를 ExtractedTable 리스트로 변환"""
     extracted = []
     for table in tables:
         df = table.df
@@ -127,12 +127,95 @@ def extract_tables_from_pdf(pdf_path: Path, pages: str = "all", flavor: str = "l
     return extracted
 
 
-def extract_tables_by_page(pdf_path: Path, page_numbers: List[int] = None) -> Dict[int, List[ExtractedTable]]:
-    """페이지별로 테이블 추출"""
-    pages = ",".join(map(str, page_numbers)) if page_numbers else "all"
-    tables = extract_tables_from_pdf(pdf_path, pages=pages)
+def _parse_pages(pdf_path: Path, pages: str) -> List[int]:
+    """Camelot 페이지 문자열("1,3,5-7", "all")을 페이지 번호 리스트로 변환"""
+    if pages == "all":
+        import pymupdf
+        with pymupdf.open(str(pdf_path)) as doc:
+            return list(range(1, len(doc) + 1))
+
+    page_numbers = []
+    for part in pages.split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = part.split('-')
+            page_numbers.extend(range(int(start), int(end) + 1))
+        elif part:
+            page_numbers.append(int(part))
+    return page_numbers
+
+
+def extract_tables_from_pdf(pdf_path: Path, pages: str = "all", flavor: str = "lattice") -> List[ExtractedTable]:
+    """PDF에서 테이블 추출
+
+    lattice 실패 시 페이지 단위로 다시 시도하고, 실패한 페이지만 stream 모드로 재추출합니다.
+    """
+    pdf_path = Path(pdf_path)
+    if not pdf_path.exists():
+        raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+
+    try:
+        tables = camelot.read_pdf(str(pdf_path), pages=pages, flavor=flavor, copy_text=['v', 'h'])
+        return _to_extracted_tables(tables)
+    except Exception as e:
+        print(f"Camelot 추출 실패 (pages={pages}): {e}")
+        if flavor != "lattice":
+            return []
+
+    try:
+        page_numbers = _parse_pages(pdf_path, pages)
+    except Exception:
+        return []
+
+    # 여러 페이지를 한 번에 읽다 실패한 경우: 페이지별 lattice 재시도
+    if len(page_numbers) > 1:
+        extracted = []
+        for page in page_numbers:
+            extracted.extend(extract_tables_from_pdf(pdf_path, pages=str(page), flavor=flavor))
+        return extracted
+
+    # 단일 페이지 lattice 실패: 해당 페이지만 stream 모드로 재추출
+    try:
+        tables = camelot.read_pdf(str(pdf_path), pages=pages, flavor="stream")
+        return _to_extracted_tables(tables)
+    except:
+        return []
+
+
+def _split_pages(page_numbers: List[int], num_groups: int) -> List[List[int]]:
+    """페이지 목록을 프로세스별 그룹으로 분할 (라운드 로빈)"""
+    groups = [page_numbers[i::num_groups] for i in range(num_groups)]
+    return [g for g in groups if g]
+
+
+def _extract_page_group(pdf_path: str, page_numbers: List[int]) -> List[ExtractedTable]:
+    """워커 프로세스: 페이지 그룹의 테이블 추출"""
+    return extract_tables_from_pdf(Path(pdf_path), pages=",".join(map(str, page_numbers)))
+
+
+def extract_tables_by_page(
+        pdf_path: Path,
+        page_numbers: List[int] = None,
+        max_workers: int = MAX_WORKERS
+        ) -> Dict[int, List[ExtractedTable]]:
+    """페이지별로 테이블 추출
+
+    page_numbers가 주어지면 해당 페이지만 추출하며, 여러 페이지는 프로세스로 나누어 병렬 처리합니다.
+    """
+    if page_numbers:
+        page_numbers = sorted(set(page_numbers))
+        groups = _split_pages(page_numbers, max(1, min(max_workers, len(page_numbers))))
+
+        if len(groups) > 1:
+            with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+                results = executor.map(_extract_page_group, [str(pdf_path)] * len(groups), groups)
+                tables = [t for group_tables in results for t in group_tables]
+        else:
+            tables = _extract_page_group(str(pdf_path), page_numbers)
+    else:
+        tables = extract_tables_from_pdf(pdf_path, pages="all")
 
     by_page = {}
-    for table in tables:
+    for table in sorted(tables, key=lambda t: t.page_number):
         by_page.setdefault(table.page_number, []).append(table)
     return by_page
@@ -1,14 +1,21 @@
 """텍스트/테이블 청킹 모듈"""
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterator, List, Optional
 from dataclasses import dataclass, field
+import tiktoken
 from .config import (
     MIN_CHUNK_SIZE, OPTIMAL_CHUNK_SIZE, MAX_CHUNK_SIZE,
-    CHUNK_OVERLAP, MAX_TABLE_SIZE, TABLE_CONTEXT_KEYWORDS
+    CHUNK_OVERLAP, MAX_TABLE_SIZE, TABLE_CONTEXT_KEYWORDS,
+    EMBEDDING_MODEL_NAME, TOKEN_COUNT_CACHE_SIZE, MERGE_SMALL_ELEMENTS,
+    SECTION_CATEGORY_KEYWORDS, SECTION_CATEGORY_DEFAULT, SECTION_HEADING_WEIGHT,
+    NUMERIC_TABLE_MIN_RATIO
 )
 
+_encoding = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Chunk:
     text: str
     chunk_index: int
@@ -16,14 +23,25 @@ class Chunk:
     element_type: str  # 'text', 'table', 'heading'
     table_context: Optional[str] = None
     metadata: dict = field(default_factory=dict)
-    embedding: list = None
+    embedding: object = None  # float32 numpy 벡터 (embedder에서 채움)
+    text_hash: Optional[str] = None  # 정규화 텍스트 SHA-256 (임베딩 재사용 키)
+    section_path: Optional[str] = None  # 헤딩 경로 ("1. 공급대상 > 신청자격")
+    section_category: str = SECTION_CATEGORY_DEFAULT  # SECTION_CATEGORY_KEYWORDS 키 또는 'other'
+    has_numeric_table: bool = False  # 숫자 셀 위주의 표 (면적/금액/호수 표)
+
+
+def _get_encoding() -> tiktoken.Encoding:
+    """임베딩 모델 토크나이저 싱글톤"""
+    global _encoding
+    if _encoding is None:
+        _encoding = tiktoken.encoding_for_model(EMBEDDING_MODEL_NAME)
+    return _encoding
 
 
+@lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
 def count_tokens(text: str) -> int:
-    """토큰 수 추정 (한글 기준)"""
-    words = len(text.split())
-    korean_chars = len(re.findall(r'[가-힣]', text))
-    return words + korean_chars // 2
+    """토큰 수 (임베딩 모델 토크나이저 기준, 같은 문자열은 캐시)"""
+    return len(_get_encoding().encode_ordinary(text))
 
 
 def split_text_into_chunks(text: str, chunk_size: int = OPTIMAL_CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
@@ -33,6 +51,7 @@ def split_text_into_chunks(text: str, chunk_size: int = OPTIMAL_CHUNK_SIZE, over
 
     paragraphs = re.split(r'\n\s*\n', text)
     chunks, current_chunk, current_size = [], [], 0
+    last_size = 0  # current_chunk[-1]의 토큰 수 (오버랩 판단용)
 
     for para in paragraphs:
         para = para.strip()
@@ -54,12 +73,13 @@ def split_text_into_chunks(text: str, chunk_size: int = OPTIMAL_CHUNK_SIZE, over
         else:
             if current_chunk:
                 chunks.append('\n\n'.join(current_chunk))
-            if overlap > 0 and current_chunk and count_tokens(current_chunk[-1]) <= overlap:
+            if overlap > 0 and current_chunk and last_size <= overlap:
                 current_chunk = [current_chunk[-1], para]
-                current_size = count_tokens(current_chunk[-1]) + para_size
+                current_size = last_size + para_size
             else:
                 current_chunk = [para]
                 current_size = para_size
+        last_size = para_size
 
     if current_chunk:
         chunks.append('\n\n'.join(current_chunk))
@@ -219,18 +239,112 @@ def _find_context_from_previous(elements: List, current_idx: int, lookback: int
     return None
 
 
-def create_chunks_from_elements(elements: List, document_id: str = None) -> List[Chunk]:
-    """ParsedElement 리스트에서 청크 생성"""
-    chunks = []
+def classify_section(section_path: Optional[str], text: str) -> str:
+    """헤딩 경로/본문 키워드로 섹션 카테고리 분류 (헤딩 키워드에 가중치, 해당 없으면 'other')"""
+    path = section_path or ''
+    best, best_score = SECTION_CATEGORY_DEFAULT, 0
+    for category, keywords in SECTION_CATEGORY_KEYWORDS.items():
+        score = sum(SECTION_HEADING_WEIGHT * path.count(kw) + text.count(kw) for kw in keywords)
+        if score > best_score:
+            best, best_score = category, score
+    return best
+
+
+_NUMERIC_CELL_RE = re.compile(r'^[\d,.\-~%㎡()]+$')
+
+
+def is_numeric_table(text: str, min_ratio: float = NUMERIC_TABLE_MIN_RATIO) -> bool:
+    """마크다운 표의 값이 있는 셀 중 숫자 셀 비율이 min_ratio 이상인지 (구분선 제외)"""
+    cells = [
+        c.strip() for line in text.split('\n') if line.strip().startswith('|')
+        for c in line.strip().strip('|').split('|')
+        if c.strip() and not re.match(r'^:?-{3,}:?$', c.strip())
+    ]
+    if not cells:
+        return False
+    numeric = sum(1 for c in cells if _NUMERIC_CELL_RE.match(c.replace(' ', '')))
+    return numeric / len(cells) >= min_ratio
+
+
+def _merge_small_texts(units: List[tuple], max_tokens: int = OPTIMAL_CHUNK_SIZE) -> Iterator[tuple]:
+    """인접한 작은 텍스트 단위를 max_tokens까지 병합
+
+    같은 헤딩 경로 아래에 있는 단위만 이어 붙입니다. (헤딩이 없는 문서 앞부분은 같은 페이지 단위)
+    병합 청크는 첫 단위의 헤딩 경로로 분류되므로 다른 섹션의 본문이 섞이지 않도록 합니다.
+
+    Args:
+        units: (텍스트, 페이지, 섹션 헤딩 경로) 리스트 (테이블 없이 연속된 텍스트 요소)
+
+    Yields:
+        (병합된 텍스트, 첫 페이지, 첫 단위의 헤딩 경로)
+    """
+    parts, page, heading, size = [], None, None, 0
+
+    for text, unit_page, unit_heading in units:
+        unit_size = count_tokens(text)
+        same_group = unit_heading == heading and (unit_heading is not None or unit_page == page)
+        # 구분자('\n\n')는 1토큰으로 계산
+        if parts and same_group and size + 1 + unit_size <= max_tokens:
+            parts.append(text)
+            size += 1 + unit_size
+            continue
+
+        if parts:
+            yield '\n\n'.join(parts), page, heading
+        parts, page, heading, size = [text], unit_page, unit_heading, unit_size
+
+    if parts:
+        yield '\n\n'.join(parts), page, heading
+
+
+def iter_chunks_from_elements(elements: List, document_id: str = None, merge_small: bool = MERGE_SMALL_ELEMENTS) -> Iterator[Chunk]:
+    """ParsedElement 리스트에서 청크를 하나씩 생성 (스트리밍)
+
+    전체 청크 리스트를 만들지 않으므로, 임베딩/DB 적재를 배치 단위로 이어 붙이면
+    최대 메모리가 배치 크기로 제한됩니다.
+
+    Args:
+        elements: ParsedElement 리스트
+        document_id: 문서 식별자
+        merge_small: 인접한 작은 텍스트 요소(같은 헤딩 경로)를 OPTIMAL_CHUNK_SIZE까지 병합 후 분할.
+                     테이블은 병합하지 않음 (헤딩/테이블을 만나면 대기 중인 텍스트를 먼저 청크로 내보냄)
+
+    각 청크에는 헤딩 경로(section_path), 섹션 카테고리(section_category), 수치 표 여부(has_numeric_table)를 기록합니다.
+    """
     chunk_index = 0
-    current_heading = None
+    current_heading = None   # 다음 텍스트 요소 앞에 붙일 헤딩
+    heading_stack = []       # (레벨, 헤딩) - 현재 섹션의 헤딩 경로
+    section_path = None      # 현재 섹션 헤딩 경로 (병합 그룹 판단/카테고리 분류용)
+    pending_texts = []       # 병합 대기 중인 (텍스트, 페이지, 섹션 헤딩 경로)
+
+    def flush_texts():
+        nonlocal chunk_index
+        merged = _merge_small_texts(pending_texts) if merge_small else iter(pending_texts)
+        for text, page, path in merged:
+            for tc in split_text_into_chunks(text):
+                if is_valid_chunk(tc):
+                    yield Chunk(
+                        tc, chunk_index, page, 'text', None, {'document_id': document_id},
+                        section_path=path, section_category=classify_section(path, tc)
+                    )
+                    chunk_index += 1
+        pending_texts.clear()
 
     for i, elem in enumerate(elements):
         if elem.element_type == 'heading':
+            # 섹션이 바뀌므로 대기 중인 텍스트를 이전 섹션 경로로 먼저 내보냄
+            yield from flush_texts()
+            level = elem.metadata.get('level', 1)
+            while heading_stack and heading_stack[-1][0] >= level:
+                heading_stack.pop()
+            heading_stack.append((level, elem.content))
             current_heading = elem.content
+            section_path = ' > '.join(h for _, h in heading_stack)
             continue
 
         elif elem.element_type == 'table':
+            yield from flush_texts()
+
             # 1. metadata에 있으면 사용
             context = elem.metadata.get('context_title')
 
@@ -245,22 +359,31 @@ def create_chunks_from_elements(elements: List, document_id: str = None) -> List
                 if found:
                     context = found
 
+            numeric = is_numeric_table(elem.content)
             for tc in chunk_table(elem.content, context):
                 if is_valid_chunk(tc, min_size=30):
                     # chunk_table에서 자동 생성된 ## 제목 추출
                     final_context = context
                     if not final_context and tc.startswith('## '):
                         final_context = tc.split('\n')[0][3:].strip()
-                    chunks.append(Chunk(tc, chunk_index, elem.page_number, 'table', final_context, {'document_id': document_id}, embedding=None))
+                    # 표 제목(컨텍스트)도 헤딩과 같은 가중치로 분류에 사용
+                    path = ' > '.join(p for p in (section_path, final_context) if p) or None
+                    yield Chunk(
+                        tc, chunk_index, elem.page_number, 'table', final_context, {'document_id': document_id},
+                        section_path=section_path, section_category=classify_section(path, tc),
+                        has_numeric_table=numeric
+                    )
                     chunk_index += 1
             current_heading = None
 
         elif elem.element_type == 'text':
             text = f"## {current_heading}\n\n{elem.content}" if current_heading else elem.content
             current_heading = None
-            for tc in split_text_into_chunks(text):
-                if is_valid_chunk(tc):
-                    chunks.append(Chunk(tc, chunk_index, elem.page_number, 'text', None, {'document_id': document_id}, embedding=None))
-                    chunk_index += 1
+            pending_texts.append((text, elem.page_number, section_path))
 
-    return chunks
+    yield from flush_texts()
+
+
+def create_chunks_from_elements(elements: List, document_id: str = None, merge_small: bool = MERGE_SMALL_ELEMENTS) -> List[Chunk]:
+    """ParsedElement 리스트에서 청크 생성"""
+    return list(iter_chunks_from_elements(elements, document_id, merge_small))
@@ -36,17 +36,43 @@ DB_CONFIG = {
 # API 키
 UPSTAGE_API_KEY = os.getenv('UPSTAGE_API_KEY')
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')  # OpenAI 호환 서버 (로컬 스텁 zf_django/openai_stub.py 등), 없으면 OpenAI API
+
+# PDF 파싱 엔진 ('llamaparse': LlamaParse 클라우드, 'pymupdf': PyMuPDF 로컬)
+PARSE_ENGINE = os.getenv('PARSE_ENGINE', 'llamaparse')
+
+# 파싱 결과 캐시 (PDF SHA-256 + 파서 버전 기준)
+PARSE_CACHE_DIR = Path(os.getenv('PARSE_CACHE_DIR', DATA_DIR / "parse_cache"))
+PARSE_CACHE_MAX_BYTES = int(os.getenv('PARSE_CACHE_MAX_BYTES', 2 * 1024 ** 3))  # 최대 용량 (기본 2GB)
+PARSE_CACHE_MAX_AGE_DAYS = float(os.getenv('PARSE_CACHE_MAX_AGE_DAYS', 90))    # 최대 보관 기간 (일)
 
 # 임베딩 설정
 EMBEDDING_MODEL_NAME = 'text-embedding-3-small'
 EMBEDDING_DIMENSION = 1536
 
+# 임베딩 배치 설정 (OpenAI 요청당 제한: 입력 2048건, 합계 300k 토큰)
+EMBED_BATCH_MAX_TOKENS = int(os.getenv('EMBED_BATCH_MAX_TOKENS', 100_000))  # 배치당 최대 추정 토큰
+EMBED_BATCH_MAX_ITEMS = int(os.getenv('EMBED_BATCH_MAX_ITEMS', 512))        # 배치당 최대 텍스트 수
+EMBED_MAX_CONCURRENCY = int(os.getenv('EMBED_MAX_CONCURRENCY', 4))          # 동시 요청 배치 수
+EMBED_TPM_LIMIT = int(os.getenv('EMBED_TPM_LIMIT', 1_000_000))              # 분당 토큰 예산 (계정 한도에 맞춤)
+EMBED_MAX_RETRIES = int(os.getenv('EMBED_MAX_RETRIES', 6))                  # 레이트 리밋 재시도 횟수
+EMBED_PROGRESS_DIR = Path(os.getenv('EMBED_PROGRESS_DIR', DATA_DIR / "embed_progress"))  # 완료 배치 저장 위치
+# 스트리밍 적재 시 임베딩/DB 적재 단위 (청크 수) - 한 단위는 동시 요청 수만큼의 배치로 나뉘어 요청됨
+EMBED_STREAM_BATCH_SIZE = int(os.getenv('EMBED_STREAM_BATCH_SIZE', 256))
+
 # 청킹 설정
 MIN_CHUNK_SIZE = 50       # 최소 청크 크기 (문자) - 이보다 짧으면 필터링
 OPTIMAL_CHUNK_SIZE = 600  # 최적 청크 크기 (토큰)
 MAX_CHUNK_SIZE = 1200     # 최대 청크 크기 (토큰)
 CHUNK_OVERLAP = 150       # 청크 오버랩 (토큰)
 MAX_TABLE_SIZE = 3000     # 테이블 최대 크기 (토큰)
+# 청크 크기(토큰)는 임베딩 모델 토크나이저(tiktoken) 기준으로 계산
+TOKEN_COUNT_CACHE_SIZE = 8192  # count_tokens 메모이즈 항목 수
+MERGE_SMALL_ELEMENTS = True  # 인접한 작은 텍스트 요소(같은 헤딩 경로)를 OPTIMAL_CHUNK_SIZE까지 병합
+
+# 공고 구조화 프로필 추출 (세대 적재 후 1회, annc_profile)
+PROFILE_LLM_MODEL = os.getenv('PROFILE_LLM_MODEL', 'gpt-4o-mini')
+PROFILE_MAX_CONTEXT_TOKENS = int(os.getenv('PROFILE_MAX_CONTEXT_TOKENS', 12_000))  # 추출에 넣을 청크 토큰 상한
 
 # 처리 설정
 BATCH_SIZE = 10
@@ -58,30 +84,46 @@ TABLE_CONTEXT_KEYWORDS = [
     '자격', '기준', '조건', '일정', '서류'
 ]
 
+# 청크 섹션 카테고리 (적재 시 헤딩 경로/본문 키워드로 분류, doc_chunks.section_category)
+# 챗봇 상세 질문은 질문 유형에 맞는 카테고리 청크만 검색 (답변 캐시 질문 유형과 같은 코드)
+SECTION_CATEGORY_KEYWORDS = {
+    'eligibility': ['신청자격', '입주자격', '자격요건', '공급대상', '입주대상', '무주택', '청약자격', '우선공급', '연령'],
+    'income_asset': ['소득기준', '자산기준', '소득', '자산', '자동차', '월평균소득', '총자산'],
+    'area': ['전용면적', '공급면적', '계약면적', '주거전용', '공급형별', '주택형', '㎡'],
+    'rent': ['임대보증금', '월임대료', '임대료', '보증금', '전환보증금', '임대조건'],
+    'schedule': ['신청기간', '접수기간', '일정', '당첨자 발표', '발표일', '계약체결', '입주예정', '청약접수'],
+    'documents': ['제출서류', '구비서류', '필요서류', '증명서', '서류'],
+}
+SECTION_CATEGORY_DEFAULT = 'other'
+SECTION_HEADING_WEIGHT = 3       # 헤딩 경로 키워드 1회 = 본문 키워드 3회
+NUMERIC_TABLE_MIN_RATIO = 0.3    # 숫자 셀 비율이 이 이상이면 수치 표 (has_numeric_table)
+
 # =============================================================================
 # 테이블 셀 텍스트 정규화 설정 (패턴 기반 - 확장 가능)
 # =============================================================================
 # 각 규칙: (패턴, 대체문자열, 설명, 반복횟수)
 # 반복횟수: 패턴을 몇 번 반복 적용할지 (0=무한반복하여 변화없을때까지)
+# 문자 사이 공백/줄바꿈 제거 규칙은 앞뒤 문자를 전후방 탐색((?<=...), (?=...))으로만 확인하여
+# 한 번의 치환으로 반복 적용(0)과 같은 결과가 나오도록 작성 (table_preprocessor에서 1회 컴파일)
 
 CELL_NORMALIZE_RULES = [
     # 1. 한글 문자 사이의 줄바꿈 제거 (공급\n형별 → 공급형별)
-    (r'([가-힣])\n([가-힣])', r'\1\2', '한글 사이 줄바꿈 제거', 0),
+    (r'(?<=[가-힣])\n(?=[가-힣])', '', '한글 사이 줄바꿈 제거', 1),
 
     # 2. 일반 줄바꿈을 공백으로 변환
     (r'[\r\n]+', ' ', '줄바꿈 공백 변환', 1),
 
     # 3. 한글 문자 사이의 단일 공백 제거 (양 주 옥 정 → 양주옥정)
-    (r'([가-힣])\s([가-힣])', r'\1\2', '한글 사이 공백 제거', 0),
+    (r'(?<=[가-힣])\s(?=[가-힣])', '', '한글 사이 공백 제거', 1),
 
     # 4. 한글과 숫자 사이 공백 제거 (옥정 3 → 옥정3)
-    (r'([가-힣])\s+(\d)', r'\1\2', '한글-숫자 사이 공백 제거', 0),
+    (r'(?<=[가-힣])\s+(?=\d)', '', '한글-숫자 사이 공백 제거', 1),
 
     # 5. 한글과 영문 사이 공백 제거 (송내 S → 송내S)
-    (r'([가-힣])\s+([A-Za-z])', r'\1\2', '한글-영문 사이 공백 제거', 0),
+    (r'(?<=[가-힣])\s+(?=[A-Za-z])', '', '한글-영문 사이 공백 제거', 1),
 
     # 6. 영문과 숫자 사이 공백 제거 (S 1 → S1)
-    (r'([A-Za-z])\s+(\d)', r'\1\2', '영문-숫자 사이 공백 제거', 0),
+    (r'(?<=[A-Za-z])\s+(?=\d)', '', '영문-숫자 사이 공백 제거', 1),
 
     # 7. 연속 공백 정리
     (r'\s{2,}', ' ', '연속 공백 정리', 1),
@@ -5,11 +5,13 @@
 # # .env 파일 로드 (database 모듈이 import될 때 자동으로 로드됨)
 # load_dotenv()
 
-from .db_handler import DataBaseHandler
+from .db_handler import DataBaseHandler, unit_of_work, close_pool
 from .initializing import Initializing
 
 # __all__ 리스트를 통해 외부에서 *로 임포트할 때 노출할 항목을 정의할 수 있습니다.
 __all__ = [
     "DataBaseHandler",
+    "unit_of_work",
+    "close_pool",
     "Initializing"
 ]
\ No newline at end of file
@@ -1,14 +1,122 @@
 import os
+import threading
+from contextlib import contextmanager
 import psycopg2
-from psycopg2 import extras, OperationalError
+from psycopg2 import extras, pool, OperationalError
 from pgvector.psycopg2 import register_vector
 from typing import Optional, List, Dict, Any
 
 # load_dotenv() 는 클래스 외부에서 실행되었다고 가정
 
+# 프로세스 공용 커넥션 풀 (첫 사용 시 생성)
+_pool: Optional[pool.ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+# pgvector 타입이 등록된 연결 (풀에서 재사용되므로 연결당 1회만 등록)
+_vector_registered = set()
+
+# 스레드별 unit of work 연결 (unit_of_work() 블록 안에서만 설정)
+_local = threading.local()
+
+
+def get_pool() -> pool.ThreadedConnectionPool:
+    """프로세스 공용 ThreadedConnectionPool 반환 (DB_POOL_MIN / DB_POOL_MAX 환경 변수)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                try:
+                    _pool = pool.ThreadedConnectionPool(
+                        int(os.getenv("DB_POOL_MIN", "1")),
+                        int(os.getenv("DB_POOL_MAX", "10")),
+                        host=os.getenv("DB_HOST"),
+                        port=os.getenv("DB_PORT", "5432"),
+                        database=os.getenv("DB_NAME"),
+                        user=os.getenv("DB_USER"),
+                        password=os.getenv("DB_PASSWORD"),
+                    )
+                except psycopg2.Error as e:
+                    print(f"DB 연결 실패: {e}")
+                    raise OperationalError(f"데이터베이스 연결 오류: {e}")
+    return _pool
+
+
+def close_pool():
+    """커넥션 풀의 모든 연결 종료 (노트북 재실행/프로세스 종료 시)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+            _vector_registered.clear()
+
+
+def _acquire_connection():
+    """풀에서 연결을 꺼내고 pgvector를 등록 (끊어진 연결은 버리고 다시 꺼냄)"""
+    conn_pool = get_pool()
+    try:
+        conn = conn_pool.getconn()
+        if conn.closed:
+            _vector_registered.discard(id(conn))  # 같은 id로 새 연결이 생기면 등록 누락 방지
+            conn_pool.putconn(conn, close=True)
+            conn = conn_pool.getconn()
+
+        if id(conn) not in _vector_registered:
+            register_vector(conn)
+            conn.commit()
+            _vector_registered.add(id(conn))
+        return conn
+
+    except psycopg2.Error as e:
+        print(f"DB 연결 실패: {e}")
+        raise OperationalError(f"데이터베이스 연결 오류: {e}")
+
+
+def _release_connection(conn):
+    """연결을 풀에 반환 (닫힌 연결은 풀에서 제거)"""
+    if conn.closed:
+        _vector_registered.discard(id(conn))
+    get_pool().putconn(conn, close=bool(conn.closed))
+
+
+@contextmanager
+def unit_of_work():
+    """
+    여러 Repository 호출을 하나의 연결/트랜잭션으로 묶는 Context Manager.
+
+    블록 안의 `with repo as db` 는 같은 연결을 공유하며 개별 커밋하지 않고,
+    블록이 정상 종료되면 한 번에 커밋, 예외가 발생하면 전체 롤백합니다.
+    중첩 호출 시 바깥 unit of work에 합류합니다.
+
+    사용 예:
+        with unit_of_work():
+            all_repo.merge_announcements([...])
+            file_repo.bulk_insert_files([...])
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        yield conn
+        return
+
+    conn = _acquire_connection()
+    _local.conn = conn
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        _local.conn = None
+        _release_connection(conn)
+
 class DataBaseHandler():
     """
     PostgreSQL 데이터베이스 연결을 관리하고 쿼리 실행을 위한 Context Manager를 제공
+
+    연결은 프로세스 공용 커넥션 풀에서 빌려오며, unit_of_work() 블록 안에서는
+    해당 블록의 연결/트랜잭션을 공유합니다.
     """
 
     def __init__(self):
@@ -19,6 +127,7 @@ class DataBaseHandler():
         self.db_password = os.getenv("DB_PASSWORD")
         self.db_name = os.getenv("DB_NAME")
         self.conn = None
+        self._owns_conn = False
 
     def __enter__(self):
         """Context Manager 시작 시 연결 설정"""
@@ -27,39 +136,41 @@ class DataBaseHandler():
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context Manager 종료 시 자원 정리 및 트랜잭션 처리"""
-        if self.conn:
-            if exc_type is None:
-                # 예외가 없으면 커밋
-                self.conn.commit()
-            else:
-                # 예외가 발생하면 롤백
-                self.conn.rollback()
-                # 예외를 다시 발생시켜 상위 호출자에게 알림
-                raise exc_val
-            
-            self.conn.close()
+        if self.conn and not self._owns_conn:
+            # unit of work 연결: 커밋/롤백은 unit_of_work()가 처리
             self.conn = None
+            return
+
+        if self.conn:
+            try:
+                if exc_type is None:
+                    # 예외가 없으면 커밋
+                    self.conn.commit()
+                else:
+                    # 예외가 발생하면 롤백
+                    if not self.conn.closed:
+                        self.conn.rollback()
+                    # 예외를 다시 발생시켜 상위 호출자에게 알림
+                    raise exc_val
+            finally:
+                # 연결은 닫지 않고 풀에 반환
+                _release_connection(self.conn)
+                self.conn = None
+                self._owns_conn = False
         
     def make_connection(self):
-        """DB 연결을 생성하고 pgvector를 등록"""
+        """풀에서 DB 연결을 가져옴 (unit of work 진행 중이면 해당 연결 공유)"""
         if self.conn and not self.conn.closed:
             return self.conn
 
-        try:
-            self.conn = psycopg2.connect(
-                host=self.db_host,
-                port=self.db_port,
-                database=self.db_name,
-                user=self.db_user,
-                password=self.db_password,
-            )
-            # pgvector를 등록
-            register_vector(self.conn)
-            
-        except psycopg2.Error as e:
-            # 연결 실패 시 명확하게 오류 발생
-            print(f"DB 연결 실패: {e}")
-            raise OperationalError(f"데이터베이스 연결 오류: {e}")
+        shared = getattr(_local, "conn", None)
+        if shared is not None:
+            self.conn = shared
+            self._owns_conn = False
+        else:
+            self.conn = _acquire_connection()
+            self._owns_conn = True
+        return self.conn
 
     def execute_query(self, query: str, params: Optional[tuple] = None, fetch_one: bool = False) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,116 @@
+# database/pg_binary_copy.py
+
+"""
+PostgreSQL COPY ... FROM STDIN (FORMAT binary) 스트림 인코더
+
+텍스트 리터럴/SQL 파서를 거치지 않고 각 값을 PostgreSQL 바이너리 전송 포맷으로 직접 인코딩합니다.
+- int2/int4/int8: 빅엔디언 정수
+- bool: 1바이트 (0/1)
+- text/varchar: UTF-8 바이트
+- jsonb: 버전 바이트(1) + JSON 텍스트
+- vector(pgvector): int16 차원 + int16 예약(0) + float4[차원] (빅엔디언)
+"""
+import io
+import json
+import struct
+from typing import Any, Callable, Iterable, List, Sequence
+
+import numpy as np
+
+COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+COPY_HEADER = COPY_SIGNATURE + struct.pack(">ii", 0, 0)  # flags, header extension length
+COPY_TRAILER = struct.pack(">h", -1)
+NULL_FIELD = struct.pack(">i", -1)
+
+_INT2 = struct.Struct(">h")
+_INT4 = struct.Struct(">i")
+_INT8 = struct.Struct(">q")
+_VECTOR_HEAD = struct.Struct(">hh")
+
+
+def encode_int2(value: Any) -> bytes:
+    return _INT2.pack(int(value))
+
+
+def encode_int4(value: Any) -> bytes:
+    return _INT4.pack(int(value))
+
+
+def encode_int8(value: Any) -> bytes:
+    return _INT8.pack(int(value))
+
+
+def encode_bool(value: Any) -> bytes:
+    return b"\x01" if value else b"\x00"
+
+
+def encode_text(value: Any) -> bytes:
+    return str(value).encode("utf-8")
+
+
+def encode_jsonb(value: Any) -> bytes:
+    # 이미 직렬화된 JSON 문자열(bulk_insert_chunks 입력 형식)도 그대로 허용
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    return b"\x01" + text.encode("utf-8")
+
+
+def encode_vector(value: Any) -> bytes:
+    vec = np.asarray(value, dtype=">f4")
+    return _VECTOR_HEAD.pack(vec.shape[0], 0) + vec.tobytes()
+
+
+# 컬럼 타입명 -> 인코더
+ENCODERS = {
+    "int2": encode_int2,
+    "int4": encode_int4,
+    "int8": encode_int8,
+    "bool": encode_bool,
+    "text": encode_text,
+    "jsonb": encode_jsonb,
+    "vector": encode_vector,
+}
+
+
+def encode_row(values: Sequence[Any], encoders: Sequence[Callable[[Any], bytes]]) -> bytes:
+    """튜플 1건 -> 바이너리 COPY 레코드"""
+    parts = [_INT2.pack(len(values))]
+    for value, encode in zip(values, encoders):
+        if value is None:
+            parts.append(NULL_FIELD)
+        else:
+            data = encode(value)
+            parts.append(_INT4.pack(len(data)))
+            parts.append(data)
+    return b"".join(parts)
+
+
+class BinaryCopyStream(io.RawIOBase):
+    """
+    행 이터레이터를 바이너리 COPY 스트림으로 변환하는 읽기 전용 파일 객체.
+    cursor.copy_expert()가 필요한 만큼만 읽어가므로 전체 데이터를 메모리에 만들지 않습니다.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]], column_types: List[str]):
+        self._encoders = [ENCODERS[t] for t in column_types]
+        self._chunks = self._generate(rows)
+        self._buffer = b""
+
+    def _generate(self, rows):
+        yield COPY_HEADER
+        for row in rows:
+            yield encode_row(row, self._encoders)
+        yield COPY_TRAILER
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buf) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(buf), len(self._buffer))
+        buf[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
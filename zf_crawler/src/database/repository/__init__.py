@@ -6,6 +6,9 @@ from .annc_all_repo import AnncAllRepository
 from .annc_query_repo import AnncQrRepository
 from .annc_file_repo import AnncFileRepository
 from .doc_chunk_repo import DocChunkRepository
+from .annc_profile_repo import AnncProfileRepository
+from .annc_unit_repo import AnncUnitRepository
+from .annc_eligibility_repo import AnncEligibilityRepository
 # from .annc_query_repo import Annc
 
 __all__ = [
@@ -13,6 +16,9 @@ __all__ = [
     "AnncAllRepository",
     "AnncQrRepository",
     "AnncFileRepository",
-    "DocChunkRepository"
+    "DocChunkRepository",
+    "AnncProfileRepository",
+    "AnncUnitRepository",
+    "AnncEligibilityRepository"
     # 다른 Repository 클래스들도 여기에 추가됩니다 (예: "UserRepository")
 ]
\ No newline at end of file
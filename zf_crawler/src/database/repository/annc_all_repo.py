@@ -24,9 +24,11 @@ class AnncAllRepository(DataBaseHandler):
         'annc_pblsh_dt',
         'annc_deadline_dt',
         'annc_status',
-        'service_status'
+        'service_status',
+        'active_generation'
     ]
 
+    # active_generation은 activate_generation으로만 변경 (MERGE 대상 아님)
     COLUMNS_FOR_MERGE = [
         'annc_title',
         'annc_url',
@@ -101,8 +103,94 @@ class AnncAllRepository(DataBaseHandler):
             print(f"Merge(UPSERT) 실패: {e}")
             raise
 
+    def register_announcements(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        신규 공고만 삽입하고, 이미 있는 공고(ANNC_URL 기준)는 변경하지 않은 채
+        ANNC_ID와 ANNC_URL을 반환합니다. (재적재 중에도 기존 공고/청크가 그대로 서비스되도록)
+        """
+        if not records:
+            return []
+
+        insert_cols_str = ', '.join(self.COLUMNS_FOR_MERGE)
+        values_template = f"({', '.join(['%s'] * len(self.COLUMNS_FOR_MERGE))})"
+        data_to_insert = [
+            tuple(rec.get(col, None) for col in self.COLUMNS_FOR_MERGE)
+            for rec in records
+        ]
+
+        try:
+            with self as db:
+                with db.conn.cursor(cursor_factory=extras.DictCursor) as cur:
+                    extras.execute_values(
+                        cur,
+                        f"""
+                            INSERT INTO {self.TABLE_NAME} ({insert_cols_str})
+                            VALUES %s
+                            ON CONFLICT (annc_url) DO NOTHING
+                        """,
+                        data_to_insert,
+                        template=values_template,
+                    )
+                    cur.execute(
+                        f"SELECT annc_id, annc_url FROM {self.TABLE_NAME} WHERE annc_url = ANY(%s)",
+                        ([rec.get('annc_url') for rec in records],)
+                    )
+                    return [dict(row) for row in cur.fetchall()]
+
+        except Exception as e:
+            print(f"공고 등록 실패: {e}")
+            raise
+
+    # --------------------------------------------------------------------------
+    ## 2. 청크 세대 (Generation)
+    # --------------------------------------------------------------------------
+    def next_generation(self, annc_id: int) -> int:
+        """
+        공고의 새 적재 세대 번호를 반환합니다.
+        활성 세대와 남아 있는 파일 세대(실패한 적재 포함) 중 최댓값 + 1이므로 기존 행과 겹치지 않습니다.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    SELECT GREATEST(
+                        COALESCE(a.active_generation, 0),
+                        COALESCE((SELECT MAX(f.generation) FROM annc_files f WHERE f.annc_id = a.annc_id), 0)
+                    ) + 1
+                    FROM {self.TABLE_NAME} a
+                    WHERE a.annc_id = %s
+                """
+                with db.conn.cursor() as cur:
+                    cur.execute(query, (annc_id,))
+                    return cur.fetchone()[0]
+        except Exception as e:
+            print(f"공고 세대 조회 실패: {e}")
+            raise
+
+    def activate_generation(self, annc_id: int, generation: int) -> int:
+        """
+        적재가 끝난 세대를 UPDATE 한 번으로 활성화하고 공고를 OPEN 처리합니다.
+        커밋 시점에 검색 대상 청크가 이전 세대에서 새 세대로 한 번에 바뀝니다.
+
+        :return: 갱신된 행의 개수.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    UPDATE {self.TABLE_NAME}
+                    SET active_generation = %s,
+                        service_status = 'OPEN',
+                        updated_at = now()
+                    WHERE annc_id = %s
+                """
+                with db.conn.cursor() as cur:
+                    cur.execute(query, (generation, annc_id))
+                    return cur.rowcount
+        except Exception as e:
+            print(f"공고 세대 활성화 실패: {e}")
+            raise
+
     # --------------------------------------------------------------------------
-    ## 2. SELECT (조회)
+    ## 3. SELECT (조회)
     # --------------------------------------------------------------------------
     def get_announcements_by_type_and_status(
             self, 
@@ -146,7 +234,7 @@ class AnncAllRepository(DataBaseHandler):
 
 
     # --------------------------------------------------------------------------
-    ## 3. DELETE (삭제)
+    ## 4. DELETE (삭제)
     # --------------------------------------------------------------------------
     def delete_announcement_by_url(self, annc_url: str) -> int:
         """
@@ -0,0 +1,78 @@
+# database/repository/annc_eligibility_repository.py
+
+from src.database.db_handler import DataBaseHandler
+from psycopg2 import extras
+from typing import List, Dict, Any, Optional
+
+class AnncEligibilityRepository(DataBaseHandler):
+
+    TABLE_NAME = "annc_eligibility"
+
+    # RULE_ID (IDENTITY)를 제외한 모든 컬럼
+    COLUMNS = [
+        "annc_id", "generation", "group_name", "min_age", "max_age",
+        "marital_status", "max_income_pct", "min_children"
+    ]
+
+    def __init__(self):
+        super().__init__()
+
+    # --------------------------------------------------------------------------
+    ## INSERT (자격 기준 교체)
+    # --------------------------------------------------------------------------
+    def replace_rules(self, annc_id: int, generation: int, rules: List[Dict[str, Any]]) -> int:
+        """
+        공고 세대의 공급대상별 자격 기준을 교체합니다. (같은 세대를 다시 추출하면 덮어씀)
+
+        :param rules: profile_extractor.normalize_eligibility_rules 결과 리스트.
+        :return: 삽입된 행의 개수.
+        """
+        data_to_insert = [
+            tuple([annc_id, generation] + [rule.get(col) for col in self.COLUMNS[2:]])
+            for rule in rules
+        ]
+
+        try:
+            with self as db:
+                with db.conn.cursor() as cur:
+                    cur.execute(
+                        f"DELETE FROM {self.TABLE_NAME} WHERE annc_id = %s AND generation = %s",
+                        (annc_id, generation)
+                    )
+                    if data_to_insert:
+                        extras.execute_values(
+                            cur,
+                            f"INSERT INTO {self.TABLE_NAME} ({', '.join(self.COLUMNS)}) VALUES %s",
+                            data_to_insert
+                        )
+                    return len(data_to_insert)
+        except Exception as e:
+            print(f"ANNC_ELIGIBILITY 저장 실패: {e}")
+            raise
+
+    # --------------------------------------------------------------------------
+    ## DELETE (삭제)
+    # --------------------------------------------------------------------------
+    def delete_inactive_generations(self, annc_ids: Optional[List[int]] = None) -> int:
+        """
+        활성 세대보다 이전 세대의 자격 기준을 일괄 삭제합니다. (세대 교체 후 GC)
+
+        :param annc_ids: 대상 공고 ID 리스트. (None이면 전체 공고)
+        :return: 삭제된 행의 개수.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    DELETE FROM {self.TABLE_NAME} e
+                    USING annc_all a
+                    WHERE e.annc_id = a.annc_id
+                      AND e.generation < a.active_generation
+                      AND (%s::bigint[] IS NULL OR e.annc_id = ANY(%s::bigint[]))
+                """
+                params = (annc_ids, annc_ids)
+                with db.conn.cursor() as cur:
+                    cur.execute(query, params)
+                    return cur.rowcount
+        except Exception as e:
+            print(f"ANNC_ELIGIBILITY 이전 세대 삭제 실패: {e}")
+            raise
@@ -11,7 +11,7 @@ class AnncFileRepository(DataBaseHandler):
     # FILE_ID는 BIGSERIAL이므로 제외
     COLUMNS = [
         "annc_id", "file_name", "file_type", "file_path", 
-        "file_ext", "file_size"
+        "file_ext", "file_size", "generation"
     ]
 
     def __init__(self):
@@ -23,12 +23,14 @@ class AnncFileRepository(DataBaseHandler):
     def bulk_insert_files(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         공고 파일 레코드를 대량 삽입합니다.
-        :param records: 삽입할 파일 데이터 리스트 (annc_id 포함).
+        :param records: 삽입할 파일 데이터 리스트 (annc_id, 적재 중인 세대 generation 포함).
         :return: 삽입된 파일의 file_id와 file_name 리스트.
         """
+        if not records:
+            return []
+
         insert_cols_str = ', '.join(self.COLUMNS)
-        placeholders = ', '.join(['%s'] * len(self.COLUMNS))
-        query = f"INSERT INTO {self.TABLE_NAME} ({insert_cols_str}) VALUES ({placeholders}) RETURNING file_id, file_name"
+        values_template = f"({', '.join(['%s'] * len(self.COLUMNS))})"
         
         data_to_insert = [
             tuple(rec.get(col, None) for col in self.COLUMNS)
@@ -38,12 +40,20 @@ class AnncFileRepository(DataBaseHandler):
         try:
             with self as db:
                 with db.conn.cursor() as cur:
-                    results = []
-                    for data in data_to_insert:
-                        cur.execute(query, data)
-                        row = cur.fetchone()
-                        results.append({'file_id': row[0], 'file_name': row[1]})
-                    return results
+                    # 한 번의 INSERT ... VALUES로 전체 삽입 (fetch=True: 모든 페이지의 RETURNING 결과 수집)
+                    rows = extras.execute_values(
+                        cur,
+                        f"""
+                            INSERT INTO {self.TABLE_NAME} ({insert_cols_str}) 
+                            VALUES %s
+                            RETURNING file_id, file_name
+                        """,
+                        data_to_insert,
+                        template=values_template,
+                        page_size=max(len(data_to_insert), 100),
+                        fetch=True
+                    )
+                    return [{'file_id': row[0], 'file_name': row[1]} for row in rows]
         except Exception as e:
             print(f"ANNC_FILES 삽입 실패: {e}")
             raise
@@ -53,7 +63,7 @@ class AnncFileRepository(DataBaseHandler):
     # --------------------------------------------------------------------------
     def get_files_with_announcement_info(self, annc_id: int) -> List[Dict[str, Any]]:
         """
-        특정 공고 ID에 연결된 파일 목록과 공고 제목(URL)을 조인하여 조회합니다.
+        특정 공고 ID에 연결된 (활성 세대) 파일 목록과 공고 제목(URL)을 조인하여 조회합니다.
         """
         try:
             with self as db:
@@ -61,7 +71,7 @@ class AnncFileRepository(DataBaseHandler):
                     SELECT 
                         f.*, a.annc_url, a.corp_cd 
                     FROM {self.TABLE_NAME} f
-                    JOIN annc_all a ON f.annc_id = a.annc_id
+                    JOIN annc_all a ON f.annc_id = a.annc_id AND f.generation = a.active_generation
                     WHERE f.annc_id = %s
                 """
                 return db.execute_query(query, (annc_id,), fetch_one=False)
@@ -82,4 +92,29 @@ class AnncFileRepository(DataBaseHandler):
                     return cur.rowcount
         except Exception as e:
             print(f"ANNC_FILES 삭제 실패: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def delete_inactive_generations(self, annc_ids: Optional[List[int]] = None) -> int:
+        """
+        활성 세대보다 이전 세대의 파일 레코드를 일괄 삭제합니다.
+        (FK 때문에 DocChunkRepository.delete_inactive_generations 이후에 호출)
+
+        :param annc_ids: 대상 공고 ID 리스트. (None이면 전체 공고)
+        :return: 삭제된 행의 개수.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    DELETE FROM {self.TABLE_NAME} f
+                    USING annc_all a
+                    WHERE f.annc_id = a.annc_id
+                      AND f.generation < a.active_generation
+                      AND (%s::bigint[] IS NULL OR f.annc_id = ANY(%s::bigint[]))
+                """
+                params = (annc_ids, annc_ids)
+                with db.conn.cursor() as cur:
+                    cur.execute(query, params)
+                    return cur.rowcount
+        except Exception as e:
+            print(f"ANNC_FILES 이전 세대 삭제 실패: {e}")
+            raise
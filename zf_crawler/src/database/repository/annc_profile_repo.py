@@ -0,0 +1,103 @@
+# database/repository/annc_profile_repository.py
+
+from src.database.db_handler import DataBaseHandler
+from psycopg2 import extras
+from typing import List, Dict, Any, Optional
+
+class AnncProfileRepository(DataBaseHandler):
+
+    TABLE_NAME = "annc_profile"
+
+    # 프로필 항목 컬럼 (JSONB: {summary, detail, pages})
+    FIELD_COLUMNS = ["eligibility", "rent", "area", "schedule", "documents"]
+
+    def __init__(self):
+        super().__init__()
+
+    # --------------------------------------------------------------------------
+    ## UPSERT (프로필 저장)
+    # --------------------------------------------------------------------------
+    def upsert_profile(self, annc_id: int, generation: int, profile: Dict[str, Any], model_name: str) -> int:
+        """
+        공고 세대의 구조화 프로필을 저장합니다. (같은 세대를 다시 추출하면 덮어씀)
+
+        :param profile: {항목: {summary, detail, pages} | None} 딕셔너리.
+        :return: 저장된 PROFILE_ID.
+        """
+        cols = ["annc_id", "generation"] + self.FIELD_COLUMNS + ["model_name"]
+        values = (
+            [annc_id, generation]
+            + [extras.Json(profile.get(col)) if profile.get(col) is not None else None for col in self.FIELD_COLUMNS]
+            + [model_name]
+        )
+        update_set_clauses = ', '.join(f"{col} = EXCLUDED.{col}" for col in self.FIELD_COLUMNS + ["model_name"])
+
+        try:
+            with self as db:
+                query = f"""
+                    INSERT INTO {self.TABLE_NAME} ({', '.join(cols)}, created_at)
+                    VALUES ({', '.join(['%s'] * len(cols))}, now())
+                    ON CONFLICT (annc_id, generation) DO UPDATE
+                    SET {update_set_clauses}, created_at = now()
+                    RETURNING profile_id
+                """
+                with db.conn.cursor() as cur:
+                    cur.execute(query, values)
+                    return cur.fetchone()[0]
+        except Exception as e:
+            print(f"ANNC_PROFILE 저장 실패: {e}")
+            raise
+
+    # --------------------------------------------------------------------------
+    ## SELECT (조회)
+    # --------------------------------------------------------------------------
+    def get_announcements_without_profile(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        활성 세대 프로필이 없는 공고를 조회합니다. (기존 공고 프로필 백필용)
+
+        :return: {annc_id, active_generation} 딕셔너리 리스트.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    SELECT a.annc_id, a.active_generation
+                    FROM annc_all a
+                    WHERE a.active_generation IS NOT NULL
+                      AND NOT EXISTS (
+                          SELECT 1 FROM {self.TABLE_NAME} p
+                          WHERE p.annc_id = a.annc_id AND p.generation = a.active_generation
+                      )
+                    ORDER BY a.annc_id DESC
+                    LIMIT %s
+                """
+                return db.execute_query(query, (limit,), fetch_one=False)
+        except Exception as e:
+            print(f"ANNC_PROFILE 대상 공고 조회 실패: {e}")
+            raise
+
+    # --------------------------------------------------------------------------
+    ## DELETE (삭제)
+    # --------------------------------------------------------------------------
+    def delete_inactive_generations(self, annc_ids: Optional[List[int]] = None) -> int:
+        """
+        활성 세대보다 이전 세대의 프로필을 일괄 삭제합니다. (세대 교체 후 GC)
+
+        :param annc_ids: 대상 공고 ID 리스트. (None이면 전체 공고)
+        :return: 삭제된 행의 개수.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    DELETE FROM {self.TABLE_NAME} p
+                    USING annc_all a
+                    WHERE p.annc_id = a.annc_id
+                      AND p.generation < a.active_generation
+                      AND (%s::bigint[] IS NULL OR p.annc_id = ANY(%s::bigint[]))
+                """
+                params = (annc_ids, annc_ids)
+                with db.conn.cursor() as cur:
+                    cur.execute(query, params)
+                    return cur.rowcount
+        except Exception as e:
+            print(f"ANNC_PROFILE 이전 세대 삭제 실패: {e}")
+            raise
@@ -13,6 +13,8 @@ class AnncQrRepository(DataBaseHandler):
     TABLE_NAME_LH_TEMP = "annc_lh_temp"
     TABLE_NAME_ANNC_ALL = "annc_all"
     TABLE_NAME_DOC_CHUNKS = "doc_chunks"
+    # 공고의 활성 세대 청크만 검색 (재적재 중인 새 세대/교체된 이전 세대 제외)
+    ACTIVE_GENERATION_JOIN = "JOIN annc_all a ON a.annc_id = dc.annc_id AND dc.generation = a.active_generation"
     COLUMNS_ANNC_ALL = [
         'annc_id','annc_title','annc_url',
         'corp_cd',
@@ -127,9 +129,10 @@ class AnncQrRepository(DataBaseHandler):
             # 2단계: FTS 검색 (doc_chunks 기준)
             fts_query = ' | '.join(words + [''.join(words)])
             sql_fts = f"""
-                SELECT chunk_id, ts_rank(fts_vector, to_tsquery('simple', %s)) AS score
-                FROM {self.TABLE_NAME_DOC_CHUNKS}
-                WHERE fts_vector @@ to_tsquery('simple', %s)
+                SELECT dc.chunk_id, ts_rank(dc.fts_vector, to_tsquery('simple', %s)) AS score
+                FROM {self.TABLE_NAME_DOC_CHUNKS} dc
+                {self.ACTIVE_GENERATION_JOIN}
+                WHERE dc.fts_vector @@ to_tsquery('simple', %s)
                 ORDER BY score DESC
                 LIMIT 100;
             """
@@ -138,9 +141,10 @@ class AnncQrRepository(DataBaseHandler):
 
             # 3단계: 벡터 검색
             sql_vec = f"""
-                SELECT chunk_id
-                FROM {self.TABLE_NAME_DOC_CHUNKS}
-                ORDER BY embedding <=> %s::vector
+                SELECT dc.chunk_id
+                FROM {self.TABLE_NAME_DOC_CHUNKS} dc
+                {self.ACTIVE_GENERATION_JOIN}
+                ORDER BY dc.embedding <=> %s::vector
                 LIMIT 100;
             """
             vec_rows = db.execute_query(sql_vec, (query_embedding,), fetch_one=False)
@@ -162,12 +166,13 @@ class AnncQrRepository(DataBaseHandler):
             if matched_ann_ids:
                 keyword_like = [f"%{w}%" for w in clean_words]
                 if keyword_like:
-                    like_conditions = ' OR '.join(['chunk_text LIKE %s' for _ in keyword_like])
+                    like_conditions = ' OR '.join(['dc.chunk_text LIKE %s' for _ in keyword_like])
                     sql_kw_table = f"""
-                        SELECT chunk_id
-                        FROM {self.TABLE_NAME_DOC_CHUNKS}
-                        WHERE annc_id = ANY(%s)
-                        AND chunk_type = 'table'
+                        SELECT dc.chunk_id
+                        FROM {self.TABLE_NAME_DOC_CHUNKS} dc
+                        {self.ACTIVE_GENERATION_JOIN}
+                        WHERE dc.annc_id = ANY(%s)
+                        AND dc.chunk_type = 'table'
                         AND ({like_conditions})
                         LIMIT 15;
                     """
@@ -179,11 +184,12 @@ class AnncQrRepository(DataBaseHandler):
 
                 # 벡터 유사도 기반 테이블 보완
                 sql_vec_table = f"""
-                    SELECT chunk_id
-                    FROM {self.TABLE_NAME_DOC_CHUNKS}
-                    WHERE annc_id = ANY(%s)
-                    AND chunk_type = 'table'
-                    ORDER BY embedding <=> %s::vector
+                    SELECT dc.chunk_id
+                    FROM {self.TABLE_NAME_DOC_CHUNKS} dc
+                    {self.ACTIVE_GENERATION_JOIN}
+                    WHERE dc.annc_id = ANY(%s)
+                    AND dc.chunk_type = 'table'
+                    ORDER BY dc.embedding <=> %s::vector
                     LIMIT 10;
                 """
                 vec_table_rows = db.execute_query(sql_vec_table, (matched_ann_ids, query_embedding), fetch_one=False)
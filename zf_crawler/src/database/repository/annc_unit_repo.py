@@ -0,0 +1,76 @@
+# database/repository/annc_unit_repository.py
+
+from src.database.db_handler import DataBaseHandler
+from psycopg2 import extras
+from typing import List, Dict, Any, Optional
+
+class AnncUnitRepository(DataBaseHandler):
+
+    TABLE_NAME = "annc_unit"
+
+    # UNIT_ID (IDENTITY)를 제외한 모든 컬럼
+    COLUMNS = [
+        "annc_id", "file_id", "generation", "complex_name", "unit_type",
+        "exclusive_area", "supply_area", "deposit", "monthly_rent", "supply_count", "page_num"
+    ]
+
+    def __init__(self):
+        super().__init__()
+
+    # --------------------------------------------------------------------------
+    ## INSERT (공급 단위 삽입)
+    # --------------------------------------------------------------------------
+    def bulk_insert_units(self, records: List[Dict[str, Any]]) -> int:
+        """
+        공고 파일의 공급 단위(단지/주택형별 면적·임대조건) 행을 대량 삽입합니다.
+
+        :param records: unit_table_extractor.extract_units 결과에 annc_id, file_id, generation을 채운 리스트.
+        :return: 삽입된 행의 개수.
+        """
+        if not records:
+            return 0
+
+        data_to_insert = [
+            tuple(rec.get(col, None) for col in self.COLUMNS)
+            for rec in records
+        ]
+
+        try:
+            with self as db:
+                with db.conn.cursor() as cur:
+                    extras.execute_values(
+                        cur,
+                        f"INSERT INTO {self.TABLE_NAME} ({', '.join(self.COLUMNS)}) VALUES %s",
+                        data_to_insert
+                    )
+                    return len(data_to_insert)
+        except Exception as e:
+            print(f"ANNC_UNIT 삽입 실패: {e}")
+            raise
+
+    # --------------------------------------------------------------------------
+    ## DELETE (삭제)
+    # --------------------------------------------------------------------------
+    def delete_inactive_generations(self, annc_ids: Optional[List[int]] = None) -> int:
+        """
+        활성 세대보다 이전 세대의 공급 단위를 일괄 삭제합니다. (세대 교체 후 GC)
+
+        :param annc_ids: 대상 공고 ID 리스트. (None이면 전체 공고)
+        :return: 삭제된 행의 개수.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    DELETE FROM {self.TABLE_NAME} u
+                    USING annc_all a
+                    WHERE u.annc_id = a.annc_id
+                      AND u.generation < a.active_generation
+                      AND (%s::bigint[] IS NULL OR u.annc_id = ANY(%s::bigint[]))
+                """
+                params = (annc_ids, annc_ids)
+                with db.conn.cursor() as cur:
+                    cur.execute(query, params)
+                    return cur.rowcount
+        except Exception as e:
+            print(f"ANNC_UNIT 이전 세대 삭제 실패: {e}")
+            raise
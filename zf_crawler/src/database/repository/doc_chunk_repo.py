@@ -1,6 +1,7 @@
 # database/repository/doc_chunks_repository.py
 
 from src.database.db_handler import DataBaseHandler 
+from src.database.pg_binary_copy import BinaryCopyStream
 from psycopg2 import extras
 from typing import List, Dict, Any, Optional
 
@@ -11,9 +12,19 @@ class DocChunkRepository(DataBaseHandler):
     # CHUNK_ID (BIGSERIAL)을 제외한 모든 컬럼
     COLUMNS = [
         "file_id", "annc_id", "chunk_type", "chunk_text", "page_num", 
-        "embedding", "metadata"
+        "embedding", "metadata", "chunk_text_hash", "generation",
+        "section_path", "section_category", "has_numeric_table"
     ]
 
+    # 바이너리 COPY용 컬럼 타입 (chunk_id + COLUMNS 순서)
+    COPY_COLUMN_TYPES = {
+        "chunk_id": "int8", "file_id": "int8", "annc_id": "int8",
+        "chunk_type": "text", "chunk_text": "text", "page_num": "int2",
+        "embedding": "vector", "metadata": "jsonb", "chunk_text_hash": "text",
+        "generation": "int4", "section_path": "text", "section_category": "text",
+        "has_numeric_table": "bool",
+    }
+
     def __init__(self):
         super().__init__()
         
@@ -24,7 +35,7 @@ class DocChunkRepository(DataBaseHandler):
         """
         문서 청크 데이터를 대량 삽입하고, 삽입된 청크의 ID와 ANNC_ID를 반환합니다.
         
-        :param records: 삽입할 청크 데이터 리스트. (embedding은 Optional)
+        :param records: 삽입할 청크 데이터 리스트. (embedding은 Optional, generation은 적재 중인 세대)
         :return: {chunk_id, annc_id} 딕셔너리 리스트.
         """
         insert_cols_str = ', '.join(self.COLUMNS)
@@ -42,7 +53,8 @@ class DocChunkRepository(DataBaseHandler):
                     values_template = f"({', '.join(['%s'] * len(self.COLUMNS))})"
                     
                     # execute_values를 사용하여 bulk insert 후 RETURNING으로 ID를 가져옵니다.
-                    extras.execute_values(
+                    # (fetch=True: 100건 단위 페이지마다의 RETURNING 결과를 모두 수집)
+                    rows = extras.execute_values(
                         cur,
                         f"""
                             INSERT INTO {self.TABLE_NAME} ({insert_cols_str}) 
@@ -50,16 +62,97 @@ class DocChunkRepository(DataBaseHandler):
                             RETURNING chunk_id, annc_id;  
                         """,
                         data_to_insert,
-                        template=values_template
+                        template=values_template,
+                        fetch=True
                     )
                     
-                    results = [dict(row) for row in cur.fetchall()]
+                    results = [dict(row) for row in rows]
                     return results
                     
         except Exception as e:
             print(f"DOC_CHUNKS 삽입 실패: {e}")
             raise
 
+    def bulk_copy_chunks(self, records: List[Dict[str, Any]], staging: bool = True) -> List[Dict[str, Any]]:
+        """
+        COPY ... FROM STDIN (FORMAT binary)로 문서 청크를 대량 적재합니다. (크롤러 적재 기본 경로)
+        bulk_insert_chunks와 입력/반환 형식이 같습니다.
+
+        임베딩 벡터를 텍스트 리터럴이 아닌 pgvector 바이너리 포맷으로 전송하고,
+        CHUNK_ID는 시퀀스에서 미리 할당하여 COPY에서도 입력 순서대로 ID를 반환합니다.
+
+        :param records: 삽입할 청크 데이터 리스트.
+        :param staging: True면 임시(비로깅) 스테이징 테이블에 COPY한 뒤 INSERT ... SELECT로 옮기며
+                        fts_vector를 집합 연산으로 계산합니다. (fts 트리거는 값이 채워진 행을 다시 계산하지 않음)
+                        False면 doc_chunks에 바로 COPY합니다. (fts_vector는 트리거가 계산)
+        :return: {chunk_id, annc_id} 딕셔너리 리스트. (입력 순서)
+        """
+        if not records:
+            return []
+
+        copy_columns = ["chunk_id"] + self.COLUMNS
+        column_types = [self.COPY_COLUMN_TYPES[col] for col in copy_columns]
+        copy_cols_str = ', '.join(copy_columns)
+
+        try:
+            with self as db:
+                with db.conn.cursor() as cur:
+                    # 1. CHUNK_ID 선할당
+                    cur.execute(
+                        f"""
+                            SELECT nextval(pg_get_serial_sequence('{self.TABLE_NAME}', 'chunk_id'))
+                            FROM generate_series(1, %s)
+                        """,
+                        (len(records),)
+                    )
+                    chunk_ids = [row[0] for row in cur.fetchall()]
+
+                    rows = (
+                        (chunk_id,) + tuple(rec.get(col, None) for col in self.COLUMNS)
+                        for chunk_id, rec in zip(chunk_ids, records)
+                    )
+                    stream = BinaryCopyStream(rows, column_types)
+
+                    if not staging:
+                        # 2-a. 본 테이블에 바로 COPY
+                        cur.copy_expert(
+                            f"COPY {self.TABLE_NAME} ({copy_cols_str}) FROM STDIN (FORMAT binary)",
+                            stream
+                        )
+                    else:
+                        # 2-b. 트랜잭션 종료 시 삭제되는 임시 테이블 (WAL 미기록, 세션 간 충돌 없음)
+                        stage_table = f"{self.TABLE_NAME}_copy_stage"
+                        cur.execute(
+                            f"""
+                                CREATE TEMP TABLE {stage_table} ON COMMIT DROP AS
+                                SELECT {copy_cols_str} FROM {self.TABLE_NAME} WITH NO DATA
+                            """
+                        )
+                        cur.copy_expert(
+                            f"COPY {stage_table} ({copy_cols_str}) FROM STDIN (FORMAT binary)",
+                            stream
+                        )
+
+                        cur.execute(
+                            f"""
+                                INSERT INTO {self.TABLE_NAME} ({copy_cols_str}, fts_vector)
+                                SELECT {copy_cols_str}, to_tsvector('simple', chunk_text)
+                                FROM {stage_table}
+                            """
+                        )
+
+                        # unit of work 안에서 여러 번 호출될 수 있으므로 즉시 삭제
+                        cur.execute(f"DROP TABLE {stage_table}")
+
+                    return [
+                        {"chunk_id": chunk_id, "annc_id": rec.get("annc_id")}
+                        for chunk_id, rec in zip(chunk_ids, records)
+                    ]
+
+        except Exception as e:
+            print(f"DOC_CHUNKS COPY 적재 실패: {e}")
+            raise
+
     def bulk_update_embeddings(self, updates: List[Dict[str, Any]]) -> int:
         """
         주어진 CHUNK_ID 목록을 기반으로 임베딩 벡터를 갱신합니다. (BULK)
@@ -102,6 +195,53 @@ class DocChunkRepository(DataBaseHandler):
             print(f"DOC_CHUNKS 임베딩 갱신 실패: {e}")
             raise
 
+    # --------------------------------------------------------------------------
+    ## SELECT (임베딩 재사용 조회)
+    # --------------------------------------------------------------------------
+    def get_embeddings_by_text_hash(self, text_hashes: List[str]) -> Dict[str, Any]:
+        """
+        청크 텍스트 해시로 이미 저장된 임베딩을 조회합니다. (공고 간 동일 문구 재사용)
+
+        :param text_hashes: 정규화 청크 텍스트 SHA-256 리스트.
+        :return: {chunk_text_hash: embedding} 딕셔너리. (없는 해시는 제외)
+        """
+        if not text_hashes:
+            return {}
+
+        try:
+            with self as db:
+                query = f"""
+                    SELECT DISTINCT ON (chunk_text_hash) chunk_text_hash, embedding
+                    FROM {self.TABLE_NAME}
+                    WHERE chunk_text_hash = ANY(%s)
+                """
+                with db.conn.cursor() as cur:
+                    cur.execute(query, (list(text_hashes),))
+                    return {row[0]: row[1] for row in cur.fetchall()}
+        except Exception as e:
+            print(f"DOC_CHUNKS 임베딩 재사용 조회 실패: {e}")
+            raise
+
+    # --------------------------------------------------------------------------
+    ## SELECT (세대별 청크 조회)
+    # --------------------------------------------------------------------------
+    def get_chunks_by_generation(self, annc_id: int, generation: int) -> List[Dict[str, Any]]:
+        """
+        공고의 특정 세대 청크 텍스트를 페이지 순서로 조회합니다. (구조화 프로필 추출용, 임베딩 제외)
+        """
+        try:
+            with self as db:
+                query = f"""
+                    SELECT chunk_id, chunk_type, chunk_text, page_num
+                    FROM {self.TABLE_NAME}
+                    WHERE annc_id = %s AND generation = %s
+                    ORDER BY page_num, chunk_id
+                """
+                return db.execute_query(query, (annc_id, generation), fetch_one=False)
+        except Exception as e:
+            print(f"DOC_CHUNKS 세대 조회 실패: {e}")
+            raise
+
     # --------------------------------------------------------------------------
     ## SELECT (벡터 유사도 검색)
     # --------------------------------------------------------------------------
@@ -113,9 +253,11 @@ class DocChunkRepository(DataBaseHandler):
         try:
             with self as db:
                 # <-> 연산자는 L2 distance를 측정. ORDER BY를 통해 가장 작은 값이 가장 유사한 벡터입니다.
+                # 공고의 활성 세대 청크만 검색
                 query = f"""
-                    SELECT chunk_text, page_num, annc_id, file_id, embedding <-> %s AS distance
-                    FROM {self.TABLE_NAME}
+                    SELECT dc.chunk_text, dc.page_num, dc.annc_id, dc.file_id, dc.embedding <-> %s AS distance
+                    FROM {self.TABLE_NAME} dc
+                    JOIN annc_all a ON a.annc_id = dc.annc_id AND dc.generation = a.active_generation
                     ORDER BY distance
                     LIMIT %s
                 """
@@ -138,4 +280,29 @@ class DocChunkRepository(DataBaseHandler):
                     return cur.rowcount
         except Exception as e:
             print(f"DOC_CHUNKS 삭제 실패: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def delete_inactive_generations(self, annc_ids: Optional[List[int]] = None) -> int:
+        """
+        활성 세대보다 이전 세대의 청크를 일괄 삭제합니다. (세대 교체 후 GC)
+        활성 세대보다 새로운 세대는 적재 중일 수 있으므로 남겨둡니다.
+
+        :param annc_ids: 대상 공고 ID 리스트. (None이면 전체 공고)
+        :return: 삭제된 행의 개수.
+        """
+        try:
+            with self as db:
+                query = f"""
+                    DELETE FROM {self.TABLE_NAME} dc
+                    USING annc_all a
+                    WHERE dc.annc_id = a.annc_id
+                      AND dc.generation < a.active_generation
+                      AND (%s::bigint[] IS NULL OR dc.annc_id = ANY(%s::bigint[]))
+                """
+                params = (annc_ids, annc_ids)
+                with db.conn.cursor() as cur:
+                    cur.execute(query, params)
+                    return cur.rowcount
+        except Exception as e:
+            print(f"DOC_CHUNKS 이전 세대 삭제 실패: {e}")
+            raise
@@ -1,9 +1,37 @@
-"""임베딩 모듈 - OpenAI text-embedding-3-small"""
+"""임베딩 모듈 - OpenAI text-embedding-3-small
+
+대량 임베딩은 EmbeddingBatcher를 통해 처리합니다.
+- 추정 토큰 수 기준으로 배치 구성 (요청당 토큰/건수 제한 준수)
+- 여러 배치를 동시에 요청하되, 분당 토큰(TPM) 예산을 프로세스 전체에서 공유
+- 레이트 리밋/일시 오류는 지터가 적용된 지수 백오프로 재시도
+- 완료된 배치는 텍스트 단위 키별 파일로 디스크에 저장하여, 실패 후 재실행 시 저장된 텍스트는 다시 요청하지 않음
+  (키가 배치 구성과 무관하므로 재사용 조회 결과나 스트림 분할이 달라져도 재개 가능)
+
+임베딩은 float32 numpy 배열로 보관하고(파이썬 float 리스트 대비 약 1/8 메모리),
+embed_chunk_stream으로 청크 스트림을 배치 단위로 처리하면 최대 메모리가 배치 크기로 제한됩니다.
+"""
 import os
-from typing import List
+import time
+import random
+import hashlib
+import threading
+from itertools import islice
+from pathlib import Path
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from langchain_openai import OpenAIEmbeddings
 
+from .config import (
+    EMBEDDING_MODEL_NAME, EMBED_BATCH_MAX_TOKENS, EMBED_BATCH_MAX_ITEMS,
+    EMBED_MAX_CONCURRENCY, EMBED_TPM_LIMIT, EMBED_MAX_RETRIES, EMBED_PROGRESS_DIR,
+    EMBED_STREAM_BATCH_SIZE, OPENAI_BASE_URL
+)
+
 _model = None
+_batcher = None
 
 
 def get_model() -> OpenAIEmbeddings:
@@ -12,25 +40,301 @@ def get_model() -> OpenAIEmbeddings:
     if _model is None:
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError("OPENAI_API_KEY 환경변수 필요")
-        _model = OpenAIEmbeddings(model="text-embedding-3-small")
+        if OPENAI_BASE_URL:
+            # OpenAI 호환 서버: tiktoken 토큰 분할 없이 문자열 그대로 전송 (인코딩 파일 다운로드 불필요)
+            _model = OpenAIEmbeddings(
+                model=EMBEDDING_MODEL_NAME, base_url=OPENAI_BASE_URL, check_embedding_ctx_length=False
+            )
+        else:
+            _model = OpenAIEmbeddings(model=EMBEDDING_MODEL_NAME)
     return _model
 
 
+def estimate_tokens(text: str) -> int:
+    """임베딩 요청 토큰 수 추정 (UTF-8 바이트 / 2, 한글 기준 보수적 추정)"""
+    return max(1, len(text.encode('utf-8')) // 2)
+
+
+class EmbeddingBatchError(Exception):
+    """일부 배치 임베딩 실패 (완료된 배치는 저장되어 재실행 시 재사용)"""
+
+    def __init__(self, failed: List[int], total: int, last_error: Exception):
+        self.failed = failed
+        self.total = total
+        self.last_error = last_error
+        super().__init__(f"임베딩 배치 {len(failed)}/{total}건 실패: {last_error}")
+
+
+class TokenRateLimiter:
+    """분당 토큰 예산 (토큰 버킷, 스레드 간 공유)"""
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = tokens_per_minute
+        self.tokens = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: int):
+        """토큰 예산이 확보될 때까지 대기"""
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _is_retryable(e: Exception) -> bool:
+    """재시도 대상 오류 (레이트 리밋, 타임아웃, 연결 오류, 5xx)"""
+    try:
+        import openai
+        if isinstance(e, (openai.RateLimitError, openai.APITimeoutError,
+                          openai.APIConnectionError, openai.InternalServerError)):
+            return True
+    except ImportError:
+        pass
+    return 'rate limit' in str(e).lower() or '429' in str(e)
+
+
+class EmbeddingBatcher:
+    """토큰 기준 배치 + 동시 요청 + 재시도 + 진행 상황 저장"""
+
+    def __init__(
+            self,
+            max_batch_tokens: int = EMBED_BATCH_MAX_TOKENS,
+            max_batch_items: int = EMBED_BATCH_MAX_ITEMS,
+            max_concurrency: int = EMBED_MAX_CONCURRENCY,
+            tokens_per_minute: int = EMBED_TPM_LIMIT,
+            max_retries: int = EMBED_MAX_RETRIES,
+            progress_dir: Path = EMBED_PROGRESS_DIR
+            ):
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_items = max_batch_items
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.progress_dir = Path(progress_dir)
+        self.limiter = TokenRateLimiter(tokens_per_minute)
+
+    def make_batches(self, texts: List[str]) -> List[List[int]]:
+        """추정 토큰 수 기준으로 텍스트 인덱스를 배치로 묶음
+
+        건수가 적어도 동시 요청 수만큼 배치가 나오도록 배치당 건수를 나눠 잡음 (스트림 분할 크기와 무관하게 동시 요청 활용)
+        """
+        max_items = min(self.max_batch_items, max(1, -(-len(texts) // self.max_concurrency)))
+        batches, current, current_tokens = [], [], 0
+        for i, text in enumerate(texts):
+            tokens = estimate_tokens(text)
+            if current and (current_tokens + tokens > self.max_batch_tokens or len(current) >= max_items):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def progress_key(text: str) -> str:
+        """진행 상황 저장 키 (모델 + 텍스트 - 배치 구성과 무관)"""
+        return hashlib.sha256(f"{EMBEDDING_MODEL_NAME}\x00{text}".encode('utf-8')).hexdigest()
+
+    def _progress_path(self, key: str) -> Path:
+        """키별 진행 상황 파일 경로 (키 앞 2자리 하위 디렉터리 - 조회/삭제 시 필요한 파일만 접근)"""
+        return self.progress_dir / key[:2] / f"{key}.npy"
+
+    def load_progress(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """저장된 결과 중 keys에 해당하는 벡터 (이전 실행에서 완료된 텍스트)"""
+        found = {}
+        for key in set(keys):
+            path = self._progress_path(key)
+            if not path.exists():
+                continue
+            try:
+                found[key] = np.load(path)
+            except Exception:
+                continue  # 쓰는 도중 중단된 파일 등
+        return found
+
+    def clear_progress(self, keys: Iterable[str]):
+        """keys의 진행 상황 파일 삭제"""
+        for key in set(keys):
+            self._progress_path(key).unlink(missing_ok=True)
+
+    def _save_progress(self, keys: List[str], vectors: np.ndarray):
+        suffix = f"{os.getpid()}.{threading.get_ident()}.tmp.npy"
+        for key, vec in zip(keys, vectors):
+            path = self._progress_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{key}.{suffix}")
+            np.save(tmp_path, vec)
+            os.replace(tmp_path, path)
+
+    def _embed_batch(self, batch_texts: List[str], batch_keys: List[str]) -> np.ndarray:
+        """배치 1건 임베딩 -> (건수, 차원) float32 배열 (재시도 포함 요청 후 텍스트 키와 함께 저장)"""
+        tokens = sum(estimate_tokens(t) for t in batch_texts)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(tokens)
+            try:
+                vectors = get_model().embed_documents(batch_texts)
+                break
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                # full jitter 지수 백오프 (최대 60초)
+                time.sleep(random.uniform(0, min(60.0, 2.0 ** attempt)))
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self._save_progress(batch_keys, vectors)
+        return vectors
+
+    def embed(self, texts: List[str], keep_progress: bool = False) -> List[np.ndarray]:
+        """텍스트 리스트 임베딩 (입력 순서 유지)
+
+        이전 실행에서 저장된 텍스트는 요청하지 않고, 나머지만 배치로 요청.
+        일부 배치가 실패하면 나머지 배치를 끝까지 처리(저장)한 뒤 EmbeddingBatchError 발생
+
+        :param keep_progress: True면 완료 후에도 진행 상황 파일 유지 (스트림 전체 완료 후 clear_progress로 정리)
+        """
+        if not texts:
+            return []
+
+        keys = [self.progress_key(t) for t in texts]
+        saved = self.load_progress(keys)
+        results: List[Optional[np.ndarray]] = [saved.get(k) for k in keys]
+        pending = [i for i, vec in enumerate(results) if vec is None]
+
+        batches = [[pending[j] for j in batch] for batch in self.make_batches([texts[i] for i in pending])]
+        failed, last_error = [], None
+
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                futures = [
+                    executor.submit(self._embed_batch, [texts[i] for i in batch], [keys[i] for i in batch])
+                    for batch in batches
+                ]
+                for batch_no, (batch, future) in enumerate(zip(batches, futures)):
+                    try:
+                        for i, vec in zip(batch, future.result()):
+                            results[i] = vec
+                    except Exception as e:
+                        failed.append(batch_no)
+                        last_error = e
+
+        if failed:
+            raise EmbeddingBatchError(failed, len(batches), last_error)
+
+        # 전체 완료 시 진행 상황 파일 정리
+        if not keep_progress:
+            self.clear_progress(keys)
+        return results
+
+
+def get_batcher() -> EmbeddingBatcher:
+    """임베딩 배처 싱글톤 (TPM 예산 공유)"""
+    global _batcher
+    if _batcher is None:
+        _batcher = EmbeddingBatcher()
+    return _batcher
+
+
 def embed_text(text: str) -> List[float]:
     """단일 텍스트 임베딩"""
     return get_model().embed_query(text)
 
 
-def embed_texts(texts: List[str]) -> List[List[float]]:
-    """배치 임베딩"""
-    return get_model().embed_documents(texts) if texts else []
+def embed_texts(texts: List[str], keep_progress: bool = False) -> List[np.ndarray]:
+    """배치 임베딩 (float32 벡터 리스트)"""
+    return get_batcher().embed(texts, keep_progress=keep_progress) if texts else []
+
+
+def chunk_text_hash(text: str) -> str:
+    """정규화(공백 통일)된 청크 텍스트의 SHA-256 - 동일 문구 임베딩 재사용 키"""
+    return hashlib.sha256(' '.join(text.split()).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class ReuseStats:
+    """임베딩 재사용 통계 (실행 단위 누적)"""
+    total: int = 0     # 임베딩이 필요한 청크 수
+    reused: int = 0    # 기존 벡터 재사용 (DB 또는 같은 실행 내 중복)
+    embedded: int = 0  # API로 새로 임베딩한 텍스트 수
 
+    @property
+    def ratio(self) -> float:
+        return self.reused / self.total if self.total else 0.0
 
-def embed_chunks(chunks: List) -> List:
-    """Chunk 객체 리스트에 임베딩 추가"""
+    def __str__(self) -> str:
+        return f"임베딩 재사용 {self.reused}/{self.total} ({self.ratio:.1%}), 신규 API 임베딩 {self.embedded}건"
+
+
+def embed_chunks(
+        chunks: List,
+        lookup: Callable[[List[str]], Dict[str, list]] = None,
+        stats: ReuseStats = None,
+        keep_progress: bool = False
+        ) -> List:
+    """Chunk 객체 리스트에 임베딩 추가
+
+    Args:
+        chunks: Chunk 리스트 (text_hash가 채워짐)
+        lookup: 텍스트 해시 리스트 -> {해시: 임베딩} 조회 함수 (예: DocChunkRepository.get_embeddings_by_text_hash).
+                조회된 해시는 API를 호출하지 않고 기존 벡터를 재사용
+        stats: 재사용 통계 누적 대상
+        keep_progress: 임베딩 진행 상황 파일 유지 (embed_chunk_stream에서 스트림 완료 후 정리)
+    """
     if not chunks:
         return []
-    texts = [c.text for c in chunks]
-    for chunk, emb in zip(chunks, embed_texts(texts)):
-        chunk.embedding = emb
+
+    for chunk in chunks:
+        chunk.text_hash = chunk_text_hash(chunk.text)
+
+    # 같은 실행 내 중복 텍스트는 한 번만 처리
+    unique = {}
+    for chunk in chunks:
+        unique.setdefault(chunk.text_hash, chunk.text)
+
+    known = lookup(list(unique)) if lookup else {}
+    missing = [h for h in unique if h not in known]
+    vectors = dict(known)
+    vectors.update(zip(missing, embed_texts([unique[h] for h in missing], keep_progress=keep_progress)))
+
+    for chunk in chunks:
+        chunk.embedding = vectors[chunk.text_hash]
+
+    if stats is not None:
+        stats.total += len(chunks)
+        stats.embedded += len(missing)
+        stats.reused += len(chunks) - len(missing)
     return chunks
+
+
+def iter_batches(items: Iterable, batch_size: int) -> Iterator[List]:
+    """이터러블을 batch_size 단위 리스트로 나눔"""
+    iterator = iter(items)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def embed_chunk_stream(
+        chunks: Iterable,
+        batch_size: int = EMBED_STREAM_BATCH_SIZE,
+        lookup: Callable[[List[str]], Dict[str, list]] = None,
+        stats: ReuseStats = None
+        ) -> Iterator[List]:
+    """청크 스트림(예: iter_chunks_from_elements)을 batch_size 단위로 임베딩하여 배치별로 반환
+
+    호출 측에서 배치를 DB에 적재한 뒤 다음 배치를 요청하면, 메모리에는 한 배치의 청크/벡터만 남습니다.
+    진행 상황 파일은 스트림을 끝까지 소비한 뒤 정리 (중간 실패 시 재실행에서 완료된 텍스트 재사용)
+    """
+    batcher = get_batcher()
+    keys = set()
+    for batch in iter_batches(chunks, batch_size):
+        keys.update(batcher.progress_key(c.text) for c in batch)
+        yield embed_chunks(batch, lookup=lookup, stats=stats, keep_progress=True)
+    batcher.clear_progress(keys)
@@ -0,0 +1,211 @@
+"""파싱 결과 캐시 모듈 - PDF 내용(SHA-256) + 파서 버전 기반 디스크 캐시
+
+같은 PDF를 다시 적재할 때(청커/정규화 변경 후 재청킹 등) LlamaParse + Camelot 파싱을 건너뜁니다.
+- 키: PDF SHA-256 + PARSER_VERSION + TABLE_PIPELINE_VERSION(Camelot 사용 시) + 엔진 + Camelot 사용 여부
+- 포맷: orjson 직렬화 + zstd 압축 (*.json.zst)
+- 정리: 최대 보관 기간 초과 항목 삭제 후, 최대 용량을 넘으면 오래 사용하지 않은 항목부터 삭제
+
+CLI:
+    python -m src.parse_cache stats
+    python -m src.parse_cache evict
+    python -m src.parse_cache clear
+    python -m src.parse_cache parse <pdf> [<pdf> ...] [--engine pymupdf]
+"""
+import os
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from dataclasses import asdict
+from typing import Optional
+
+import orjson
+import zstandard
+
+from .config import PARSE_CACHE_DIR, PARSE_CACHE_MAX_BYTES, PARSE_CACHE_MAX_AGE_DAYS, PARSE_ENGINE
+from .parser import parse_pdf, ParsedDocument, ParsedElement, PARSER_VERSION, TABLE_PIPELINE_VERSION
+
+CACHE_SUFFIX = ".json.zst"
+ZSTD_LEVEL = 10
+
+
+def file_sha256(file_path: Path) -> str:
+    """파일 내용 SHA-256"""
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def cache_key(sha256: str, engine: str, use_camelot: bool) -> str:
+    """캐시 키 (PDF 해시 + 파서/표 추출 버전 + 파싱 옵션)"""
+    tables = f"camelot{TABLE_PIPELINE_VERSION}" if use_camelot else 'plain'
+    return f"{sha256}-{PARSER_VERSION}-{engine}-{tables}"
+
+
+def serialize_document(doc: ParsedDocument) -> bytes:
+    """ParsedDocument -> zstd 압축 JSON"""
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(orjson.dumps(asdict(doc)))
+
+
+def deserialize_document(data: bytes) -> ParsedDocument:
+    """zstd 압축 JSON -> ParsedDocument"""
+    raw = orjson.loads(zstandard.ZstdDecompressor().decompress(data))
+    elements = [ParsedElement(**e) for e in raw['elements']]
+    return ParsedDocument(raw['file_path'], raw['external_id'], elements, raw['raw_markdown'])
+
+
+class ParseCache:
+    """PDF 파싱 결과 디스크 캐시"""
+
+    def __init__(
+            self,
+            cache_dir: Path = PARSE_CACHE_DIR,
+            max_bytes: int = PARSE_CACHE_MAX_BYTES,
+            max_age_days: float = PARSE_CACHE_MAX_AGE_DAYS
+            ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        # 해시 앞 2자리로 하위 폴더 분산
+        return self.cache_dir / key[:2] / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[ParsedDocument]:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        path = self._path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        try:
+            doc = deserialize_document(path.read_bytes())
+        except Exception as e:
+            print(f"파싱 캐시 손상 - 삭제: {path.name} ({e})")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        # 마지막 사용 시각 갱신 (LRU 정리 기준)
+        os.utime(path)
+        self.hits += 1
+        return doc
+
+    def put(self, key: str, doc: ParsedDocument):
+        """캐시 저장 (임시 파일에 쓴 뒤 교체하여 부분 기록 방지)"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(serialize_document(doc))
+        os.replace(tmp_path, path)
+
+    def _entries(self) -> list:
+        if not self.cache_dir.exists():
+            return []
+        return [(p, p.stat()) for p in self.cache_dir.glob(f"*/*{CACHE_SUFFIX}")]
+
+    def stats(self) -> dict:
+        """캐시 현황"""
+        entries = self._entries()
+        return {
+            'entries': len(entries),
+            'bytes': sum(st.st_size for _, st in entries),
+            'max_bytes': self.max_bytes,
+            'max_age_days': self.max_age_days,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def evict(self) -> int:
+        """보관 기간 초과 항목 삭제 후 용량 초과분을 LRU 순으로 삭제. 삭제 건수 반환"""
+        now = time.time()
+        max_age_sec = self.max_age_days * 86400
+        removed = 0
+
+        entries = []
+        for path, st in self._entries():
+            if now - st.st_mtime > max_age_sec:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((path, st))
+
+        total = sum(st.st_size for _, st in entries)
+        for path, st in sorted(entries, key=lambda e: e[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> int:
+        """캐시 전체 삭제"""
+        entries = self._entries()
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+
+_cache = None
+
+
+def get_cache() -> ParseCache:
+    """파싱 캐시 싱글톤"""
+    global _cache
+    if _cache is None:
+        _cache = ParseCache()
+    return _cache
+
+
+def parse_pdf_cached(file_path: Path, external_id: str, use_camelot: bool = True, engine: str = None) -> ParsedDocument:
+    """캐시를 먼저 조회하고, 없으면 parse_pdf 실행 후 저장"""
+    engine = engine or PARSE_ENGINE
+    cache = get_cache()
+    key = cache_key(file_sha256(file_path), engine, use_camelot)
+
+    doc = cache.get(key)
+    if doc is not None:
+        # 같은 내용의 PDF라도 경로/식별자는 현재 호출 기준으로 설정
+        doc.file_path = str(file_path)
+        doc.external_id = external_id
+        return doc
+
+    doc = parse_pdf(file_path, external_id, use_camelot=use_camelot, engine=engine)
+    cache.put(key, doc)
+    cache.evict()
+    return doc
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="PDF 파싱 결과 캐시 관리")
+    sub = arg_parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="캐시 현황")
+    sub.add_parser("evict", help="보관 기간/용량 기준 정리")
+    sub.add_parser("clear", help="캐시 전체 삭제")
+    parse_cmd = sub.add_parser("parse", help="PDF 파싱 (캐시 우선)")
+    parse_cmd.add_argument("files", nargs="+", type=Path)
+    parse_cmd.add_argument("--engine", default=None, help="'llamaparse' | 'pymupdf'")
+    parse_cmd.add_argument("--no-camelot", action="store_true")
+    args = arg_parser.parse_args()
+
+    cache = get_cache()
+    if args.command == "stats":
+        print(cache.stats())
+    elif args.command == "evict":
+        print(f"{cache.evict()}건 삭제")
+    elif args.command == "clear":
+        print(f"{cache.clear()}건 삭제")
+    elif args.command == "parse":
+        for file_path in args.files:
+            start = time.perf_counter()
+            doc = parse_pdf_cached(file_path, file_path.stem, use_camelot=not args.no_camelot, engine=args.engine)
+            print(f"{file_path.name}: 요소 {len(doc.elements)}개 ({time.perf_counter() - start:.1f}s)")
+        print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
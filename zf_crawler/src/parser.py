@@ -1,9 +1,18 @@
-"""PDF 파싱 모듈 - LlamaParse + Camelot 하이브리드"""
+"""PDF 파싱 모듈 - LlamaParse / PyMuPDF + Camelot 하이브리드"""
 import os
 import re
 from pathlib import Path
 from dataclasses import dataclass, field
-from llama_cloud_services import LlamaParse
+from .config import PARSE_ENGINE
+
+PARSE_ENGINES = ('llamaparse', 'pymupdf')
+
+# 파싱 결과(요소 추출/Camelot 대체 로직)가 바뀌면 올려서 파싱 캐시를 무효화
+PARSER_VERSION = "2"
+
+# 표 추출 파이프라인(camelot_table_extractor의 표 추출/dataframe_to_markdown) 출력이 바뀌면 올림
+# (Camelot 표 마크다운이 파싱 결과에 그대로 저장되므로 파싱 캐시 키에 포함)
+TABLE_PIPELINE_VERSION = "2"
 
 
 @dataclass
@@ -24,24 +33,31 @@ class ParsedDocument:
     raw_markdown: str
 
 
-def parse_pdf(file_path: Path, external_id: str, use_camelot: bool = True) -> ParsedDocument:
-    """PDF 파싱 (LlamaParse + Camelot 하이브리드)"""
-    if not os.getenv("LLAMA_CLOUD_API_KEY"):
-        raise ValueError("LLAMA_CLOUD_API_KEY 환경변수 필요")
+def parse_pdf(file_path: Path, external_id: str, use_camelot: bool = True, engine: str = None) -> ParsedDocument:
+    """PDF 파싱 (LlamaParse/PyMuPDF + Camelot 하이브리드)
 
-    parser = LlamaParse(result_type="markdown", verbose=True)
-    json_result = parser.get_json_result(str(file_path))
+    Args:
+        file_path: PDF 파일 경로
+        external_id: 문서 식별자
+        use_camelot: Camelot 테이블 대체 여부
+        engine: 'llamaparse'(클라우드) 또는 'pymupdf'(로컬, 네트워크 불필요). None이면 config.PARSE_ENGINE
+    """
+    engine = engine or PARSE_ENGINE
+    if engine == 'llamaparse':
+        pages = _parse_pages_llamaparse(file_path)
+    elif engine == 'pymupdf':
+        pages = _parse_pages_pymupdf(file_path)
+    else:
+        raise ValueError(f"지원하지 않는 파싱 엔진: {engine} (가능: {PARSE_ENGINES})")
 
     elements = []
     raw_parts = []
 
-    if json_result and 'pages' in json_result[0]:
-        for page in json_result[0]['pages']:
-            page_num = page.get('page', 1)
-            content = page.get('md', '').strip()
-            if content:
-                raw_parts.append(content)
-                elements.extend(_extract_elements(content, page_num))
+    for page_num, content in pages:
+        content = content.strip()
+        if content:
+            raw_parts.append(content)
+            elements.extend(_extract_elements(content, page_num))
 
     # Camelot으로 테이블 대체
     if use_camelot:
@@ -50,11 +66,46 @@ def parse_pdf(file_path: Path, external_id: str, use_camelot: bool = True) -> Pa
     return ParsedDocument(str(file_path), external_id, elements, "\n\n".join(raw_parts))
 
 
+def _parse_pages_llamaparse(file_path: Path) -> list:
+    """LlamaParse로 페이지별 마크다운 추출 -> [(page_number, markdown), ...]"""
+    if not os.getenv("LLAMA_CLOUD_API_KEY"):
+        raise ValueError("LLAMA_CLOUD_API_KEY 환경변수 필요")
+
+    from llama_cloud_services import LlamaParse
+    parser = LlamaParse(result_type="markdown", verbose=True)
+    json_result = parser.get_json_result(str(file_path))
+
+    if not json_result or 'pages' not in json_result[0]:
+        return []
+    return [(page.get('page', 1), page.get('md', '')) for page in json_result[0]['pages']]
+
+
+def _parse_pages_pymupdf(file_path: Path) -> list:
+    """PyMuPDF(pymupdf4llm)로 로컬에서 페이지별 마크다운 추출 -> [(page_number, markdown), ...]"""
+    import pymupdf4llm
+
+    page_chunks = pymupdf4llm.to_markdown(str(file_path), page_chunks=True, show_progress=False)
+
+    pages = []
+    for idx, chunk in enumerate(page_chunks):
+        meta = chunk.get('metadata', {})
+        page_num = meta.get('page_number') or meta.get('page') or idx + 1
+        pages.append((page_num, chunk.get('text', '')))
+    return pages
+
+
 def _replace_with_camelot(file_path: Path, elements: list) -> list:
-    """LlamaParse 테이블을 Camelot 테이블로 대체"""
+    """파서(LlamaParse/PyMuPDF) 테이블을 Camelot 테이블로 대체
+
+    Camelot은 파서가 테이블을 찾은 페이지에서만 실행합니다.
+    """
+    table_pages = sorted({e.page_number for e in elements if e.element_type == 'table'})
+    if not table_pages:
+        return elements
+
     try:
         from .camelot_table_extractor import extract_tables_by_page
-        camelot_tables = extract_tables_by_page(file_path)
+        camelot_tables = extract_tables_by_page(file_path, table_pages)
     except Exception as e:
         print(f"Camelot 실패: {e}")
         return elements
@@ -0,0 +1,223 @@
+"""공고 구조화 프로필 추출 모듈
+
+공고 세대(generation) 적재가 끝난 뒤 1회, 청크에서 자주 묻는 항목을 구조화하여 annc_profile에 저장합니다.
+챗봇은 선택 개요/비교/자주 묻는 상세 질문을 RAG + LLM 대신 이 프로필로 바로 답변합니다.
+
+CLI (활성 세대 프로필이 없는 기존 공고 백필):
+    python -m src.profile_extractor backfill [--limit N]
+
+항목별 JSONB 형식:
+    {"summary": "한 줄 요약 (비교표용)", "detail": "마크다운 상세 답변", "pages": [근거 페이지 번호, ...]}
+공고문에서 찾지 못한 항목은 null (챗봇은 RAG로 대체)
+
+같은 LLM 호출에서 공급대상별 자격 기준(eligibility_rules)도 추출하여 annc_eligibility에 저장합니다.
+챗봇은 공고 검색 시 사용자 프로필(연령/혼인/자녀/소득)로 자격이 없는 공고를 SQL에서 먼저 제외합니다.
+    {"group_name": "청년", "min_age": 19, "max_age": 39, "marital_status": null,
+     "max_income_pct": 100, "min_children": null}
+"""
+import os
+import json
+import argparse
+from typing import List, Dict, Optional
+
+from langchain_openai import ChatOpenAI
+
+from .chunker import count_tokens
+from .config import PROFILE_LLM_MODEL, PROFILE_MAX_CONTEXT_TOKENS, OPENAI_BASE_URL
+
+# 프로필 항목: (표시명, 청크 선별 키워드)
+PROFILE_FIELDS = {
+    'eligibility': ('신청자격', ('신청자격', '입주자격', '자격요건', '무주택', '소득기준', '자산기준', '공급대상', '입주대상', '연령', '혼인', '신혼부부', '자녀')),
+    'rent': ('임대조건(보증금/월임대료)', ('임대보증금', '월임대료', '임대료', '보증금', '전환보증금')),
+    'area': ('전용면적/공급형별', ('전용면적', '공급면적', '계약면적', '주거전용', '공급형별', '㎡')),
+    'schedule': ('신청기간/일정', ('신청기간', '접수기간', '청약접수', '당첨자 발표', '발표일', '계약체결', '입주예정', '일정')),
+    'documents': ('제출서류', ('제출서류', '구비서류', '필요서류', '증명서', '서류')),
+}
+
+# 자격 기준 항목 -> 허용 범위 (범위 밖 값은 추출 오류로 보고 None)
+ELIGIBILITY_RULE_BOUNDS = {
+    'min_age': (0, 120),
+    'max_age': (0, 120),
+    'max_income_pct': (10, 1000),   # 도시근로자 가구원수별 월평균소득 대비 %
+    'min_children': (0, 10),
+}
+MARITAL_STATUSES = ('married', 'single')
+
+_model = None
+
+
+def get_model() -> ChatOpenAI:
+    """프로필 추출 LLM 싱글톤 (JSON 응답)"""
+    global _model
+    if _model is None:
+        if not os.getenv("OPENAI_API_KEY"):
+            raise ValueError("OPENAI_API_KEY 환경변수 필요")
+        _model = ChatOpenAI(model=PROFILE_LLM_MODEL, temperature=0, base_url=OPENAI_BASE_URL).bind(
+            response_format={"type": "json_object"}
+        )
+    return _model
+
+
+def select_profile_chunks(chunks: List[Dict], max_tokens: int = PROFILE_MAX_CONTEXT_TOKENS) -> List[Dict]:
+    """프로필 항목 키워드가 많이 포함된 청크를 토큰 예산 안에서 선별 (입력 순서 = 페이지 순서로 반환)
+
+    Args:
+        chunks: {chunk_text, chunk_type, page_num} 딕셔너리 리스트 (한 공고 세대의 청크)
+        max_tokens: 선별 청크 전체 토큰 상한
+    """
+    keywords = [kw for _, kws in PROFILE_FIELDS.values() for kw in kws]
+    scored = []
+    for idx, chunk in enumerate(chunks):
+        text = chunk.get('chunk_text', '')
+        score = sum(text.count(kw) for kw in keywords)
+        if score:
+            # 표(면적/임대료)는 같은 점수면 우선
+            scored.append((score, chunk.get('chunk_type') == 'table', -idx, chunk))
+
+    selected, used = [], 0
+    for _, _, neg_idx, chunk in sorted(scored, key=lambda x: x[:3], reverse=True):
+        tokens = count_tokens(chunk.get('chunk_text', ''))
+        if used + tokens > max_tokens:
+            continue
+        selected.append((-neg_idx, chunk))
+        used += tokens
+
+    return [chunk for _, chunk in sorted(selected, key=lambda x: x[0])]
+
+
+def build_prompt(chunks: List[Dict]) -> str:
+    """프로필 추출 프롬프트"""
+    fields_desc = "\n".join(f'- "{key}": {label}' for key, (label, _) in PROFILE_FIELDS.items())
+    context = "\n\n".join(f"[p{c.get('page_num', '?')}]\n{c.get('chunk_text', '')}" for c in chunks)
+    return f"""주택 공고문 발췌에서 아래 항목을 추출하여 JSON으로만 응답합니다.
+
+# 항목
+{fields_desc}
+
+# 항목별 형식
+{{"summary": "비교표에 넣을 한 줄 요약 (60자 이내)",
+  "detail": "사용자 질문에 바로 보여줄 마크다운 답변 (표/리스트 활용, 단지/타입별 구분, 단위 명시)",
+  "pages": [근거 페이지 번호]}}
+
+# 공급대상별 자격 기준 ("eligibility_rules": 리스트)
+공급대상(청년/신혼부부/고령자/주거급여수급자 등)마다 1개씩, 조건이 없는 값은 null
+{{"group_name": "공급대상명",
+  "min_age": 최소 만 나이, "max_age": 최대 만 나이,
+  "marital_status": "married"(혼인 중인 자만, 예비신혼부부 허용 시 null) | "single"(미혼만) | null,
+  "max_income_pct": 소득 상한(도시근로자 가구원수별 월평균소득 대비 %, 숫자),
+  "min_children": 최소 자녀 수}}
+- 확인할 수 없는 조건은 추측하지 말고 null (해당 공급대상이 자격 필터에서 잘못 제외되지 않도록)
+
+# 규칙
+- 발췌에 있는 내용만 사용하고, 찾지 못한 항목은 null
+- pages에는 발췌의 [pN] 표기 중 실제 근거가 된 페이지만 포함
+- 금액/면적 숫자는 원문 그대로 (천원/만원, ㎡ 단위 확인)
+
+# 공고문 발췌
+{context}"""
+
+
+def normalize_profile(raw: Dict, valid_pages: set) -> Dict[str, Optional[Dict]]:
+    """LLM 응답 검증 - 항목별 {summary, detail, pages} 또는 None"""
+    profile = {}
+    for key in PROFILE_FIELDS:
+        value = raw.get(key) if isinstance(raw, dict) else None
+        if not isinstance(value, dict) or not str(value.get('detail') or '').strip():
+            profile[key] = None
+            continue
+
+        pages = []
+        for page in value.get('pages') or []:
+            try:
+                page = int(page)
+            except (TypeError, ValueError):
+                continue
+            if page in valid_pages and page not in pages:
+                pages.append(page)
+
+        detail = str(value['detail']).strip()
+        profile[key] = {
+            'summary': str(value.get('summary') or detail.split('\n')[0]).strip()[:200],
+            'detail': detail,
+            'pages': sorted(pages),
+        }
+    return profile
+
+
+def normalize_eligibility_rules(raw: Dict) -> List[Dict]:
+    """LLM 응답의 eligibility_rules 검증 - 숫자 범위/혼인 조건 값 확인 후 리스트로 반환"""
+    rules = []
+    for value in (raw.get('eligibility_rules') if isinstance(raw, dict) else None) or []:
+        if not isinstance(value, dict):
+            continue
+        rule = {'group_name': str(value.get('group_name') or '').strip()[:50] or None}
+        for key, (low, high) in ELIGIBILITY_RULE_BOUNDS.items():
+            try:
+                number = int(value.get(key))
+            except (TypeError, ValueError):
+                number = None
+            rule[key] = number if number is not None and low <= number <= high else None
+        marital = value.get('marital_status')
+        rule['marital_status'] = marital if marital in MARITAL_STATUSES else None
+        if rule['min_age'] is not None and rule['max_age'] is not None and rule['min_age'] > rule['max_age']:
+            rule['min_age'] = rule['max_age'] = None
+        rules.append(rule)
+    return rules
+
+
+def extract_profile(chunks: List[Dict]) -> Optional[Dict[str, Optional[Dict]]]:
+    """공고 1건(한 세대)의 청크로 구조화 프로필 추출. 선별할 청크가 없으면 None
+
+    반환 딕셔너리에는 PROFILE_FIELDS 항목과 함께 'eligibility_rules'(자격 기준 리스트)가 포함됩니다.
+    """
+    selected = select_profile_chunks(chunks)
+    if not selected:
+        return None
+
+    response = get_model().invoke([
+        ("system", "주택 공고문에서 정보를 구조화하여 JSON으로 추출하는 도우미입니다."),
+        ("human", build_prompt(selected)),
+    ])
+    try:
+        raw = json.loads(response.content)
+    except json.JSONDecodeError as e:
+        print(f"프로필 JSON 파싱 실패: {e}")
+        return None
+
+    valid_pages = {c.get('page_num') for c in selected}
+    profile = normalize_profile(raw, valid_pages)
+    profile['eligibility_rules'] = normalize_eligibility_rules(raw)
+    return profile
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="공고 구조화 프로필 추출")
+    sub = arg_parser.add_subparsers(dest="command", required=True)
+    backfill_cmd = sub.add_parser("backfill", help="활성 세대 프로필이 없는 공고 추출")
+    backfill_cmd.add_argument("--limit", type=int, default=None)
+    args = arg_parser.parse_args()
+
+    from .database.repository import DocChunkRepository, AnncProfileRepository, AnncEligibilityRepository
+    dc_repo = DocChunkRepository()
+    profile_repo = AnncProfileRepository()
+    eligibility_repo = AnncEligibilityRepository()
+
+    if args.command == "backfill":
+        targets = profile_repo.get_announcements_without_profile(args.limit)
+        done = 0
+        for target in targets:
+            annc_id, generation = target['annc_id'], target['active_generation']
+            try:
+                profile = extract_profile(dc_repo.get_chunks_by_generation(annc_id, generation))
+            except Exception as e:
+                print(f"공고 {annc_id}: 추출 실패 ({e})")
+                continue
+            if profile:
+                profile_repo.upsert_profile(annc_id, generation, profile, PROFILE_LLM_MODEL)
+                eligibility_repo.replace_rules(annc_id, generation, profile['eligibility_rules'])
+                done += 1
+        print(f"{done}/{len(targets)}건 프로필 저장")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,67 @@ PDF에서 추출된 테이블의 셀 텍스트를 정규화합니다.
 - 한글 문자 사이 줄바꿈/공백 제거
 - 연속 공백 정리
 - 확장 가능한 패턴 기반 처리
+
+규칙 패턴은 한 번만 컴파일하여 재사용합니다.
+규칙 세트가 공백만 지우거나 바꾸는 규칙으로만 구성되면(기본 규칙), 각 공백 구간의 결과는 구간 내용과
+바로 앞/뒤 문자만으로 정해지므로 공백 구간 치환 한 번으로 처리합니다. 구간별 결과는 규칙을 그대로
+앞/뒤 문자 + 구간에 적용해 계산하고 캐시합니다. (규칙을 바꿔도 따로 고칠 코드 없음)
+규칙 세트마다 고정 표본에서 순차 적용 결과와 비교하고, 다르면 규칙별 순차 적용으로 처리합니다.
+마크다운 테이블은 셀 단위가 아니라 테이블 행 전체를 한 번에 처리합니다.
+검증: python -m src.table_preprocessor_check (기존 방식과 무작위 코퍼스 비교)
+파싱 결과(Camelot 표 마크다운)에 적용하도록 바꾸거나 그 상태에서 규칙을 바꾸면 parser.TABLE_PIPELINE_VERSION을 올릴 것 (파싱 캐시 무효화)
 """
 import re
+import warnings
+from functools import lru_cache
+from itertools import product
 from typing import List, Tuple, Optional
 from .config import CELL_NORMALIZE_RULES, COLUMN_SPECIFIC_RULES
 
+# 구분선(---|---|---)
+_SEPARATOR_RE = re.compile(r'^\|[\s\-:|]+\|$')
+
+# 셀 / 테이블 블록(줄바꿈 제외)의 공백 구간
+_CELL_WS_RUN_RE = re.compile(r'\s+')
+_TABLE_WS_RUN_RE = re.compile(r'[^\S\n]+')
+
+# 공백 구간 단위 처리 가능 여부 확인용 문자열 (한글/영문/숫자/각종 공백/파이프)
+_LOCALITY_PROBE = '가 나\n다  A 1\tb\r\n2 가　x\xa09 | 한 글 (㎡) 3.5 \n'
+
+# 구간 단위 처리 결과를 순차 적용과 비교할 고정 표본 (앞/뒤 두 글자 이상을 보는 규칙 검출용)
+_LOCALITY_SAMPLES = tuple(
+    left + run + right
+    for left, run, right in product(
+        ['', '가', '가나', 'a', 'ab', '1', '12', 'a가', '1a', '(', '㎡'],
+        [' ', '  ', '\n', ' \n ', '\r\n', '\t', '\xa0', '　'],
+        ['', '다', '다라', 'b', 'bc', '3', '34', '다b', '3.5', ')'],
+    )
+) + (_LOCALITY_PROBE, '가 나 다 라 1 2 a b', ' 가나 \n 다라 12 ab ')
+
+
+@lru_cache(maxsize=None)
+def _compile(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=64)
+def compile_rules(rules: Tuple[Tuple, ...]) -> List[Tuple[re.Pattern, str, int]]:
+    """규칙 리스트를 (컴파일된 패턴, 대체문자열, 반복횟수) 리스트로 변환 (규칙 세트별 1회)"""
+    return [(_compile(pattern), replacement, repeat) for pattern, replacement, _, repeat in rules]
+
+
+def _apply_compiled(text: str, pattern: re.Pattern, replacement: str, repeat: int) -> str:
+    if repeat == 0:
+        # 변화가 없을 때까지 반복
+        prev = None
+        while prev != text:
+            prev = text
+            text = pattern.sub(replacement, text)
+        return text
+    for _ in range(repeat):
+        text = pattern.sub(replacement, text)
+    return text
+
 
 def apply_normalize_rule(text: str, pattern: str, replacement: str, repeat: int = 1) -> str:
     """단일 정규화 규칙 적용
@@ -22,17 +78,81 @@ def apply_normalize_rule(text: str, pattern: str, replacement: str, repeat: int
     Returns:
         정규화된 텍스트
     """
-    if repeat == 0:
-        # 변화가 없을 때까지 반복
-        prev = None
-        while prev != text:
-            prev = text
-            text = re.sub(pattern, replacement, text)
-        return text
-    else:
-        for _ in range(repeat):
-            text = re.sub(pattern, replacement, text)
-        return text
+    return _apply_compiled(text, _compile(pattern), replacement, repeat)
+
+
+def _is_whitespace_local(pattern: re.Pattern, replacement: str) -> bool:
+    """규칙이 공백 문자만 지우거나 공백으로 바꾸는지 (확인용 문자열의 모든 매치가 공백으로만 구성)"""
+    if replacement.strip() or '\\' in replacement:
+        return False
+    for m in pattern.finditer(_LOCALITY_PROBE):
+        if m.group().strip() or (not m.group() and replacement):
+            return False
+    return True
+
+
+class _RunNormalizer:
+    """규칙 세트를 공백 구간 단위로 적용 (구간 + 앞/뒤 문자 -> 결과 캐시)"""
+
+    def __init__(self, compiled: List[Tuple[re.Pattern, str, int]]):
+        self.compiled = compiled
+        self.run = lru_cache(maxsize=65536)(self._run)
+
+    def _run(self, prev: Optional[str], run: str, nxt: Optional[str]) -> str:
+        # 규칙은 공백이 아닌 문자를 바꾸지 않으므로 앞/뒤 문자는 결과 양 끝에 그대로 남음
+        text = (prev or '') + run + (nxt or '')
+        for pattern, replacement, repeat in self.compiled:
+            text = _apply_compiled(text, pattern, replacement, repeat)
+        return text[1 if prev else 0:len(text) - (1 if nxt else 0)]
+
+    def cell_repl(self, m: re.Match) -> str:
+        s, start, end = m.string, m.start(), m.end()
+        prev = s[start - 1] if start else None
+        nxt = s[end] if end < len(s) else None
+        return self.run(prev, m.group(), nxt)
+
+    def table_repl(self, m: re.Match) -> str:
+        """테이블 블록의 공백 구간 치환 (줄 경계와 이스케이프되지 않은 '|'를 셀 경계로 취급)"""
+        s, start, end = m.string, m.start(), m.end()
+
+        prev = s[start - 1] if start else None
+        if prev == '\n' or (prev == '|' and (start < 2 or s[start - 2] != '\\')):
+            prev = None
+
+        nxt = s[end] if end < len(s) else None
+        if nxt == '\n' or nxt == '|':
+            nxt = None
+
+        return self.run(prev, m.group(), nxt)
+
+
+@lru_cache(maxsize=64)
+def run_normalizer(rules: Tuple[Tuple, ...]) -> Optional[_RunNormalizer]:
+    """규칙 세트의 공백 구간 단위 정규화기 (구간 단위 처리가 순차 적용과 다를 수 있으면 None - 규칙을 순서대로 적용)
+
+    각 규칙이 공백만 바꾸는지 확인한 뒤, 고정 표본에서 순차 적용 결과와 같은지 비교합니다.
+    (앞/뒤 한 글자보다 넓게 보는 규칙(예: (?<=[가-힣]{2})\\s+)은 비교에서 걸러짐)
+    """
+    compiled = compile_rules(rules)
+    if not all(_is_whitespace_local(pattern, replacement) for pattern, replacement, _ in compiled):
+        return None
+
+    normalizer = _RunNormalizer(compiled)
+    for sample in _LOCALITY_SAMPLES:
+        expected = sample
+        for pattern, replacement, repeat in compiled:
+            expected = _apply_compiled(expected, pattern, replacement, repeat)
+        if _CELL_WS_RUN_RE.sub(normalizer.cell_repl, sample) != expected:
+            return None
+    return normalizer
+
+
+_DEFAULT_RULES = tuple(CELL_NORMALIZE_RULES)
+if run_normalizer(_DEFAULT_RULES) is None:
+    warnings.warn(
+        "CELL_NORMALIZE_RULES를 공백 구간 단위로 처리할 수 없어 테이블 정규화를 규칙별 순차 적용으로 처리합니다 (느림)",
+        RuntimeWarning
+    )
 
 
 def normalize_cell_text(text: str, rules: List[Tuple] = None) -> str:
@@ -48,11 +168,13 @@ def normalize_cell_text(text: str, rules: List[Tuple] = None) -> str:
     if not text:
         return ""
 
-    rules = rules or CELL_NORMALIZE_RULES
+    rules = tuple(rules) if rules else _DEFAULT_RULES
+    normalizer = run_normalizer(rules)
+    if normalizer is not None:
+        return _CELL_WS_RUN_RE.sub(normalizer.cell_repl, text)
 
-    for rule in rules:
-        pattern, replacement, description, repeat = rule
-        text = apply_normalize_rule(text, pattern, replacement, repeat)
+    for pattern, replacement, repeat in compile_rules(rules):
+        text = _apply_compiled(text, pattern, replacement, repeat)
 
     return text
 
@@ -87,7 +209,7 @@ def _merge_broken_table_lines(lines: List[str]) -> List[str]:
             continue
 
         # 구분선(---|---|---)은 그대로
-        if re.match(r'^\|[\s\-:|]+\|$', stripped):
+        if _SEPARATOR_RE.match(stripped):
             if current_line:
                 merged.append(current_line)
                 current_line = ""
@@ -133,11 +255,34 @@ def _merge_broken_table_lines(lines: List[str]) -> List[str]:
     return merged
 
 
+def _is_table_row(line: str) -> bool:
+    """정규화 대상 테이블 행 여부 (빈 줄, 구분선, 테이블이 아닌 줄 제외)"""
+    stripped = line.strip()
+    return bool(stripped) and stripped.startswith('|') and not _SEPARATOR_RE.match(stripped)
+
+
+def _normalize_table_row_by_cell(line: str) -> str:
+    """테이블 행을 셀 단위로 정규화 (기본 규칙을 공백 구간 단위로 처리할 수 없을 때)"""
+    # 이스케이프된 파이프(\|)를 임시 문자로 대체
+    temp_line = line.replace('\\|', '\x00PIPE\x00')
+    cells = temp_line.split('|')
+
+    normalized_cells = []
+    for cell in cells:
+        # 임시 문자를 다시 이스케이프된 파이프로 복원
+        cell = cell.replace('\x00PIPE\x00', '\\|')
+        # 셀 내용 정규화
+        normalized_cells.append(normalize_cell_text(cell))
+
+    return '|'.join(normalized_cells)
+
+
 def normalize_markdown_table(markdown: str) -> str:
     """마크다운 테이블 전체 정규화
 
     테이블의 각 셀에 정규화 규칙을 적용합니다.
     여러 줄에 걸쳐 깨진 테이블 행도 처리합니다.
+    테이블 행들을 하나의 블록으로 묶어 공백 구간 치환 한 번으로 처리합니다.
 
     Args:
         markdown: 마크다운 테이블 문자열
@@ -153,39 +298,22 @@ def normalize_markdown_table(markdown: str) -> str:
     # 1단계: 깨진 테이블 행 병합
     lines = _merge_broken_table_lines(lines)
 
-    normalized_lines = []
-
-    for line in lines:
-        if not line.strip():
-            normalized_lines.append(line)
-            continue
-
-        # 구분선(---|---|---)은 그대로 유지
-        if re.match(r'^\|[\s\-:|]+\|$', line.strip()):
-            normalized_lines.append(line)
-            continue
+    # 2단계: 테이블 행만 정규화 (빈 줄, 구분선, 일반 텍스트는 그대로)
+    row_indices = [i for i, line in enumerate(lines) if _is_table_row(line)]
+    if not row_indices:
+        return '\n'.join(lines)
 
-        # 테이블 행이 아니면 그대로
-        if not line.strip().startswith('|'):
-            normalized_lines.append(line)
-            continue
-
-        # 테이블 셀 분리 및 정규화
-        # 이스케이프된 파이프(\|)를 임시 문자로 대체
-        temp_line = line.replace('\\|', '\x00PIPE\x00')
-        cells = temp_line.split('|')
-
-        normalized_cells = []
-        for cell in cells:
-            # 임시 문자를 다시 이스케이프된 파이프로 복원
-            cell = cell.replace('\x00PIPE\x00', '\\|')
-            # 셀 내용 정규화
-            normalized_cell = normalize_cell_text(cell)
-            normalized_cells.append(normalized_cell)
+    normalizer = run_normalizer(_DEFAULT_RULES)
+    if normalizer is not None:
+        block = '\n'.join(lines[i] for i in row_indices)
+        normalized_rows = _TABLE_WS_RUN_RE.sub(normalizer.table_repl, block).split('\n')
+    else:
+        normalized_rows = [_normalize_table_row_by_cell(lines[i]) for i in row_indices]
 
-        normalized_lines.append('|'.join(normalized_cells))
+    for i, row in zip(row_indices, normalized_rows):
+        lines[i] = row
 
-    return '\n'.join(normalized_lines)
+    return '\n'.join(lines)
 
 
 def normalize_dataframe_cell(value) -> str:
@@ -0,0 +1,105 @@
+"""테이블 정규화 동등성 검사
+
+table_preprocessor의 공백 구간 단위 정규화가 기존 방식(미컴파일 re.sub, 반복 적용(0) 규칙, 셀 단위 처리)과
+같은 결과를 내는지 무작위 코퍼스로 확인합니다. 정규화 규칙이나 모듈을 바꾼 뒤 실행하세요.
+
+사용 예:
+    python -m src.table_preprocessor_check
+    python -m src.table_preprocessor_check --cells 200000 --tables 50000 --seed 1
+"""
+import re
+import sys
+import random
+import argparse
+from typing import List
+
+from .table_preprocessor import normalize_cell_text, normalize_markdown_table, _merge_broken_table_lines
+
+# 기존 방식 (기준 구현) - 반복 적용(0) 규칙 + 셀 단위 처리
+REFERENCE_RULES = [
+    (r'([가-힣])\n([가-힣])', r'\1\2', 0),
+    (r'[\r\n]+', ' ', 1),
+    (r'([가-힣])\s([가-힣])', r'\1\2', 0),
+    (r'([가-힣])\s+(\d)', r'\1\2', 0),
+    (r'([가-힣])\s+([A-Za-z])', r'\1\2', 0),
+    (r'([A-Za-z])\s+(\d)', r'\1\2', 0),
+    (r'\s{2,}', ' ', 1),
+    (r'^\s+|\s+$', '', 1),
+]
+
+# 한글/영문/숫자/각종 공백(\r, \n, \t, NBSP, 전각 공백)/파이프/이스케이프 파이프 조합
+ALPHABET = list('가나다힣각') + list('aZx') + list('0179') + [
+    ' ', '  ', '\n', '\r', '\t', '\xa0', '　', '|', '\\|', '-', ':', '(', '.', '㎡'
+]
+
+
+def reference_cell(text: str) -> str:
+    if not text:
+        return ""
+    for pattern, replacement, repeat in REFERENCE_RULES:
+        if repeat == 0:
+            prev = None
+            while prev != text:
+                prev = text
+                text = re.sub(pattern, replacement, text)
+        else:
+            text = re.sub(pattern, replacement, text)
+    return text
+
+
+def reference_table(markdown: str) -> str:
+    if not markdown or not markdown.strip():
+        return markdown
+    out = []
+    for line in _merge_broken_table_lines(markdown.split('\n')):
+        stripped = line.strip()
+        if not stripped or re.match(r'^\|[\s\-:|]+\|$', stripped) or not stripped.startswith('|'):
+            out.append(line)
+            continue
+        cells = line.replace('\\|', '\x00PIPE\x00').split('|')
+        out.append('|'.join(reference_cell(c.replace('\x00PIPE\x00', '\\|')) for c in cells))
+    return '\n'.join(out)
+
+
+def rand_text(rng: random.Random, n: int) -> str:
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, n)))
+
+
+def rand_table(rng: random.Random) -> str:
+    lines = []
+    for _ in range(rng.randint(1, 6)):
+        k = rng.random()
+        if k < 0.5:
+            cells = '|'.join(rand_text(rng, 6) for _ in range(rng.randint(1, 4)))
+            lines.append('|' + cells + rng.choice(['|', '', ' |']))
+        elif k < 0.6:
+            lines.append(rng.choice(['|---|---|', '| :-- | --: |', '']))
+        else:
+            lines.append(rand_text(rng, 10))
+    return '\n'.join(lines)
+
+
+def check(cells: int, tables: int, seed: int) -> List[str]:
+    """무작위 셀/테이블 코퍼스에서 기준 구현과 다른 입력 목록"""
+    rng = random.Random(seed)
+    diff = [t for t in (rand_text(rng, 14) for _ in range(cells)) if normalize_cell_text(t) != reference_cell(t)]
+    diff += [t for t in (rand_table(rng) for _ in range(tables)) if normalize_markdown_table(t) != reference_table(t)]
+    return diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description="테이블 정규화 동등성 검사 (기존 방식과 비교)")
+    parser.add_argument('--cells', type=int, default=50_000)
+    parser.add_argument('--tables', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    diff = check(args.cells, args.tables, args.seed)
+    print(f"불일치 {len(diff)} / 셀 {args.cells} + 테이블 {args.tables}")
+    for text in diff[:10]:
+        print(repr(text))
+    sys.exit(1 if diff else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""공급 단위(단지/주택형) 표 추출 모듈
+
+Camelot으로 정규화된 마크다운 표(파싱 요소 'table')에서 단지/주택형별 면적·임대조건을 행 단위로 추출하여
+annc_unit에 저장합니다. 챗봇은 면적/임대료 질문과 공고 비교를 표 청크 검색 대신 SQL 조회로 답변합니다.
+
+추출 항목 (없으면 None):
+    complex_name(단지명), unit_type(주택형), exclusive_area/supply_area(㎡),
+    deposit/monthly_rent(원 단위 정수), supply_count(공급호수), page_num
+
+금액 단위는 헤더의 (천원)/(만원)/(원) 표기로 환산하고, 표기가 없으면 금액 크기로 천원 단위 여부를 추정합니다.
+"""
+import re
+from typing import List, Dict, Optional, Iterable
+
+# 마크다운 셀 구분자 (이스케이프된 \| 제외)
+_CELL_SPLIT_RE = re.compile(r'(?<!\\)\|')
+_SEPARATOR_RE = re.compile(r'^:?-{3,}:?$')
+_NUMBER_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+# 합계 행 (단지/주택형 칸 값)
+_TOTAL_LABELS = {'계', '합계', '소계', '총계', '합 계', '소 계'}
+
+MONEY_FIELDS = ('deposit', 'monthly_rent')
+UNIT_FIELDS = (
+    'complex_name', 'unit_type', 'exclusive_area', 'supply_area',
+    'deposit', 'monthly_rent', 'supply_count'
+)
+
+
+def split_markdown_row(line: str) -> List[str]:
+    """마크다운 표 1행 -> 셀 리스트 (앞뒤 경계 제거, \\| 복원)"""
+    cells = _CELL_SPLIT_RE.split(line.strip())
+    if cells and not cells[0].strip():
+        cells = cells[1:]
+    if cells and not cells[-1].strip():
+        cells = cells[:-1]
+    return [c.replace('\\|', '|').strip() for c in cells]
+
+
+def parse_markdown_table(markdown: str) -> List[List[str]]:
+    """마크다운 표 -> 행 리스트 (첫 행이 헤더, 구분선 제외)"""
+    rows = []
+    for line in markdown.split('\n'):
+        if not line.strip().startswith('|'):
+            continue
+        cells = split_markdown_row(line)
+        if cells and all(_SEPARATOR_RE.match(c.replace(' ', '')) for c in cells if c):
+            continue
+        rows.append(cells)
+    return rows
+
+
+def classify_header(header: str) -> Optional[str]:
+    """헤더 텍스트 -> 추출 항목명 (해당 없으면 None)
+
+    병합 헤더("임대조건 - 임대보증금", "면적(㎡) - 주거전용")도 처리합니다.
+    """
+    h = header.replace(' ', '')
+    if not h or '전환' in h:
+        return None
+    if '면적' in h or '㎡' in h or h in ('전용', '공급'):
+        if '전용' in h:
+            return 'exclusive_area'
+        if '공급' in h:
+            return 'supply_area'
+        return None
+    if '보증금' in h:
+        return 'deposit'
+    if '임대료' in h or '월세' in h:
+        return 'monthly_rent'
+    if any(kw in h for kw in ('호수', '세대수', '공급세대', '공급량', '모집호수')):
+        return 'supply_count'
+    if any(kw in h for kw in ('주택형', '공급형', '형별', '타입', '평형')):
+        return 'unit_type'
+    if any(kw in h for kw in ('단지', '주택명', '지구')):
+        return 'complex_name'
+    return None
+
+
+def money_multiplier(header: str) -> Optional[int]:
+    """금액 헤더의 단위 표기 -> 원 환산 배수 (표기 없으면 None)"""
+    h = header.replace(' ', '')
+    if '천원' in h:
+        return 1000
+    if '만원' in h:
+        return 10000
+    if '원' in h:
+        return 1
+    return None
+
+
+def parse_number(text: str) -> Optional[float]:
+    """셀의 첫 번째 숫자 (쉼표 제거), 없으면 None"""
+    match = _NUMBER_RE.search(text or '')
+    if not match:
+        return None
+    try:
+        return float(match.group().replace(',', ''))
+    except ValueError:
+        return None
+
+
+def to_won(value: Optional[float], field: str, multiplier: Optional[int]) -> Optional[int]:
+    """금액 -> 원 단위 정수
+
+    단위 표기가 없으면 크기로 추정: 보증금 100만 미만/월임대료 1만 미만이면 천원 단위
+    """
+    if value is None:
+        return None
+    if multiplier is None:
+        threshold = 1_000_000 if field == 'deposit' else 10_000
+        multiplier = 1000 if value < threshold else 1
+    return int(round(value * multiplier))
+
+
+def extract_units_from_table(markdown: str, page_num: int) -> List[Dict]:
+    """마크다운 표 1개 -> 공급 단위 행 리스트 (면적/임대조건 표가 아니면 빈 리스트)"""
+    rows = parse_markdown_table(markdown)
+    if len(rows) < 2:
+        return []
+
+    header = rows[0]
+    columns = {}  # 항목명 -> (열 인덱스, 금액 배수)
+    for idx, text in enumerate(header):
+        field = classify_header(text)
+        if field and field not in columns:
+            columns[field] = (idx, money_multiplier(text) if field in MONEY_FIELDS else None)
+
+    # 주택형/면적 열이 있고, 수치 항목이 하나 이상 있어야 공급 단위 표로 판단
+    numeric_fields = {'exclusive_area', 'supply_area', 'deposit', 'monthly_rent'}
+    if not ({'unit_type', 'exclusive_area'} & columns.keys()) or not (numeric_fields & columns.keys()):
+        return []
+
+    units = []
+    last_complex = None
+    for row in rows[1:]:
+        cell = lambda field: row[columns[field][0]] if field in columns and columns[field][0] < len(row) else ''
+
+        complex_name = cell('complex_name') or last_complex
+        unit_type = cell('unit_type') or None
+        if (complex_name or '').replace(' ', '') in _TOTAL_LABELS or (unit_type or '').replace(' ', '') in _TOTAL_LABELS:
+            continue
+        last_complex = complex_name
+
+        unit = {
+            'complex_name': complex_name or None,
+            'unit_type': unit_type,
+            'exclusive_area': parse_number(cell('exclusive_area')),
+            'supply_area': parse_number(cell('supply_area')),
+            'deposit': to_won(parse_number(cell('deposit')), 'deposit', columns.get('deposit', (0, None))[1]),
+            'monthly_rent': to_won(parse_number(cell('monthly_rent')), 'monthly_rent', columns.get('monthly_rent', (0, None))[1]),
+            'supply_count': None,
+            'page_num': page_num,
+        }
+        count = parse_number(cell('supply_count'))
+        if count is not None:
+            unit['supply_count'] = int(count)
+
+        if all(unit[f] is None for f in numeric_fields):
+            continue
+        units.append(unit)
+    return units
+
+
+def merge_units(units: Iterable[Dict]) -> List[Dict]:
+    """같은 (단지, 주택형) 행 병합 - 면적표와 임대조건표가 나뉜 공고에서 빈 항목을 채움 (첫 등장 순서 유지)"""
+    merged: Dict[tuple, Dict] = {}
+    result = []
+    for unit in units:
+        if not unit.get('unit_type'):
+            result.append(unit)
+            continue
+        key = (unit.get('complex_name') or '', unit['unit_type'].replace(' ', ''))
+        if key not in merged:
+            merged[key] = dict(unit)
+            result.append(merged[key])
+            continue
+        target = merged[key]
+        for field in UNIT_FIELDS:
+            if target.get(field) is None and unit.get(field) is not None:
+                target[field] = unit[field]
+    return result
+
+
+def extract_units(elements: Iterable) -> List[Dict]:
+    """파싱 요소(ParsedElement) 리스트의 표에서 공급 단위 추출"""
+    units = []
+    for elem in elements:
+        if elem.element_type == 'table':
+            units.extend(extract_units_from_table(elem.content, elem.page_number))
+    return merge_units(units)
@@ -0,0 +1,159 @@
+# chatbot/answer_cache.py
+"""
+상세 질문 답변 캐시
+- 인기 공고에 여러 사용자가 같은 질문("임대료 알려줘", "신청자격이 뭐야?")을 하면 LLM 호출 없이 답변 재사용
+- 키: (공고 ID, 정규화 질문, 검색된 청크 ID 집합, 코퍼스 버전(활성 세대), 프롬프트 버전)
+- 공고 청크가 바뀌면(새 세대 활성화) 키가 달라지므로 이전 답변은 더 이상 조회되지 않고 TTL로 만료
+- 값은 LLM 본문만 저장 (D-day/후속 질문/원문 링크는 응답 시 매번 새로 렌더링)
+"""
+import re
+import json
+import hashlib
+import threading
+from typing import Iterable, Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+
+from . import metrics
+from .services import strip_particles
+
+CACHE_ALIAS = 'answers'
+KEY_PREFIX = 'detail_answer'
+
+# 질문 유형 (키워드만으로 이루어진 질문은 같은 유형으로 통일)
+QUESTION_CATEGORIES = {
+    'eligibility': ('신청자격', '입주자격', '자격', '자격요건', '요건', '대상', '신청대상', '입주대상'),
+    'area': ('면적', '평수', '전용면적', '공급면적', '계약면적', '평형'),
+    'rent': ('임대료', '보증금', '월세', '월임대료', '임대보증금'),
+    'schedule': ('신청기간', '접수기간', '기간', '일정', '언제', '마감', '마감일', '발표일', '입주일'),
+    'documents': ('서류', '필요서류', '제출서류', '구비서류'),
+    'how_to_apply': ('신청방법', '접수방법', '청약방법'),
+}
+
+# 의미 없는 요청/어미 표현 (정규화 시 제거)
+FILLER_WORDS = (
+    '알려줘', '알려줘요', '알려주세요', '알려줄래', '알려줄래요', '뭐야', '뭐예요', '뭔가요', '무엇인가요',
+    '어떻게', '돼', '되나요', '얼마야', '얼마예요', '얼마인가요', '궁금해', '궁금해요', '궁금합니다',
+    '좀', '혹시', '정보', '확인', '해줘', '해주세요', '있어', '있나요',
+)
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_ENDING_RE = re.compile(r'(은요|는요|이요|요)$')
+
+_KEYWORD_CATEGORY = {kw: cat for cat, kws in QUESTION_CATEGORIES.items() for kw in kws}
+
+
+def _normalize_word(word: str) -> str:
+    """단어 정규화 - 어미/조사를 뗀 형태 중 키워드가 있으면 키워드, 없으면 조사만 제거"""
+    for candidate in (word, _ENDING_RE.sub('', word)):
+        for form in (candidate, strip_particles(candidate)):
+            if form in _KEYWORD_CATEGORY:
+                return form
+    return strip_particles(word)
+
+
+def canonicalize_question(question: str) -> str:
+    """
+    질문 정규화
+    - 구두점/조사/요청 표현 제거 후 공백 통일
+    - 남은 단어가 모두 한 유형의 키워드면 'cat:<유형>', 아니면 'q:<정규화 텍스트>'
+    """
+    text = _PUNCT_RE.sub(' ', question.lower())
+    words = [_normalize_word(w) for w in text.split() if w not in FILLER_WORDS]
+    words = [w for w in words if w and w not in FILLER_WORDS]
+    if not words:
+        return f"q:{' '.join(text.split())}"
+
+    categories = {_KEYWORD_CATEGORY.get(w) for w in words}
+    if len(categories) == 1 and None not in categories:
+        return f"cat:{categories.pop()}"
+    return f"q:{' '.join(words)}"
+
+
+def question_category(question: str) -> Optional[str]:
+    """키워드만으로 이루어진 질문의 유형 (예: "임대료 알려줘" -> 'rent'), 아니면 None"""
+    canonical = canonicalize_question(question)
+    return canonical[4:] if canonical.startswith('cat:') else None
+
+
+def make_key(annc_id, question: str, chunk_ids: Iterable, corpus_version, prompt_version: str,
+             annc_fields: Iterable = ()) -> str:
+    """캐시 키 (청크 ID는 순서와 무관한 집합으로 취급, annc_fields는 프롬프트에 들어가는 공고 필드 값 - 예: 상태/마감일)"""
+    payload = json.dumps(
+        [canonicalize_question(question), sorted({int(c) for c in chunk_ids if c is not None}),
+         corpus_version, prompt_version, [None if v is None else str(v) for v in annc_fields]],
+        ensure_ascii=False
+    )
+    return f"{KEY_PREFIX}:{annc_id}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class AnswerCache:
+    """상세 답변 캐시 + 적중률 통계 (프로세스 단위 누적)"""
+
+    def __init__(self, alias: str = CACHE_ALIAS):
+        self.alias = alias
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.lock = threading.Lock()
+
+    @property
+    def backend(self):
+        try:
+            return caches[self.alias]
+        except InvalidCacheBackendError:
+            return caches['default']
+
+    def get(self, key: str) -> Optional[str]:
+        answer = self.backend.get(key)
+        with self.lock:
+            if answer is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return answer
+
+    def set(self, key: str, answer: str, timeout: Optional[int] = None):
+        kwargs = {} if timeout is None else {'timeout': timeout}
+        self.backend.set(key, answer, **kwargs)
+        with self.lock:
+            self.stores += 1
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_answer_cache = None
+
+
+def get_answer_cache() -> AnswerCache:
+    """답변 캐시 싱글톤"""
+    global _answer_cache
+    if _answer_cache is None:
+        _answer_cache = AnswerCache()
+    return _answer_cache
+
+
+def _collect_metrics() -> list:
+    """/api/metrics 노출용 답변 캐시 통계 (프로세스 단위 누적)"""
+    stats = get_answer_cache().stats()
+    lines = []
+    for name, help_text, metric_type, value in (
+        ('zipfit_answer_cache_hits_total', '상세 답변 캐시 적중 수', 'counter', stats['hits']),
+        ('zipfit_answer_cache_misses_total', '상세 답변 캐시 미적중 수', 'counter', stats['misses']),
+        ('zipfit_answer_cache_stores_total', '상세 답변 캐시 저장 수', 'counter', stats['stores']),
+        ('zipfit_answer_cache_hit_ratio', '상세 답변 캐시 적중률', 'gauge', stats['hit_rate']),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}", f"{name} {value}"]
+    return lines
+
+
+metrics.register_collector(_collect_metrics)
@@ -0,0 +1,204 @@
+# chatbot/context_packer.py
+"""
+프롬프트 컨텍스트 패커
+- 노드별 토큰 예산 안에서 검색 청크를 프롬프트 컨텍스트로 구성
+- 같은 청크/겹치는 청크(청킹 오버랩)/거의 같은 청크 제거
+- 점수(rrf_score) 순 정렬 (점수가 없는 보강 문서 - 공급 단위 표, 키워드 보강 청크 - 는 입력 순서대로 맨 앞)
+- 예산을 넘는 청크는 표는 행 단위, 본문은 문장 단위로 잘라 표가 중간에 끊기지 않게 함
+- 사용 토큰 수 등 통계를 debug_info로 보고
+"""
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+_encoding = None  # None: 아직 로드 전, False: 사용 불가 (추정치 사용)
+
+# 거의 같은 청크 판단: 단어 n-gram 중 이 비율 이상이 이미 포함된 청크에 있으면 제외
+SHINGLE_SIZE = 5
+NEAR_DUPLICATE_RATIO = 0.8
+# 예산이 이보다 적게 남으면 잘라서 넣지 않음
+MIN_PARTIAL_TOKENS = 60
+
+_SENTENCE_RE = re.compile(r'(?<=[.!?。])\s+|\n+')
+
+
+def _get_encoding():
+    """gpt-4o 계열 토크나이저 (첫 사용 시 로드 - BPE 파일 다운로드 실패/미설치면 False)"""
+    global _encoding
+    if _encoding is None:
+        try:
+            _encoding = tiktoken.get_encoding("o200k_base") if tiktoken else False
+        except Exception as e:
+            logger.warning(f"tiktoken 로드 실패 (토큰 수 추정치 사용): {e}")
+            _encoding = False
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """토큰 수 (tiktoken을 쓸 수 없으면 UTF-8 바이트 / 2로 추정)"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if not encoding:
+        return max(1, len(text.encode('utf-8')) // 2)
+    return len(encoding.encode_ordinary(text))
+
+
+def _hard_cut(text: str, max_tokens: int) -> str:
+    """경계 없이 토큰 수로 자르기 (한 행/문장이 예산보다 긴 경우)"""
+    encoding = _get_encoding()
+    if not encoding:
+        return text.encode('utf-8')[:max_tokens * 2].decode('utf-8', errors='ignore')
+    return encoding.decode(encoding.encode_ordinary(text)[:max_tokens])
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    max_tokens 이하로 자르기 - 표는 행 단위(헤더/구분선 유지), 본문은 문장 단위
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    lines = text.split('\n')
+    table_rows = [i for i, line in enumerate(lines) if line.strip().startswith('|')]
+    if len(table_rows) >= 3:
+        # 표 앞 제목 + 헤더/구분선은 고정, 데이터 행을 앞에서부터 채움
+        head_end = table_rows[0] + 2
+        units, kept = lines[head_end:], lines[:head_end]
+        separator = '\n'
+    else:
+        units, kept = [u for u in _SENTENCE_RE.split(text) if u and u.strip()], []
+        separator = ' '
+
+    used = count_tokens('\n'.join(kept))
+    if used > max_tokens:
+        return _hard_cut(text, max_tokens)
+
+    body = []
+    for unit in units:
+        unit_tokens = count_tokens(unit) + 1
+        if used + unit_tokens > max_tokens:
+            break
+        body.append(unit)
+        used += unit_tokens
+
+    if not body and not kept:
+        return _hard_cut(text, max_tokens)
+    if kept:
+        return '\n'.join(kept + body)
+    return separator.join(body)
+
+
+def _shingles(text: str) -> set:
+    words = text.split()
+    if len(words) < SHINGLE_SIZE:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+@dataclass
+class PackedContext:
+    """패킹 결과"""
+    text: str
+    docs: List[dict]                 # 컨텍스트에 포함된 문서 (포함 순서)
+    tokens: int
+    budget: int
+    dropped_duplicates: int = 0
+    dropped_over_budget: int = 0
+    truncated: List = field(default_factory=list)   # 잘라서 넣은 문서의 chunk_id
+
+    def stats(self) -> dict:
+        return {
+            "tokens": self.tokens,
+            "budget": self.budget,
+            "docs": len(self.docs),
+            "dropped_duplicates": self.dropped_duplicates,
+            "dropped_over_budget": self.dropped_over_budget,
+            "truncated": len(self.truncated),
+        }
+
+
+def order_by_score(docs: List[dict], score_key: str = 'rrf_score') -> List[dict]:
+    """점수 없는 보강 문서는 입력 순서대로 앞, 나머지는 점수 내림차순 (동점은 입력 순서)"""
+    pinned = [d for d in docs if d.get(score_key) is None]
+    scored = sorted((d for d in docs if d.get(score_key) is not None), key=lambda d: -float(d[score_key]))
+    return pinned + scored
+
+
+def pack_context(
+    docs: List[dict],
+    budget: int,
+    render: Callable[[dict, str], str],
+    max_doc_tokens: Optional[int] = None,
+    separator: str = "\n\n",
+    score_key: str = 'rrf_score',
+) -> PackedContext:
+    """
+    토큰 예산 안에서 문서를 컨텍스트 문자열로 구성
+
+    :param docs: 검색 결과 (chunk_id, chunk_text, 점수 등)
+    :param budget: 컨텍스트 전체 토큰 예산
+    :param render: (문서, 본문) -> 컨텍스트 항목 문자열 (출처 표기 포함)
+    :param max_doc_tokens: 문서 1건 본문 토큰 상한 (None이면 예산 내 제한 없음)
+    :return: PackedContext
+    """
+    seen_ids, kept_shingles = set(), []
+    parts, used_docs, truncated = [], [], []
+    used, dropped_dup, dropped_budget = 0, 0, 0
+    sep_tokens = count_tokens(separator)
+
+    for doc in order_by_score(docs, score_key):
+        chunk_id = doc.get('chunk_id')
+        text = (doc.get('chunk_text') or '').strip()
+        if not text or (chunk_id is not None and chunk_id in seen_ids):
+            dropped_dup += 1
+            continue
+
+        # 이미 넣은 청크에 대부분 포함된 청크(오버랩/거의 같은 청크) 제외
+        shingles = _shingles(text)
+        if shingles and any(len(shingles & kept) / len(shingles) >= NEAR_DUPLICATE_RATIO for kept in kept_shingles):
+            dropped_dup += 1
+            continue
+
+        remaining = budget - used - (sep_tokens if parts else 0)
+        overhead = count_tokens(render(doc, ''))
+        limit = remaining - overhead
+        if max_doc_tokens is not None:
+            limit = min(limit, max_doc_tokens)
+        if limit < MIN_PARTIAL_TOKENS and count_tokens(text) > limit:
+            dropped_budget += 1
+            continue
+
+        body = trim_to_tokens(text, limit)
+        if body != text:
+            truncated.append(chunk_id)
+        item = render(doc, body)
+        item_tokens = count_tokens(item)
+        if item_tokens > remaining:
+            dropped_budget += 1
+            continue
+
+        parts.append(item)
+        used += item_tokens + (sep_tokens if len(parts) > 1 else 0)
+        used_docs.append(doc)
+        kept_shingles.append(shingles)
+        if chunk_id is not None:
+            seen_ids.add(chunk_id)
+
+    return PackedContext(
+        text=separator.join(parts),
+        docs=used_docs,
+        tokens=used,
+        budget=budget,
+        dropped_duplicates=dropped_dup,
+        dropped_over_budget=dropped_budget,
+        truncated=truncated,
+    )
@@ -0,0 +1,86 @@
+# chatbot/conversation_summary.py
+"""
+세션별 롤링 대화 요약
+- 노드에는 원문 히스토리 대신 (요약 + 아직 요약되지 않은 최근 메시지)를 전달 -> 대화가 길어져도 프롬프트 크기 일정
+- 턴이 끝나면 최근 메시지(RECENT_HISTORY_MESSAGES)보다 오래된 메시지를 기존 요약에 합침 (백그라운드 스레드)
+- 요약과 요약에 포함된 메시지 수(summarized_count)는 세션 상태에 함께 저장
+  (요약이 끝나기 전에 다음 턴이 오면 이전 요약 + 그 뒤 메시지를 사용하고, 다음 갱신에서 함께 합침)
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, List, Optional
+
+from django.db import connections
+
+from .graph import call_llm, ChatbotConfig
+from .prompts import CONVERSATION_SUMMARY
+
+logger = logging.getLogger(__name__)
+
+# 요약 대상 메시지 1건 최대 길이 (긴 표 답변은 앞부분만)
+SUMMARY_INPUT_MESSAGE_CHARS = 1000
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='conversation-summary')
+
+
+def messages_to_fold(chat_history: List[dict], summarized_count: int = 0) -> List[dict]:
+    """요약에 새로 합칠 메시지 (최근 RECENT_HISTORY_MESSAGES개는 원문 유지)"""
+    fold_until = len(chat_history) - ChatbotConfig.RECENT_HISTORY_MESSAGES
+    if fold_until <= summarized_count:
+        return []
+    return chat_history[summarized_count:fold_until]
+
+
+def summarize(prev_summary: str, messages: List[dict]) -> str:
+    """기존 요약 + 새 메시지 -> 새 요약 (LLM)"""
+    conv = "\n".join(
+        f"{'사용자' if m['role'] == 'user' else '챗봇'}: {m['content'][:SUMMARY_INPUT_MESSAGE_CHARS]}"
+        for m in messages
+    )
+    prompt = CONVERSATION_SUMMARY.render(
+        f"# 기존 요약\n{prev_summary or '없음'}",
+        f"# 새 대화 메시지\n{conv}"
+    )
+    summary = call_llm(prompt, "요약을 갱신해줘", temp=0).strip()
+    return summary[:ChatbotConfig.SUMMARY_MAX_CHARS]
+
+
+def update_summary(prev_summary: str, chat_history: List[dict], summarized_count: int = 0) -> Optional[dict]:
+    """
+    오래된 메시지를 요약에 합침 (동기)
+
+    :return: {"conversation_summary", "summarized_count"} 또는 합칠 메시지가 없으면 None
+    """
+    messages = messages_to_fold(chat_history, summarized_count)
+    if not messages:
+        return None
+    return {
+        "conversation_summary": summarize(prev_summary, messages),
+        "summarized_count": summarized_count + len(messages),
+    }
+
+
+def _run_update(prev_summary: str, chat_history: List[dict], summarized_count: int,
+                on_done: Callable[[dict], None]):
+    try:
+        update = update_summary(prev_summary, chat_history, summarized_count)
+        if update:
+            on_done(update)
+    except Exception as e:
+        # 요약 실패는 응답에 영향 없음 (다음 턴에서 같은 구간부터 다시 시도)
+        logger.warning(f"Conversation summary update failed: {e}")
+    finally:
+        # 작업 스레드의 DB 연결 정리
+        connections.close_all()
+
+
+def schedule_summary_update(prev_summary: str, chat_history: List[dict], summarized_count: int,
+                            on_done: Callable[[dict], None]) -> Optional[Future]:
+    """
+    턴 종료 후 요약 갱신을 백그라운드로 실행, 완료되면 on_done(update)으로 세션 상태에 저장
+
+    :return: Future (합칠 메시지가 없으면 None)
+    """
+    if not messages_to_fold(chat_history, summarized_count):
+        return None
+    return _executor.submit(_run_update, prev_summary, list(chat_history), summarized_count, on_done)
@@ -15,9 +15,16 @@ from langgraph.graph import StateGraph, END
 from openai import OpenAI
 from decouple import config
 
-from .services import AnncAllService, DocChunkService
+from .services import AnncAllService, DocChunkService, AnncProfileService, AnncUnitService, AnncEligibilityService
+from .answer_cache import get_answer_cache, make_key as make_answer_cache_key, question_category
+from .context_packer import pack_context
+from . import metrics
+from .prompts import (
+    INTENT, EXPAND_QUERY, CHAT, SEARCH_RESPONSE, DETAIL_RESPONSE, COMPARE_RESPONSE
+)
 
-client = OpenAI(api_key=config('OPENAI_API_KEY'))
+# OPENAI_BASE_URL: OpenAI 호환 서버(로컬 스텁 openai_stub.py 등) 사용 시 지정, 없으면 OpenAI API
+client = OpenAI(api_key=config('OPENAI_API_KEY'), base_url=config('OPENAI_BASE_URL', default=None))
 
 # Tavily (선택적)
 TAVILY_API_KEY = config('TAVILY_API_KEY', default=None)
@@ -40,8 +47,19 @@ class ChatbotConfig:
     LLM_MODEL = "gpt-4o-mini"
     EMBEDDING_MODEL = "text-embedding-3-small"
     MAX_HISTORY_TURNS = 10
+    # 노드에 원문으로 넘기는 최근 메시지 수 (그 이전은 롤링 요약으로 대체)
+    RECENT_HISTORY_MESSAGES = 4
+    HISTORY_MESSAGE_CHARS = 500
+    SUMMARY_MAX_CHARS = 800
     MAX_SEARCH_HISTORY = 5
     RAG_TOP_K = 15
+    ANSWER_CACHE_TTL = 60 * 60 * 24
+    # 섹션 카테고리로 범위를 좁힌 상세 검색 (결과가 SCOPED_MIN_DOCS 미만이면 전체 청크로 재검색)
+    SCOPED_RAG_TOP_K = 10
+    SCOPED_MIN_DOCS = 3
+    # 응답 생성 노드별 문서 컨텍스트 토큰 예산 / 문서 1건 상한 (None이면 예산 내 제한 없음)
+    CONTEXT_TOKEN_BUDGETS = {"detail": 6000, "search": 1500, "compare": 2500}
+    CONTEXT_DOC_TOKEN_LIMITS = {"detail": None, "search": 250, "compare": 400}
 
     _cache: Dict[str, Any] = {}
     _cache_ttl = 300
@@ -52,11 +70,12 @@ class ChatbotConfig:
             return
         from .models import AnncAll
         active = AnncAll.objects.filter(service_status='OPEN')
+        # 정렬해서 프롬프트의 DB 메타데이터 섹션이 요청마다 같은 바이트가 되도록 함
         cls._cache = {
-            "regions": list(active.values_list('annc_region', flat=True).distinct()),
-            "statuses": list(active.values_list('annc_status', flat=True).distinct()),
-            "types": list(active.values_list('annc_type', flat=True).distinct()),
-            "dtl_types": list(active.values_list('annc_dtl_type', flat=True).distinct()),
+            "regions": list(active.order_by('annc_region').values_list('annc_region', flat=True).distinct()),
+            "statuses": list(active.order_by('annc_status').values_list('annc_status', flat=True).distinct()),
+            "types": list(active.order_by('annc_type').values_list('annc_type', flat=True).distinct()),
+            "dtl_types": list(active.order_by('annc_dtl_type').values_list('annc_dtl_type', flat=True).distinct()),
             "time": time.time()
         }
 
@@ -82,7 +101,8 @@ class Intent:
 # =============================================================================
 class GraphState(TypedDict):
     question: str
-    chat_history: List[dict]
+    chat_history: List[dict]    # 요약되지 않은 최근 메시지
+    conversation_summary: str   # 이전 대화 롤링 요약
     # 의도 관련
     intent: str
     intent_data: dict
@@ -92,6 +112,12 @@ class GraphState(TypedDict):
     selected_annc: Optional[dict]
     selected_anncs: List[dict]  # 비교용 다중 선택
     retrieved_docs: List[dict]
+    # 구조화 프로필 (수집 시 추출) - 있으면 RAG/LLM 없이 답변
+    profile_answer: Optional[dict]      # 상세 질문: {field, value}
+    annc_profiles: Dict[int, dict]      # 비교: {annc_id: 프로필}
+    # 공급 단위 (수집 시 공고문 표에서 추출) - 면적/임대료는 SQL 조회 결과로 답변
+    unit_answer: Optional[dict]         # 상세 질문: {category, units}
+    annc_units: Dict[int, List[dict]]   # 비교: {annc_id: 공급 단위 리스트}
     # 사용자 프로필 (참고용)
     user_profile: Optional[dict]  # {ref_hope_area, ref_age, ref_marriged, ref_children, ref_income}
     # 출력
@@ -103,10 +129,20 @@ class GraphState(TypedDict):
 # 유틸리티
 # =============================================================================
 def get_embedding(text: str) -> List[float]:
-    resp = client.embeddings.create(input=text, model=ChatbotConfig.EMBEDDING_MODEL)
+    with metrics.timed('embedding', ChatbotConfig.EMBEDDING_MODEL) as rec:
+        resp = client.embeddings.create(input=text, model=ChatbotConfig.EMBEDDING_MODEL)
+        metrics.set_usage(rec, getattr(resp, 'usage', None))
     return resp.data[0].embedding
 
 
+def create_chat_completion(**kwargs):
+    """chat.completions 호출 + 소요 시간/토큰 기록 (call_llm, general_chat 공용)"""
+    with metrics.timed('llm', kwargs.get("model", ChatbotConfig.LLM_MODEL)) as rec:
+        resp = client.chat.completions.create(**kwargs)
+        metrics.set_usage(rec, getattr(resp, 'usage', None))
+    return resp
+
+
 def call_llm(system: str, user: str, json_mode: bool = False, temp: float = 0) -> str:
     kwargs = {
         "model": ChatbotConfig.LLM_MODEL,
@@ -115,7 +151,7 @@ def call_llm(system: str, user: str, json_mode: bool = False, temp: float = 0) -
     }
     if json_mode:
         kwargs["response_format"] = {"type": "json_object"}
-    return client.chat.completions.create(**kwargs).choices[0].message.content
+    return create_chat_completion(**kwargs).choices[0].message.content
 
 
 def calculate_dday(deadline: str) -> str:
@@ -135,6 +171,205 @@ def calculate_dday(deadline: str) -> str:
         return ""
 
 
+def render_dday_notice(deadline: str) -> str:
+    """마감일/D-day 안내 (캐시된 답변에도 매번 오늘 기준으로 계산)"""
+    dday = calculate_dday(deadline)
+    if not dday:
+        return ""
+    notice = f"⏰ 마감일: {deadline} ({dday})"
+    if dday == "D-Day":
+        notice += "\n⚠️ 오늘이 마감일입니다!"
+    elif dday.startswith("D-") and int(dday[2:]) <= 7:
+        notice += "\n⚠️ 마감이 얼마 남지 않았습니다. 서둘러 신청하세요!"
+    return notice
+
+
+# 구조화 프로필 항목 (AnncProfile 컬럼 -> 표시명)
+PROFILE_FIELD_LABELS = {
+    'eligibility': '신청자격',
+    'rent': '임대조건(보증금/월세)',
+    'area': '전용면적',
+    'schedule': '신청기간/일정',
+    'documents': '제출서류',
+}
+
+
+def format_page_refs(pages: List[int]) -> str:
+    return f"(p{', p'.join(map(str, pages))} 참조)" if pages else ""
+
+
+def render_profile_field(field: str, value: dict) -> str:
+    """프로필 항목 1개 -> 상세 답변"""
+    refs = format_page_refs(value.get('pages', []))
+    return f"**{PROFILE_FIELD_LABELS[field]}**\n\n{value.get('detail', '')}" + (f"\n\n📄 {refs}" if refs else "")
+
+
+def render_profile_overview(annc: dict, profile: dict) -> str:
+    """공고 선택 시 프로필 요약 답변"""
+    lines = [
+        f"**{annc.get('annc_title', '')}** 공고 요약이에요.",
+        "",
+        f"- 지역: {annc.get('annc_region', '정보없음')}",
+        f"- 유형: {annc.get('annc_dtl_type', '')}",
+        f"- 상태: {annc.get('annc_status', '')}",
+    ]
+    for field, label in PROFILE_FIELD_LABELS.items():
+        value = profile.get(field)
+        if value:
+            lines.append(f"- **{label}**: {value.get('summary', '')} {format_page_refs(value.get('pages', []))}".rstrip())
+    lines += ["", "항목별 자세한 내용은 \"임대료 알려줘\", \"신청자격 알려줘\"처럼 물어보세요."]
+    return "\n".join(lines)
+
+
+def render_profile_comparison(anncs: List[dict], profiles: Dict[int, dict], units: Dict[int, List[dict]] = None) -> str:
+    """프로필 기반 공고 비교표 (면적/임대조건은 공급 단위가 있으면 표 수치 요약으로 대체)"""
+    unit_summaries = {annc_id: summarize_units(annc_units) for annc_id, annc_units in (units or {}).items()}
+    cell = lambda text: str(text).replace('|', '\\|').replace('\n', ' ')
+    header = "| 항목 | " + " | ".join(cell(a.get('annc_title', '')) for a in anncs) + " |"
+    rows = [header, "|" + "------|" * (len(anncs) + 1)]
+    rows.append("| 지역 | " + " | ".join(cell(a.get('annc_region', '정보없음')) for a in anncs) + " |")
+    rows.append("| 유형 | " + " | ".join(cell(a.get('annc_dtl_type', '')) for a in anncs) + " |")
+    rows.append("| 마감 | " + " | ".join(
+        cell(f"{a.get('annc_deadline_dt', '정보없음')} ({calculate_dday(a.get('annc_deadline_dt', ''))})".replace(' ()', '')) for a in anncs
+    ) + " |")
+    for field, label in PROFILE_FIELD_LABELS.items():
+        values = []
+        for a in anncs:
+            unit_value = unit_summaries.get(a['annc_id'], {}).get(field)
+            if unit_value:
+                values.append(cell(unit_value))
+                continue
+            value = profiles.get(a['annc_id'], {}).get(field)
+            values.append(cell(f"{value.get('summary', '')} {format_page_refs(value.get('pages', []))}".strip()) if value else "정보 없음")
+        rows.append(f"| {label} | " + " | ".join(values) + " |")
+
+    first_name = anncs[0].get('annc_title', '').split()[0] if anncs[0].get('annc_title') else ''
+    return (
+        f"요청하신 {len(anncs)}개 공고를 비교했어요.\n\n" + "\n".join(rows)
+        + f"\n\n'{first_name} 공고 자세히 알려줘'로 더 자세한 정보를 확인해보세요!"
+    )
+
+
+# 공급 단위(AnncUnit)로 바로 답변하는 질문 유형
+UNIT_ANSWER_CATEGORIES = {
+    'area': '공급형별 면적',
+    'rent': '공급형별 임대조건',
+}
+
+# 면적/임대료 질문 키워드 (공급 단위 조회 대상)
+TABLE_QUESTION_KEYWORDS = ['면적', '임대료', '보증금', '월세', '계약면적', '전용면적', '평수']
+
+
+# 상세 질문 키워드 -> 청크 섹션 카테고리 (doc_chunks.section_category, 적재 시 분류)
+SECTION_QUESTION_KEYWORDS = {
+    'eligibility': ('자격', '대상', '요건', '무주택', '연령', '나이'),
+    'income_asset': ('소득', '자산', '자동차'),
+    'area': ('면적', '평수', '평형', '㎡'),
+    'rent': ('임대료', '보증금', '월세'),
+    'schedule': ('기간', '일정', '언제', '마감', '발표', '계약', '입주일'),
+    'documents': ('서류', '증명서'),
+}
+# 신청자격 질문은 소득/자산 기준 섹션도 함께 검색
+RELATED_SECTIONS = {'eligibility': ('income_asset',)}
+MAX_QUESTION_SECTIONS = 2
+
+
+def question_sections(question: str) -> Optional[List[str]]:
+    """질문이 해당하는 청크 섹션 카테고리 (없거나 여러 주제에 걸친 질문이면 None -> 전체 검색)"""
+    category = question_category(question)
+    matched = [category] if category in SECTION_QUESTION_KEYWORDS else [
+        section for section, keywords in SECTION_QUESTION_KEYWORDS.items()
+        if any(kw in question for kw in keywords)
+    ]
+    if not matched or len(matched) > MAX_QUESTION_SECTIONS:
+        return None
+    return matched + [r for m in matched for r in RELATED_SECTIONS.get(m, ()) if r not in matched]
+
+
+def format_won(amount: Optional[int]) -> str:
+    """원 단위 금액 -> "1,234만 5,000원" 형식"""
+    if amount is None:
+        return "-"
+    man, won = divmod(int(amount), 10000)
+    if not man:
+        return f"{won:,}원"
+    return f"{man:,}만원" if not won else f"{man:,}만 {won:,}원"
+
+
+def format_area(area: Optional[float]) -> str:
+    return "-" if area is None else f"{area:g}㎡"
+
+
+def render_unit_table(units: List[dict]) -> str:
+    """공급 단위 -> 마크다운 표 (값이 하나도 없는 열은 생략)"""
+    columns = [
+        ('complex_name', '단지', lambda v: v),
+        ('unit_type', '주택형', lambda v: v),
+        ('exclusive_area', '전용면적', format_area),
+        ('supply_area', '공급면적', format_area),
+        ('deposit', '임대보증금', format_won),
+        ('monthly_rent', '월임대료', format_won),
+        ('supply_count', '공급호수', lambda v: f"{v:,}호"),
+        ('page_num', '페이지', lambda v: f"p{v}"),
+    ]
+    columns = [c for c in columns if any(u.get(c[0]) is not None for u in units)]
+    cell = lambda text: str(text).replace('|', '\\|').replace('\n', ' ')
+    rows = [
+        "| " + " | ".join(label for _, label, _ in columns) + " |",
+        "|" + "------|" * len(columns),
+    ]
+    for u in units:
+        rows.append("| " + " | ".join(
+            cell(fmt(u[field])) if u.get(field) is not None else "-" for field, _, fmt in columns
+        ) + " |")
+    return "\n".join(rows)
+
+
+def render_unit_answer(category: str, units: List[dict]) -> str:
+    """면적/임대료 질문 -> 공급 단위 표 답변 (공고문 표 수치 그대로)"""
+    pages = sorted({u['page_num'] for u in units if u.get('page_num') is not None})
+    refs = format_page_refs(pages)
+    return (
+        f"**{UNIT_ANSWER_CATEGORIES[category]}**\n\n{render_unit_table(units)}"
+        + (f"\n\n📄 공고문 표 기준 {refs}" if refs else "")
+    )
+
+
+def _value_range(values: List, fmt) -> str:
+    values = [v for v in values if v is not None]
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    return fmt(low) if low == high else f"{fmt(low)}~{fmt(high)}"
+
+
+def summarize_units(units: List[dict]) -> Dict[str, str]:
+    """공급 단위 -> 비교표용 한 줄 요약 {'area': ..., 'rent': ...} (값이 없는 항목은 제외)"""
+    summary = {}
+    area = _value_range([u.get('exclusive_area') for u in units], format_area)
+    if area:
+        types = {u['unit_type'] for u in units if u.get('unit_type')}
+        summary['area'] = f"전용 {area}" + (f" ({len(types)}개 주택형)" if types else "")
+    deposit = _value_range([u.get('deposit') for u in units], format_won)
+    rent = _value_range([u.get('monthly_rent') for u in units], format_won)
+    if deposit or rent:
+        summary['rent'] = " / ".join(p for p in (deposit and f"보증금 {deposit}", rent and f"월 {rent}") if p)
+    return summary
+
+
+def unit_table_doc(annc_id: int, units: List[dict]) -> dict:
+    """공급 단위 표를 상세 답변 컨텍스트용 문서로 변환 (면적/임대 표 청크 대신 사용)"""
+    pages = [u['page_num'] for u in units if u.get('page_num') is not None]
+    return {
+        'chunk_id': None,
+        'chunk_type': 'unit',
+        'chunk_text': f"[공급형별 면적/임대조건 표]\n{render_unit_table(units)}",
+        'page_num': min(pages) if pages else '?',
+        'annc_id': annc_id,
+        'file_id': None,
+    }
+
+
 def format_annc_list(anncs: List[dict], with_url: bool = True) -> str:
     if not anncs:
         return "검색된 공고가 없습니다."
@@ -153,11 +388,18 @@ def format_annc_list(anncs: List[dict], with_url: bool = True) -> str:
     return "\n".join(lines)
 
 
-def format_context(chat_history: List[dict], prev_anncs: List[dict], selected: Optional[dict]) -> str:
+def recent_history(chat_history: List[dict], summarized_count: int = 0) -> List[dict]:
+    """요약에 포함되지 않은 최근 메시지 (요약 갱신이 밀려도 최대 2배까지만)"""
+    pending = chat_history[summarized_count:]
+    return pending[-ChatbotConfig.RECENT_HISTORY_MESSAGES * 2:]
+
+
+def format_context(chat_history: List[dict], prev_anncs: List[dict], selected: Optional[dict], summary: str = "") -> str:
     parts = []
+    if summary:
+        parts.append(f"[이전 대화 요약]\n{summary}")
     if chat_history:
-        recent = chat_history[-6:]
-        conv = "\n".join([f"{'사용자' if m['role']=='user' else '챗봇'}: {m['content'][:100]}" for m in recent])
+        conv = "\n".join([f"{'사용자' if m['role']=='user' else '챗봇'}: {m['content'][:100]}" for m in chat_history])
         parts.append(f"[최근 대화]\n{conv}")
     if prev_anncs:
         titles = "\n".join([f"{i}. {a['annc_title'][:40]}" for i, a in enumerate(prev_anncs, 1)])
@@ -223,7 +465,8 @@ def classify_intent(state: GraphState) -> GraphState:
     context = format_context(
         state.get("chat_history", []),
         state.get("prev_anncs", []),
-        state.get("selected_annc")
+        state.get("selected_annc"),
+        state.get("conversation_summary", "")
     )
 
     # 사용자 프로필 컨텍스트
@@ -241,120 +484,16 @@ def classify_intent(state: GraphState) -> GraphState:
         hist = [f"- {h['query']}" for h in state["search_history"][-3:]]
         search_history_info = f"\n[이전 검색 기록]\n" + "\n".join(hist)
 
-    prompt = f"""주택 공고 안내 챗봇의 의도 분류기입니다. 사용자 질문의 의도를 정확히 파악하세요.
-{user_profile_context}
-{context}
-{search_history_info}
-
-# DB 메타데이터 (RDB 필터링 가능 값)
+    # 고정 지침 뒤에 DB 메타데이터(5분 캐시) -> 사용자별 정보 순으로 붙임
+    prompt = INTENT.render(
+        f"""# DB 메타데이터 (RDB 필터링 가능 값)
 - 상태값: {db_info['statuses']}
 - 지역(광역시/도): {db_info['regions']}
-- 상세유형: {db_info['dtl_types']}
-
-# 의도 분류 (5가지) - 우선순위 순
-
-## 1. `select` - 목록에서 공고 선택 (최우선)
-조건: prev_anncs(검색결과 목록)가 있고, 번호/순서 또는 공고명으로 특정 공고를 지목
-예시:
-- 번호 기반: "1번" / "2번 공고" / "첫번째" / "맨 위에꺼"
-- 공고명 기반: "나주이창 공고 알려줘" / "익산부송 자세히" / "나주이창 행복주택에 대해"
-- "OO공고 핵심만" / "OO 요약해줘"
-주의: "1인가구"는 select가 아님 (대상자 검색)
-주의: prev_anncs에 해당 공고가 있어야 select, 없으면 search
-
-## 2. `detail` - 선택된 공고의 상세 정보 질문
-조건: selected_annc(선택된 공고)가 있고, 해당 공고의 세부 정보 질문
-예시:
-- "신청자격이 뭐야?" / "자격요건 알려줘"
-- "면적 정보" / "평수가 어떻게 돼?"
-- "임대료" / "보증금" / "월세"
-- "신청기간" / "언제까지야?" / "마감일"
-- "필요서류" / "제출서류"
-- "당첨자 발표일" / "입주일"
-주의: 선택된 공고 없이 "신청자격"만 물으면 search
-
-## 3. `compare` - 여러 공고 비교
-조건: prev_anncs가 2개 이상이고, 비교 요청
-예시:
-- "1번이랑 2번 비교해줘"
-- "첫번째랑 세번째 뭐가 달라?"
-- "둘 다 비교" / "전부 비교해줘"
-
-## 4. `search` - 공고 검색 (신규/추가/복원)
-### 4a. 신규 검색 (search_mode: "new")
-- 새로운 조건으로 검색, 기존 결과 대체
-- "신혼부부 공고 알려줘" / "청년 대상 공고"
-- "접수중인 공고" / "공고중인 것들"
-- "경기도 행복주택" / "서울 임대"
-- "1인가구 공고" / "무주택자 대상"
-
-### 4b. 추가 검색 (search_mode: "add")
-- 기존 검색 결과에 추가 (prev_anncs 유지)
-- "~도 보여줘" / "~도 추가해줘" / "~도 포함"
-- "경기도도 보여줘" / "공고중인 것도"
-- "영구임대도 추가" / "서울도 포함해서"
-
-### 4c. 복원 검색 (search_mode: "restore")
-- 이전 검색 결과 다시 보기 (search_history 필요)
-- "아까 검색한거" / "이전 결과"
-- "아까 신혼부부 공고 다시" / "방금 전 검색"
-
-### RDB 필터 추출 규칙
-- annc_status: "접수중", "공고중" 등 상태 언급 시 (DB값에서 선택)
-- annc_dtl_type: "행복주택", "영구임대", "매입임대" 등 유형 언급 시 (DB값에서 선택)
-- annc_region: 지역 언급 시 **반드시 DB 지역값 목록에서 선택** (배열로!)
-  * 사용자가 "전라도" 같은 통칭을 쓰면 → DB값에서 해당하는 모든 지역 선택
-  * 예: "전라도" → DB에 "전라남도", "전북특별자치도"가 있으면 ["전라남도", "전북특별자치도"]
-  * 예: "강원도" → DB에 "강원특별자치도"가 있으면 ["강원특별자치도"]
-  * 예: "서울" → DB에 "서울특별시"가 있으면 ["서울특별시"]
-- rag_keywords: 대상자(신혼부부, 청년, 1인), 상세 지역(수원, 서대문, 나주 등 시/군/구), 기타 키워드
-
-## 5. `chat` - 일반 대화/제도 설명
-조건: 위 의도에 해당하지 않는 일반 질문
-예시:
-- 인사: "안녕" / "고마워" / "도움이 됐어"
-- 제도 설명: "행복주택이 뭐야?" / "LH가 뭐야?" / "공공임대란?"
-- 일반 질문: "청약 자격요건" / "주택청약 방법"
-- 최신 정보: "2025년 청약 정책" (needs_web_search: true)
-
-needs_web_search: true인 경우
-- 최신 정책/제도 변경 질문
-- 구체적 통계/경쟁률 질문
-- LLM 지식으로 답하기 어려운 실시간 정보
-
-# 판단 규칙
-1. 숫자+"번"은 select, 숫자+"인"은 대상자(search)
-2. selected_annc 없이 상세질문 → search로 전환
-3. "~도"가 붙으면 add 모드 검토
-4. 애매하면 search (신규)로 분류
-
-# 응답 형식 (JSON만 출력)
-{{
-  "intent": "search|select|detail|compare|chat",
-  "search_mode": "new|add|restore",
-  "restore_query": null,
-  "select_indices": [],  // 번호 기반: "1번"→[1], "2번"→[2]
-  "select_annc_name": null,  // 공고명 기반: "나주이창", "익산부송" 등 (부분 매칭 가능)
-  "compare_annc_names": [],  // 비교용 공고명 배열: ["포항블루밸리", "양산사송"]
-  "rdb_filters": {{
-    "annc_status": null,
-    "annc_dtl_type": null,
-    "annc_region": []  // 지역 배열 (DB값 기준, 예: ["전라남도", "전북특별자치도"])
-  }},
-  "rag_keywords": null,
-  "needs_web_search": false,
-  "reasoning": "판단 근거 한 줄"
-}}
-
-# select 관련 주의사항
-- 번호 기반: select_indices 사용 (1-indexed, "마지막"은 [-1])
-- 공고명 기반: select_annc_name 사용 (공고 제목의 일부, 예: "나주이창", "익산부송")
-- 둘 다 있으면 select_annc_name 우선
-
-# compare 관련 주의사항
-- 번호 기반: select_indices 사용 (예: "1번이랑 2번 비교" → [1, 2])
-- 공고명 기반: compare_annc_names 사용 (예: "포항블루밸리랑 양산사송 비교" → ["포항블루밸리", "양산사송"])
-- 공고명이 있으면 compare_annc_names 우선"""
+- 상세유형: {db_info['dtl_types']}""",
+        user_profile_context,
+        f"# 대화 맥락\n{context}",
+        search_history_info
+    )
 
     result_str = call_llm(prompt, f"질문: {question}", json_mode=True)
 
@@ -413,46 +552,7 @@ needs_web_search: true인 경우
 # 노드 2: 검색 (RDB 필터 + RAG)
 # =============================================================================
 def expand_query(question: str) -> str:
-    prompt = """주택 공고 RAG 검색을 위한 쿼리 확장기입니다.
-사용자 질문에서 핵심 키워드를 추출하고 관련 동의어/유의어로 확장합니다.
-
-# 대상자 관련 동의어
-- 신혼부부 → 신혼부부, 혼인, 예비신혼부부, 신혼희망타운, 혼인신고, 결혼예정
-- 청년 → 청년, 대학생, 사회초년생, 만19세, 만39세, 청년계층
-- 1인가구 → 1인, 단독세대, 독신, 1인세대
-- 고령자/노인 → 고령자, 주거약자, 노인, 만65세, 고령자계층
-- 저소득층 → 저소득, 기초생활수급자, 차상위계층, 소득기준
-- 다자녀 → 다자녀, 3자녀, 미성년자녀, 자녀수
-
-# 자격요건 관련
-- 신청자격 → 신청자격, 입주자격, 공급대상, 자격요건, 신청대상, 입주대상자
-- 무주택 → 무주택, 무주택세대구성원, 무주택요건, 주택소유여부
-- 소득기준 → 소득기준, 월평균소득, 도시근로자, 소득요건, 자산기준
-- 자산기준 → 자산, 부동산, 자동차, 금융자산, 자산보유
-
-# 주택정보 관련
-- 면적 → 면적, 전용면적, 주거전용, 공급면적, 계약면적, 평형, 평수, ㎡
-- 임대료 → 임대료, 보증금, 월임대료, 월세, 임대조건, 납부금액
-- 위치 → 위치, 소재지, 주소, 단지, 블록, 동, 호
-
-# 일정 관련
-- 신청기간 → 신청기간, 접수기간, 모집기간, 청약일정, 신청일
-- 마감 → 마감일, 접수마감, 모집마감, 공고기한
-- 입주 → 입주예정, 입주일, 입주시기, 계약체결
-
-# 서류 관련
-- 서류 → 제출서류, 구비서류, 필요서류, 증빙서류, 첨부서류
-- 신청방법 → 신청방법, 접수방법, 청약방법, 인터넷청약
-
-# 규칙
-1. 원본 질문의 핵심 키워드 유지
-2. 위 동의어 목록에서 관련 키워드 추가
-3. 불필요한 조사/어미 제거 (은, 는, 이, 가, 을, 를, 의 등)
-4. 공백으로 구분하여 출력
-5. 최대 20개 키워드
-
-# 출력 형식
-키워드1 키워드2 키워드3 ... (공백 구분, 키워드만)"""
+    prompt = EXPAND_QUERY.render()
     return call_llm(prompt, f"질문: {question}", temp=0).strip()
 
 
@@ -495,7 +595,28 @@ def search_announcements(state: GraphState) -> GraphState:
             region_q |= Q(annc_region__icontains=region)
         queryset = queryset.filter(region_q)
 
-    candidate_ids = list(queryset.values_list('annc_id', flat=True))
+    # 사용자 프로필로 후보 공고 사전 필터 (RAG/LLM 전에 SQL로 제외 - 질문 조건이 우선)
+    user_profile = state.get("user_profile") or {}
+    profile_filters = {}
+
+    # 희망 지역: 질문에 지역 조건이 없을 때만 적용 (해당 지역 공고가 없으면 미적용)
+    hope_area = (user_profile.get("ref_hope_area") or "").split()
+    if hope_area and not annc_region:
+        hope_queryset = queryset.filter(annc_region__icontains=hope_area[0])
+        if hope_queryset.exists():
+            queryset = hope_queryset
+            profile_filters["hope_area"] = hope_area[0]
+
+    # 자격 기준: 공급대상별 연령/혼인/자녀/소득 조건 (질문에 혼인 관련 조건이 있으면 혼인 조건은 생략)
+    check_marital = not any(kw in question for kw in ('신혼', '결혼', '기혼', '혼인', '미혼'))
+    eligible_queryset, eligibility_applied = AnncEligibilityService.filter_eligible(queryset, user_profile, check_marital)
+    candidate_ids = list(eligible_queryset.values_list('annc_id', flat=True))
+    if eligibility_applied:
+        profile_filters["eligibility"] = eligibility_applied
+        if not candidate_ids:
+            # 자격 조건을 만족하는 공고가 없으면 자격 필터 없이 검색 (검색 결과 없음 대신 전체 후보 안내)
+            candidate_ids = list(queryset.values_list('annc_id', flat=True))
+            profile_filters["eligibility_fallback"] = True
 
     # RAG 검색
     rag_keywords = intent_data.get("rag_keywords") or question
@@ -564,6 +685,8 @@ def search_announcements(state: GraphState) -> GraphState:
             **state.get("debug_info", {}),
             "expanded_query": expanded,
             "rdb_filters": rdb_filters,
+            "profile_filters": profile_filters,
+            "candidate_count": len(candidate_ids),
             "search_mode": search_mode
         }
     }
@@ -591,11 +714,11 @@ def select_announcement(state: GraphState) -> GraphState:
                 break
 
         if matched:
-            return {
+            return _with_profile_overview(state, {
                 "selected_annc": matched,
                 "selected_anncs": [matched],
                 "debug_info": {**state.get("debug_info", {}), "selected_by_name": select_annc_name}
-            }
+            })
         else:
             # 매칭 실패 시 목록 안내
             titles = [a.get("annc_title", "")[:30] for a in prev_anncs[:5]]
@@ -619,17 +742,27 @@ def select_announcement(state: GraphState) -> GraphState:
 
     if 1 <= idx <= len(prev_anncs):
         selected = prev_anncs[idx - 1]
-        return {
+        return _with_profile_overview(state, {
             "selected_annc": selected,
             "selected_anncs": [selected],
             "debug_info": {**state.get("debug_info", {}), "selected_index": idx}
-        }
+        })
     else:
         return {
             "answer": f"{idx}번 공고가 없습니다. 1~{len(prev_anncs)}번 중 선택해주세요."
         }
 
 
+def _with_profile_overview(state: GraphState, result: dict) -> dict:
+    """선택한 공고의 구조화 프로필이 있으면 요약 답변을 바로 채움 (상세 검색/LLM 생략, 없으면 RAG로 진행)"""
+    selected = result["selected_annc"]
+    profile = AnncProfileService.get_active_profiles([selected["annc_id"]]).get(selected["annc_id"])
+    if profile and any(profile.values()):
+        result["answer"] = _finish_detail_answer(render_profile_overview(selected, profile), state["question"], selected)
+        result["debug_info"]["answer_source"] = "profile"
+    return result
+
+
 # =============================================================================
 # 노드 4: 상세 검색 (RAG)
 # =============================================================================
@@ -709,30 +842,72 @@ def retrieve_details(state: GraphState) -> GraphState:
         elif not selected:
             return {"answer": "먼저 공고를 검색해주세요."}
 
+    # 면적/임대료만 묻는 질문은 공급 단위(공고문 표 추출값)를 SQL로 조회하여 그대로 답변 (정확한 수치, LLM 생략)
+    category = question_category(question)
+    is_table_question = category in UNIT_ANSWER_CATEGORIES or any(kw in question for kw in TABLE_QUESTION_KEYWORDS)
+    units = AnncUnitService.get_active_units([selected["annc_id"]]).get(selected["annc_id"], []) if is_table_question else []
+    if units and category in UNIT_ANSWER_CATEGORIES:
+        return {
+            "selected_annc": selected,
+            "retrieved_docs": [],
+            "unit_answer": {"category": category, "units": units},
+            "debug_info": {**state.get("debug_info", {}), "answer_source": "unit", "unit_count": len(units)}
+        }
+
+    # 자주 묻는 항목(신청자격/임대료/면적/일정/서류)은 구조화 프로필로 답변 (없으면 RAG)
+    if category in PROFILE_FIELD_LABELS:
+        profile = AnncProfileService.get_active_profiles([selected["annc_id"]]).get(selected["annc_id"])
+        if profile and profile.get(category):
+            return {
+                "selected_annc": selected,
+                "retrieved_docs": [],
+                "profile_answer": {"field": category, "value": profile[category]},
+                "debug_info": {**state.get("debug_info", {}), "answer_source": "profile"}
+            }
+
     expanded = expand_query(question)
     embedding = get_embedding(expanded)
 
-    # 상세 질문은 더 많은 청크 필요 (여러 단지 정보 포함)
-    detail_top_k = ChatbotConfig.RAG_TOP_K + 10  # 25개
+    # 질문 유형에 맞는 섹션 카테고리 청크만 검색 (범위가 좁으므로 top_k도 작게)
+    sections = question_sections(question)
+    docs = []
+    if sections:
+        docs = DocChunkService.hybrid_search(
+            query_text=expanded,
+            query_embedding=embedding,
+            top_k=ChatbotConfig.SCOPED_RAG_TOP_K,
+            annc_id_filter=[selected["annc_id"]],
+            section_categories=sections
+        )
+    scoped = len(docs) >= ChatbotConfig.SCOPED_MIN_DOCS
 
-    docs = DocChunkService.hybrid_search(
-        query_text=expanded,
-        query_embedding=embedding,
-        top_k=detail_top_k,
-        annc_id_filter=[selected["annc_id"]]
-    )
+    # 카테고리가 없는 질문/섹션 정보가 없는 이전 적재분: 전체 청크 검색
+    if not scoped:
+        # 상세 질문은 더 많은 청크 필요 (여러 단지 정보 포함)
+        detail_top_k = ChatbotConfig.RAG_TOP_K + 10  # 25개
+
+        docs = DocChunkService.hybrid_search(
+            query_text=expanded,
+            query_embedding=embedding,
+            top_k=detail_top_k,
+            annc_id_filter=[selected["annc_id"]]
+        )
+
+    # 면적/임대료가 섞인 질문은 공급 단위 표를 컨텍스트 맨 앞에 추가 (표 청크 스캔 대신)
+    if units:
+        docs = [unit_table_doc(selected["annc_id"], units)] + docs
 
-    # 면적/임대료 질문 시 해당 키워드가 포함된 청크 보강
-    table_keywords = ['면적', '임대료', '보증금', '월세', '계약면적', '전용면적', '평수']
-    if any(kw in question for kw in table_keywords):
+    # 공급 단위가 추출되지 않고 섹션 범위 검색도 안 된 공고: 해당 키워드가 포함된 청크 보강
+    elif is_table_question and not scoped:
         from .models import DocChunks
-        from django.db.models import Q
+        from django.db.models import Q, F
 
         # 해당 공고의 면적/임대료 관련 테이블 청크 직접 조회
         # 1순위: 계약면적, 전용면적 등 면적 키워드 포함 청크
         # 2순위: 단지명 + 숫자 패턴이 있는 테이블 청크
         extra_chunks = DocChunks.objects.filter(
-            annc_id=selected["annc_id"]
+            annc_id=selected["annc_id"],
+            generation=F('annc_id__active_generation')  # 활성 세대만
         ).filter(
             Q(chunk_text__contains='계약면적') |
             Q(chunk_text__contains='전용면적') |
@@ -767,6 +942,7 @@ def retrieve_details(state: GraphState) -> GraphState:
         "debug_info": {
             **state.get("debug_info", {}),
             "expanded_query": expanded,
+            "section_categories": sections if scoped else None,
             "retrieved_count": len(docs)
         }
     }
@@ -828,6 +1004,21 @@ def compare_announcements(state: GraphState) -> GraphState:
             return {"answer": f"비교할 공고를 2개 이상 선택해주세요.\n\n현재 목록:\n" + "\n".join([f"{i+1}. {t}" for i, t in enumerate(titles)])}
         return {"answer": "비교할 공고를 2개 이상 선택해주세요. 먼저 공고를 검색해주세요."}
 
+    # 면적/임대조건은 공급 단위(공고문 표 추출값)로 비교 (DB 1회)
+    annc_ids = [a["annc_id"] for a in selected_anncs]
+    annc_units = AnncUnitService.get_active_units(annc_ids)
+
+    # 모든 공고에 구조화 프로필이 있으면 RAG 생략 (비교표를 프로필로 구성)
+    annc_profiles = AnncProfileService.get_active_profiles(annc_ids)
+    if all(any(annc_profiles.get(a["annc_id"], {}).values()) for a in selected_anncs):
+        return {
+            "selected_anncs": selected_anncs,
+            "retrieved_docs": [],
+            "annc_profiles": annc_profiles,
+            "annc_units": annc_units,
+            "debug_info": {**state.get("debug_info", {}), "compare_count": len(selected_anncs), "answer_source": "profile"}
+        }
+
     # 각 공고별 RAG 검색
     all_docs = []
     for annc in selected_anncs:
@@ -842,6 +1033,7 @@ def compare_announcements(state: GraphState) -> GraphState:
     return {
         "selected_anncs": selected_anncs,
         "retrieved_docs": all_docs,
+        "annc_units": annc_units,
         "debug_info": {**state.get("debug_info", {}), "compare_count": len(selected_anncs)}
     }
 
@@ -870,78 +1062,25 @@ def general_chat(state: GraphState) -> GraphState:
         except:
             pass
 
-    prompt = f"""주택 공고 안내 전문 챗봇 '집핏(ZIP-FIT)'입니다.
-사용자의 주택/임대/청약 관련 질문에 친절하고 정확하게 답변합니다.
-{user_profile_context}
-# 사용자 프로필 관련 질문 응대
-- 사용자가 자신의 정보(나이, 지역, 혼인여부, 자녀수, 소득 등)를 물어보면 위 프로필 정보를 참고하여 답변
-- 예: "내 나이가 몇이야?" → 프로필의 연령 정보로 답변
-- 예: "내가 결혼했어?" → 프로필의 혼인여부로 답변
-- 프로필 정보가 없으면 "아직 입력하신 정보가 없어요"라고 안내
-
-# 챗봇 기능 소개
-1. **공고 검색**: 지역, 대상자(신혼부부/청년/고령자 등), 상태(접수중/공고중)별 검색
-2. **상세 정보 안내**: 신청자격, 면적, 임대료, 신청기간, 필요서류 등
-3. **공고 비교**: 여러 공고의 조건 비교 분석
-4. **제도 설명**: 행복주택, 영구임대, 매입임대 등 주택 제도 안내
-
-# 현재 서비스 정보
+    prompt = CHAT.render(
+        f"""# 현재 서비스 정보
 - 검색 가능 지역: {ChatbotConfig.get('regions')}
 - 공고 유형: {ChatbotConfig.get('dtl_types')}
-- 공고 상태: {ChatbotConfig.get('statuses')}
-{web_context}
-
-# 응답 가이드
-
-## 인사/감사 표현
-- 친근하고 따뜻하게 응대
-- 추가 도움 제안 ("더 궁금한 점이 있으신가요?")
-
-## 주택 제도 설명 질문
-행복주택, 영구임대, 매입임대, 공공임대 등의 제도 질문에는:
-- 정의와 목적
-- 주요 대상자
-- 특징/장점
-- 신청 방법 개요
-
-## 청약/자격 일반 질문
-- 일반적인 자격요건 설명
-- 구체적인 정보는 "공고 검색 후 확인" 안내
-- 예: "신혼부부 공고 검색해줘"로 검색 유도
-
-## LH/SH 등 기관 질문
-- 기관 소개 및 역할
-- 주요 사업 설명
-- 공식 웹사이트 안내
-
-## 최신 정책/제도 변경 질문
-- 웹 검색 결과가 있으면 해당 정보 기반 답변
-- 없으면: "최신 정책은 LH 또는 국토교통부 홈페이지에서 확인해주세요."
-
-## 서비스 범위 외 질문
-- 정중히 범위 외임을 알림
-- 가능한 대안 제시 (예: 관련 기관 안내)
-
-# 응답 스타일
-- 친근하고 자연스러운 대화체 ("~해요", "~을 알려드릴게요", "~를 추천드려요")
-- 명확하고 구조화된 답변
-- 불필요한 수식어 자제
-- 필요시 마크다운 활용
-
-# 응답 분량
-- 너무 짧지 않게 **충분히 설명** (최소 4-6문장)
-- 정보 제공 시 핵심 내용과 함께 부가 설명도 포함
-- 질문에 따라 유연하게 분량 조절 (간단한 인사 → 짧게, 제도 설명 → 길게)
-
-# 마무리
-- 적절한 후속 안내 포함 ("더 궁금한 점이 있으시면 말씀해주세요!")
-- 공고 검색이 필요한 경우 자연스럽게 유도 ("원하시는 지역의 공고를 검색해드릴까요?")"""
+- 공고 상태: {ChatbotConfig.get('statuses')}""",
+        user_profile_context,
+        f"# 이전 대화 요약\n{state['conversation_summary']}" if state.get("conversation_summary") else "",
+        web_context
+    )
 
+    # 긴 표 답변이 프롬프트를 키우지 않도록 최근 메시지도 길이 제한
     messages = [{"role": "system", "content": prompt}]
-    messages.extend(state.get("chat_history", [])[-6:])
+    messages.extend(
+        {"role": m["role"], "content": m["content"][:ChatbotConfig.HISTORY_MESSAGE_CHARS]}
+        for m in state.get("chat_history", [])
+    )
     messages.append({"role": "user", "content": question})
 
-    resp = client.chat.completions.create(
+    resp = create_chat_completion(
         model=ChatbotConfig.LLM_MODEL,
         messages=messages,
         temperature=0.7
@@ -952,6 +1091,17 @@ def general_chat(state: GraphState) -> GraphState:
 # =============================================================================
 # 응답 생성
 # =============================================================================
+def _pack_annc_docs(docs: List[dict], node: str):
+    """여러 공고 청크를 노드 예산 안에서 [공고:ID, p페이지] 출처와 함께 패킹 (검색/비교 응답)"""
+    return pack_context(
+        docs,
+        ChatbotConfig.CONTEXT_TOKEN_BUDGETS[node],
+        render=lambda d, body: f"[공고:{d.get('annc_id')}, p{d.get('page_num')}] {body}",
+        max_doc_tokens=ChatbotConfig.CONTEXT_DOC_TOKEN_LIMITS[node],
+        separator="\n",
+    )
+
+
 def generate_search_response(state: GraphState) -> GraphState:
     question = state["question"]
     anncs = state.get("prev_anncs", [])
@@ -967,57 +1117,25 @@ def generate_search_response(state: GraphState) -> GraphState:
                 suggestion = f"\n\n다른 검색을 시도해보세요:\n- \"{hope_area} 공고 알려줘\"\n- \"접수중인 공고 보여줘\""
         return {"answer": f"조건에 맞는 공고를 찾지 못했습니다.{suggestion}\n\n검색 조건을 좀 더 넓게 설정해보시겠어요? (예: 지역명, 공고 유형 등)"}
 
-    context = "\n".join([f"[공고:{d.get('annc_id')}, p{d.get('page_num')}] {d.get('chunk_text', '')[:200]}" for d in docs[:8]])
+    packed = _pack_annc_docs(docs, "search")
+    context = packed.text
 
     # 사용자 프로필 기반 맞춤 추천 정보
     user_profile = state.get("user_profile")
     profile_context = format_user_profile(user_profile) if user_profile else ""
 
-    prompt = f"""주택 공고 검색 결과를 사용자에게 친절하게 안내하는 챗봇입니다.
-
-# 사용자 질문
-{question}
-{profile_context}
-# 검색된 공고 목록
-{format_annc_list(anncs, with_url=False)}
-
-# 검색된 문서 내용 (RAG)
-{context}
-
-# 응답 작성 규칙
-
-## 필수 규칙
-1. 반드시 공고명(예: "익산부송", "나주이창", "김제요촌")을 사용하여 공고를 언급할 것
-2. 번호(1번, 2번 등)는 절대 사용하지 말 것
-3. 목록에 없는 공고명을 절대 언급하지 말 것
-4. 문서 내용을 참고하여 사용자 질문에 맞는 공고를 추천
-5. 사용자 프로필이 있으면 해당 조건에 맞는 추천 이유를 구체적으로 설명
-
-## 응답 스타일
-- **라벨 금지**: "추천 요약:", "간단한 설명:", "다음 안내:" 같은 딱딱한 라벨 사용 금지
-- 친근하고 자연스러운 대화체 ("~이 좋을 것 같아요", "~를 추천드릴게요", "~에 관심 있으시면")
-- 불필요한 서론 없이 바로 본론으로
-- 각 공고 추천 시 **공고명 + 핵심 특징 + 추천 이유**를 함께 설명
-  - 예: "**익산부송 행복주택**은 영구임대 유형으로 보증금 부담이 적고, 현재 접수중이에요. 전라북도 지역에서 저렴한 주거를 찾으신다면 적합할 것 같아요."
-- 사용자 프로필이 있으면 맞춤 추천 이유를 구체적으로 연결
-  - 예: "신혼부부 우선공급 대상이라 고객님 조건에 딱 맞아요."
-- 마지막에 자연스럽게 상세 확인 유도 ("더 자세한 정보가 필요하시면 '익산부송 자세히 알려줘'라고 말씀해주세요!")
-
-## 응답 분량
-- 전체 **6-10문장** 정도로 충분히 설명
-- 공고별로 2-3문장씩 특징과 추천 이유 설명
-- 너무 짧게 끊지 말고, 사용자가 판단할 수 있도록 충분한 정보 제공
-
-## 공고 소개 포맷
-- 추천 공고 2-3개를 **자연스러운 문장**으로 각각 설명
-- 단순 나열이 아닌, 각 공고의 장점/특징을 비교하며 안내
-- 마감 임박한 공고가 있으면 우선 언급 ("마감이 얼마 안 남았어요!")"""
+    prompt = SEARCH_RESPONSE.render(
+        f"# 검색된 공고 목록\n{format_annc_list(anncs, with_url=False)}",
+        f"# 검색된 문서 내용 (RAG)\n{context}",
+        profile_context,
+        f"# 사용자 질문\n{question}"
+    )
 
     answer = call_llm(prompt, question, temp=0.3)
     # 상위 5개 공고만 목록으로 표시
     top_anncs = anncs[:5] if len(anncs) > 5 else anncs
     answer += "\n\n---\n" + format_annc_list(top_anncs)
-    return {"answer": answer}
+    return {"answer": answer, "debug_info": {**state.get("debug_info", {}), "context": packed.stats()}}
 
 
 def generate_detail_response(state: GraphState) -> GraphState:
@@ -1030,107 +1148,60 @@ def generate_detail_response(state: GraphState) -> GraphState:
     if not selected:
         return {"answer": "선택된 공고가 없습니다."}
 
-    dday = calculate_dday(selected.get('annc_deadline_dt', ''))
-    dday_str = f" ({dday})" if dday else ""
-
-    # 면적/임대료 질문은 더 많은 청크 필요 (여러 단지 정보 포함)
-    table_keywords = ['면적', '임대료', '보증금', '월세', '평수']
-    if any(kw in question for kw in table_keywords):
-        max_chunks = 20  # 면적/임대료 질문은 더 많은 청크
-    else:
-        max_chunks = 12
-
-    context = "\n\n".join([f"[p{d.get('page_num', '?')}]\n{d.get('chunk_text', '')}" for d in docs[:max_chunks]])
+    # 공급 단위 표 답변 (면적/임대료 질문)
+    unit_answer = state.get("unit_answer")
+    if unit_answer:
+        answer = render_unit_answer(unit_answer["category"], unit_answer["units"])
+        return {"answer": _finish_detail_answer(answer, question, selected, auto_selected)}
+
+    # 구조화 프로필 답변 (retrieve_details에서 선택된 경우)
+    profile_answer = state.get("profile_answer")
+    if profile_answer:
+        answer = render_profile_field(profile_answer["field"], profile_answer["value"])
+        return {"answer": _finish_detail_answer(answer, question, selected, auto_selected)}
+
+    # 토큰 예산 안에서 중복 제거/점수순 정렬/행·문장 단위 자르기 (공급 단위 표·키워드 보강 청크는 맨 앞)
+    packed = pack_context(
+        docs,
+        ChatbotConfig.CONTEXT_TOKEN_BUDGETS["detail"],
+        render=lambda d, body: f"[p{d.get('page_num', '?')}]\n{body}",
+        max_doc_tokens=ChatbotConfig.CONTEXT_DOC_TOKEN_LIMITS["detail"],
+    )
+    used_docs = packed.docs
+
+    # 같은 공고/질문 유형/청크 집합/세대/프롬프트 버전/공고 상태·마감일이면 캐시된 답변 사용
+    answer_cache = get_answer_cache()
+    cache_key = make_answer_cache_key(
+        selected.get('annc_id'),
+        question,
+        [d.get('chunk_id') for d in used_docs],
+        AnncAllService.get_active_generation(selected.get('annc_id')),
+        DETAIL_RESPONSE.version,
+        annc_fields=(selected.get('annc_status'), selected.get('annc_deadline_dt'))
+    )
+    answer = answer_cache.get(cache_key)
+    cache_status = "hit" if answer is not None else "miss"
+    if answer is None:
+        answer = _generate_detail_answer(question, selected, packed.text)
+        answer_cache.set(cache_key, answer, timeout=ChatbotConfig.ANSWER_CACHE_TTL)
 
-    prompt = f"""주택 공고의 상세 정보를 안내하는 챗봇입니다.
-검색된 문서를 기반으로 사용자 질문에 정확하게 답변합니다.
+    return {
+        "answer": _finish_detail_answer(answer, question, selected, auto_selected),
+        "debug_info": {
+            **state.get("debug_info", {}),
+            "context": packed.stats(),
+            "answer_cache": cache_status,
+            "answer_cache_stats": answer_cache.stats()
+        }
+    }
 
-# 사용자 질문
-{question}
 
-# 현재 선택된 공고
-- 제목: {selected.get('annc_title')}
-- 상태: {selected.get('annc_status')}
-- 지역: {selected.get('annc_region')}
-- 마감일: {selected.get('annc_deadline_dt', '정보없음')}{dday_str}
-- 유형: {selected.get('annc_dtl_type', '')}
-
-# 검색된 문서 내용
-{context}
-
-# 응답 작성 규칙
-
-## 필수 규칙
-1. **문서 기반 답변**: 위 [검색된 문서 내용]에 있는 정보만 사용
-2. **출처 명시**: 답변에 페이지 번호 포함 (예: "p3 참조")
-3. **정보 없을 시**: "해당 정보는 공고문에서 찾지 못했습니다. 공고 원문을 확인해주세요."
-
-## ⚠️ 깨진 테이블 데이터 해석 지침
-PDF에서 추출된 표 데이터는 줄바꿈으로 분리되어 깨져 있을 수 있습니다.
-- 컬럼명이 여러 줄로 나뉨 (예: "공급\\n형별" → "공급형별", "전용\\n면적" → "전용면적")
-- 데이터와 헤더가 분리됨
-- 구분선(---|---)과 실제 데이터 혼재
-
-**해석 방법**:
-1. 표의 구조를 파악하고 헤더와 데이터를 매칭
-2. 단지명, 타입, 면적 숫자들의 패턴 인식
-3. 비슷한 패턴의 행들을 묶어서 해석
-4. 숫자 값(면적: 16.95, 26.87 등 / 금액: 5,000천원 등)을 정확히 추출
-
-**예시 해석**:
-- "16A | 16.95 | 5,000 | 50" → 16A타입, 전용면적 16.95㎡, 보증금 5,000천원, 월세 50천원
-- 여러 단지가 나오면 (양주옥정3, 양주고읍, 동두천송내 등) 각각 구분하여 표시
-
-## 질문 유형별 답변 가이드
-
-### 신청자격/입주자격 질문
-- 대상자 유형별 자격요건 정리
-- 소득/자산 기준 포함
-- 무주택 요건 설명
-
-### 면적/평수 질문
-- 표 형식으로 정리 (전용면적, 공급면적 등)
-- **여러 단지가 있으면 단지별로 모두 표시** (예: 동두천 송내, 양주 고읍 등)
-- 타입별(16A, 26B 등) 구분 명시
-- ㎡ 단위 사용
-- **깨진 표에서도 숫자 값들을 정확히 추출하여 표시**
-
-### 임대료/보증금 질문
-- 표 형식 권장 (타입별, 계층별)
-- **여러 단지가 있으면 단지별로 모두 표시**
-- 보증금/월임대료 구분
-- 전환보증금 정보 있으면 포함
-- **단위 표기 주의**: 천원/만원 단위 확인
-
-### 신청기간/일정 질문
-- 날짜 명확히 표기
-- 단계별 일정 (신청→발표→계약→입주) 정리
-- 온라인/오프라인 접수 구분
-
-### 서류/신청방법 질문
-- 필요 서류 리스트 형식
-- 발급처/유의사항 포함
-- 인터넷 청약 URL 있으면 안내
-
-## 응답 스타일
-- 친근하고 자연스러운 대화체로 설명 ("~입니다", "~해요", "~을 확인해보세요")
-- 마크다운 표/리스트를 활용하여 정보를 깔끔하게 정리
-- 복잡한 정보는 구조화하여 한눈에 파악할 수 있도록
-- **도입부**: 질문에 대한 간단한 답변 요약 (1-2문장)
-- **본문**: 상세 정보를 표나 리스트로 정리
-- **마무리**: 추가 안내나 유의사항 언급
-
-## 응답 분량
-- 질문에 따라 **충분한 정보** 제공 (너무 짧게 끊지 않기)
-- 단순 질문: 4-6문장
-- 상세 질문(면적, 임대료 등): 표 포함 + 설명 5-8문장
-- 중요 정보는 **강조 표시** 활용
-
-## 긴급 안내
-- {dday_str}이 D-7 이내면: "⚠️ 마감이 얼마 남지 않았습니다. 서둘러 신청하세요!"
-- {dday_str}이 D-Day/마감이면: "⚠️ 오늘이 마감일입니다!"""
-
-    answer = call_llm(prompt, question, temp=0.2)
+def _finish_detail_answer(answer: str, question: str, selected: dict, auto_selected: bool = False) -> str:
+    """상세 답변 본문(LLM/캐시/프로필)에 D-day, 후속 질문, 원문 링크를 붙임 (매 응답 새로 렌더링)"""
+    # 마감 D-day 안내는 캐시와 무관하게 새로 계산
+    dday_notice = render_dday_notice(selected.get('annc_deadline_dt', ''))
+    if dday_notice:
+        answer += f"\n\n{dday_notice}"
 
     # 후속 질문 제안 추가
     follow_up_suggestions = _get_follow_up_suggestions(question, selected)
@@ -1144,7 +1215,23 @@ PDF에서 추출된 표 데이터는 줄바꿈으로 분리되어 깨져 있을
 
     if selected.get('annc_url'):
         answer += f"\n\n📎 [공고 원문 바로가기]({selected['annc_url']})"
-    return {"answer": answer}
+    return answer
+
+
+def _generate_detail_answer(question: str, selected: dict, context: str) -> str:
+    """패킹된 청크 컨텍스트 기반 상세 답변 생성 (LLM) - 날짜에 따라 바뀌는 D-day는 넣지 않음 (답변 캐시 대상)"""
+    prompt = DETAIL_RESPONSE.render(
+        f"""# 현재 선택된 공고
+- 제목: {selected.get('annc_title')}
+- 상태: {selected.get('annc_status')}
+- 지역: {selected.get('annc_region')}
+- 마감일: {selected.get('annc_deadline_dt', '정보없음')}
+- 유형: {selected.get('annc_dtl_type', '')}""",
+        f"# 검색된 문서 내용\n{context}",
+        f"# 사용자 질문\n{question}"
+    )
+
+    return call_llm(prompt, question, temp=0.2)
 
 
 def _get_follow_up_suggestions(question: str, selected: dict) -> str:
@@ -1175,8 +1262,14 @@ def generate_compare_response(state: GraphState) -> GraphState:
     if len(selected_anncs) < 2:
         return {"answer": "비교할 공고가 부족합니다."}
 
+    annc_profiles = state.get("annc_profiles") or {}
+    annc_units = state.get("annc_units") or {}
+    if annc_profiles and all(a["annc_id"] in annc_profiles for a in selected_anncs):
+        return {"answer": render_profile_comparison(selected_anncs, annc_profiles, annc_units)}
+
     annc_info = "\n".join([f"- {a['annc_title']} ({a['annc_region']}, {a['annc_status']})" for a in selected_anncs])
-    context = "\n".join([f"[공고:{d.get('annc_id')}, p{d.get('page_num')}] {d.get('chunk_text', '')[:300]}" for d in docs[:10]])
+    packed = _pack_annc_docs(docs, "compare")
+    context = packed.text
 
     # 공고별 상세 정보 정리
     annc_details = []
@@ -1187,55 +1280,23 @@ def generate_compare_response(state: GraphState) -> GraphState:
 - 상태: {a.get('annc_status', '')}
 - 유형: {a.get('annc_dtl_type', '')}
 - 마감: {a.get('annc_deadline_dt', '정보없음')} {f'({dday})' if dday else ''}"""
+        # 공급 단위가 있으면 면적/임대조건은 공고문 표 수치 요약 사용
+        unit_summary = summarize_units(annc_units.get(a['annc_id'], []))
+        if unit_summary.get('area'):
+            detail += f"\n- 전용면적(공고문 표): {unit_summary['area']}"
+        if unit_summary.get('rent'):
+            detail += f"\n- 임대조건(공고문 표): {unit_summary['rent']}"
         annc_details.append(detail)
 
-    prompt = f"""여러 주택 공고를 비교 분석하여 사용자에게 안내하는 챗봇입니다.
-
-# 비교 대상 공고
-{chr(10).join(annc_details)}
-
-# 각 공고 관련 문서 내용
-{context}
-
-# 응답 작성 규칙
-
-## 필수 비교 항목 (표 형식)
-| 항목 | 공고1 | 공고2 | ... |
-|------|-------|-------|-----|
-| 지역/위치 | | | |
-| 대상자 | | | |
-| 신청자격 | | | |
-| 전용면적 | | | |
-| 임대조건(보증금/월세) | | | |
-| 신청기간/마감일 | | | |
-
-## 추가 분석 내용
-1. **각 공고의 특징/장점** (2-3줄씩)
-2. **추천 대상**
-   - "신혼부부라면 → N번 공고"
-   - "청년 1인 가구라면 → N번 공고"
-   - "소득이 낮다면 → N번 공고"
-3. **주의사항** (마감 임박, 경쟁률 예상 등)
-
-## 응답 스타일
-- 친근하고 자연스러운 대화체로 비교 설명
-- 객관적이고 중립적인 비교, 장단점 균형있게
-- 마크다운 표를 활용하여 한눈에 비교 가능하게
-- 문서에 없는 정보는 "정보 없음"으로 표기
-
-## 응답 분량 및 구조
-- **도입**: 비교 대상 공고 간략 소개 (2-3문장)
-- **비교표**: 핵심 항목별 비교표
-- **분석**: 각 공고의 장점과 추천 대상 설명 (4-6문장)
-- **마무리**: 결론 및 상세 확인 유도
-  - 예: "'익산부송 공고 자세히 알려줘'로 더 자세한 정보를 확인해보세요!"
-
-## 추천 대상 설명 예시
-- "신혼부부라면 → **익산부송 행복주택**이 우선공급 혜택이 있어요."
-- "청년 1인 가구라면 → **나주이창 행복주택**의 청년 전용 물량을 노려보세요."
-- "월세 부담을 줄이고 싶다면 → **영구임대** 유형이 적합해요.\""""
+    prompt = COMPARE_RESPONSE.render(
+        f"# 비교 대상 공고\n{chr(10).join(annc_details)}",
+        f"# 각 공고 관련 문서 내용\n{context}"
+    )
 
-    return {"answer": call_llm(prompt, "비교 분석해줘", temp=0.3)}
+    return {
+        "answer": call_llm(prompt, "비교 분석해줘", temp=0.3),
+        "debug_info": {**state.get("debug_info", {}), "context": packed.stats()}
+    }
 
 
 # =============================================================================
@@ -1264,16 +1325,16 @@ def route_after_select(state: GraphState) -> str:
 def create_chatbot_graph():
     g = StateGraph(GraphState)
 
-    # 노드
-    g.add_node("classify", classify_intent)
-    g.add_node("search", search_announcements)
-    g.add_node("select", select_announcement)
-    g.add_node("detail_retrieve", retrieve_details)
-    g.add_node("compare", compare_announcements)
-    g.add_node("chat", general_chat)
-    g.add_node("search_response", generate_search_response)
-    g.add_node("detail_response", generate_detail_response)
-    g.add_node("compare_response", generate_compare_response)
+    # 노드 (실행 시간/노드 안의 LLM·검색 호출 계측)
+    g.add_node("classify", metrics.instrument_node("classify", classify_intent))
+    g.add_node("search", metrics.instrument_node("search", search_announcements))
+    g.add_node("select", metrics.instrument_node("select", select_announcement))
+    g.add_node("detail_retrieve", metrics.instrument_node("detail_retrieve", retrieve_details))
+    g.add_node("compare", metrics.instrument_node("compare", compare_announcements))
+    g.add_node("chat", metrics.instrument_node("chat", general_chat))
+    g.add_node("search_response", metrics.instrument_node("search_response", generate_search_response))
+    g.add_node("detail_response", metrics.instrument_node("detail_response", generate_detail_response))
+    g.add_node("compare_response", metrics.instrument_node("compare_response", generate_compare_response))
 
     # 시작
     g.set_entry_point("classify")
@@ -1320,10 +1381,12 @@ def get_chatbot():
 
 def chat(question: str, session_state: dict = None) -> dict:
     session_state = session_state or {}
+    summarized_count = session_state.get("summarized_count", 0)
 
     initial = {
         "question": question,
-        "chat_history": session_state.get("chat_history", []),
+        "chat_history": recent_history(session_state.get("chat_history", []), summarized_count),
+        "conversation_summary": session_state.get("conversation_summary", ""),
         "search_history": session_state.get("search_history", []),
         "prev_anncs": session_state.get("prev_anncs", []),
         "selected_annc": session_state.get("selected_annc"),
@@ -1331,12 +1394,20 @@ def chat(question: str, session_state: dict = None) -> dict:
         "intent": "",
         "intent_data": {},
         "retrieved_docs": [],
+        "profile_answer": None,
+        "annc_profiles": {},
+        "unit_answer": None,
+        "annc_units": {},
         "user_profile": session_state.get("user_profile"),
         "answer": "",
         "debug_info": {}
     }
 
+    trace = metrics.start_trace()
+    started = time.perf_counter()
     result = get_chatbot().invoke(initial)
+    elapsed = time.perf_counter() - started
+    metrics.CHAT_SECONDS.observe(elapsed, intent=result.get("intent") or "")
 
     # 히스토리 업데이트
     history = session_state.get("chat_history", []).copy()
@@ -1345,16 +1416,21 @@ def chat(question: str, session_state: dict = None) -> dict:
 
     max_len = ChatbotConfig.MAX_HISTORY_TURNS * 2
     if len(history) > max_len:
+        summarized_count = max(0, summarized_count - (len(history) - max_len))
         history = history[-max_len:]
 
     return {
         "answer": result.get("answer", "오류가 발생했습니다."),
+        "intent": result.get("intent", ""),
         "session_state": {
             "chat_history": history,
             "search_history": result.get("search_history", session_state.get("search_history", [])),
             "prev_anncs": result.get("prev_anncs", session_state.get("prev_anncs", [])),
             "selected_annc": result.get("selected_annc", session_state.get("selected_annc")),
-            "selected_anncs": result.get("selected_anncs", session_state.get("selected_anncs", []))  # 비교용 다중 선택 공고
+            "selected_anncs": result.get("selected_anncs", session_state.get("selected_anncs", [])),  # 비교용 다중 선택 공고
+            # 요약은 턴 종료 후 conversation_summary.schedule_summary_update로 갱신
+            "conversation_summary": session_state.get("conversation_summary", ""),
+            "summarized_count": summarized_count
         },
-        "debug_info": result.get("debug_info", {})
+        "debug_info": {**result.get("debug_info", {}), "metrics": metrics.summarize_trace(trace, elapsed)}
     }
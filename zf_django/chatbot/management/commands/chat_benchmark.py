@@ -0,0 +1,277 @@
+# chatbot/management/commands/chat_benchmark.py
+"""
+챗봇 파이프라인 리플레이 벤치마크
+
+실제 대화(Chat/ChatMessage) 또는 픽스처 파일의 사용자 질문을 세션 순서대로 chat()에 다시 흘려
+의도별/노드별 지연시간(p50/p95/p99), DB 시간, 토큰 사용량을 JSON으로 기록합니다.
+커밋 간 비교가 가능하도록 LLM은 OpenAI 호환 스텁(OPENAI_BASE_URL), DB는 픽스처 Postgres(DB_* 환경변수)로 돌립니다.
+
+사용 예:
+    # DB의 최근 세션 20개를 픽스처로 저장
+    python manage.py chat_benchmark --from-db --limit 20 --export bench/sessions.jsonl --dry-run
+    # 픽스처 리플레이 -> 결과 JSON
+    OPENAI_BASE_URL=http://localhost:8081/v1 python manage.py chat_benchmark \\
+        --fixture bench/sessions.jsonl --output bench/result.json
+
+픽스처 형식 (JSONL, 1줄 = 1세션):
+    {"session": "s1", "user_profile": {"ref_age": 29}, "announcement_id": null, "messages": ["질문1", "질문2"]}
+"""
+import json
+import subprocess
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from chatbot import graph
+from chatbot.answer_cache import get_answer_cache
+from chatbot.conversation_summary import update_summary
+from chatbot.models import Chat, ChatMessage
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return round(ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower), 4)
+
+
+def distribution(values: List[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 4),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": round(max(values), 4),
+    }
+
+
+class QueryTimer:
+    """connection.execute_wrapper - chat() 1회 동안의 SQL 시간/횟수 합산"""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.queries += 1
+
+
+def load_db_sessions(limit: int, user_key: Optional[str] = None) -> List[dict]:
+    """최근 채팅 세션 -> 픽스처 형식 (사용자 메시지만, sequence 순)"""
+    chats = Chat.objects.all()
+    if user_key:
+        chats = chats.filter(user_key=user_key)
+
+    sessions = []
+    for chat_session in chats.order_by('-updated_at')[:limit]:
+        messages = list(
+            ChatMessage.objects.filter(chat=chat_session, message_type='user')
+            .order_by('sequence').values_list('message', flat=True)
+        )
+        if messages:
+            sessions.append({"session": str(chat_session.session_key), "messages": messages})
+    return sessions
+
+
+def load_fixture(path: str) -> List[dict]:
+    """픽스처 파일 (JSONL 또는 세션 리스트 JSON)"""
+    with open(path, encoding='utf-8') as f:
+        text = f.read().strip()
+    if text.startswith('['):
+        sessions = json.loads(text)
+    else:
+        sessions = [json.loads(line) for line in text.splitlines() if line.strip()]
+    for idx, session in enumerate(sessions):
+        if not session.get("messages"):
+            raise CommandError(f"{path}: {idx + 1}번째 세션에 messages가 없습니다.")
+        session.setdefault("session", f"fixture-{idx + 1}")
+    return sessions
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+class Command(BaseCommand):
+    help = "실제/픽스처 대화를 chat()으로 리플레이하여 의도별·노드별 지연시간, DB 시간, 토큰 사용량을 JSON으로 기록"
+
+    def add_arguments(self, parser):
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument('--from-db', action='store_true', help="Chat/ChatMessage에서 세션 재구성")
+        source.add_argument('--fixture', help="세션 픽스처 파일 (JSONL/JSON)")
+        parser.add_argument('--limit', type=int, default=50, help="--from-db 세션 수 (최근 순)")
+        parser.add_argument('--user-key', help="--from-db 대상 사용자 키")
+        parser.add_argument('--export', help="재구성한 세션을 픽스처(JSONL)로 저장")
+        parser.add_argument('--dry-run', action='store_true', help="세션만 불러오고 리플레이하지 않음 (--export와 함께 사용)")
+        parser.add_argument('--repeat', type=int, default=1, help="전체 세션 반복 횟수")
+        parser.add_argument('--output', help="결과 JSON 경로 (없으면 표준출력)")
+        parser.add_argument('--include-turns', action='store_true', help="턴별 기록을 결과에 포함")
+        parser.add_argument('--clear-answer-cache', action='store_true', help="시작 전에 답변 캐시 비우기 (콜드 캐시 측정)")
+        parser.add_argument('--no-summary', action='store_true', help="턴 사이 대화 요약 갱신 생략")
+        parser.add_argument('--allow-live', action='store_true', help="스텁이 아닌 OpenAI API로도 실행 허용")
+
+    def handle(self, *args, **options):
+        if options['from_db']:
+            sessions = load_db_sessions(options['limit'], options.get('user_key'))
+        else:
+            sessions = load_fixture(options['fixture'])
+        turn_total = sum(len(s["messages"]) for s in sessions)
+        self.stderr.write(f"세션 {len(sessions)}개, 질문 {turn_total}개")
+
+        if options.get('export'):
+            with open(options['export'], 'w', encoding='utf-8') as f:
+                for session in sessions:
+                    f.write(json.dumps(session, ensure_ascii=False) + "\n")
+            self.stderr.write(f"픽스처 저장: {options['export']}")
+        if options['dry_run']:
+            return
+
+        base_url = str(graph.client.base_url)
+        if 'api.openai.com' in base_url and not options['allow_live']:
+            raise CommandError(
+                "OpenAI API로 연결되어 있습니다. OPENAI_BASE_URL을 스텁 서버로 지정하거나 --allow-live를 사용하세요."
+            )
+
+        answer_cache = get_answer_cache()
+        if options['clear_answer_cache']:
+            answer_cache.backend.clear()
+
+        turns, errors = [], []
+        started_at = datetime.now().isoformat(timespec='seconds')
+        for round_idx in range(options['repeat']):
+            for session in sessions:
+                turns.extend(self.replay_session(session, round_idx, errors, not options['no_summary']))
+
+        report = self.build_report(turns, errors, answer_cache.stats())
+        report["meta"] = {
+            "started_at": started_at,
+            "git_commit": git_commit(),
+            "source": "db" if options['from_db'] else options['fixture'],
+            "sessions": len(sessions),
+            "turns": len(turns),
+            "repeat": options['repeat'],
+            "llm_model": graph.ChatbotConfig.LLM_MODEL,
+            "openai_base_url": base_url,
+        }
+        if options['include_turns']:
+            report["turns"] = turns
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options.get('output'):
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stderr.write(f"결과 저장: {options['output']}")
+        else:
+            self.stdout.write(output)
+
+    def replay_session(self, session: dict, round_idx: int, errors: List[dict], summarize: bool) -> List[dict]:
+        """세션 1개 리플레이 - 뷰와 같이 턴마다 session_state를 이어감"""
+        state = {"user_profile": session.get("user_profile")}
+        if session.get("announcement_id"):
+            annc = graph.AnncAllService.get_announcements_by_ids([session["announcement_id"]])
+            if annc:
+                state["selected_annc"] = annc[0]
+                state["prev_anncs"] = annc[:1]
+
+        records = []
+        for turn_idx, question in enumerate(session["messages"], 1):
+            timer = QueryTimer()
+            start = time.perf_counter()
+            try:
+                with connection.execute_wrapper(timer):
+                    result = graph.chat(question, state)
+            except Exception as e:
+                errors.append({"session": session["session"], "turn": turn_idx, "error": str(e)})
+                self.stderr.write(f"[{session['session']}#{turn_idx}] 오류: {e}")
+                break
+            elapsed = time.perf_counter() - start
+
+            debug = result.get("debug_info", {})
+            trace = debug.get("metrics", {})
+            records.append({
+                "session": session["session"],
+                "round": round_idx,
+                "turn": turn_idx,
+                "intent": result.get("intent") or "unknown",
+                "seconds": round(elapsed, 4),
+                "db_seconds": round(timer.seconds, 4),
+                "db_queries": timer.queries,
+                "nodes": trace.get("nodes", {}),
+                "llm_calls": trace.get("llm_calls", 0),
+                "prompt_tokens": trace.get("prompt_tokens", 0),
+                "completion_tokens": trace.get("completion_tokens", 0),
+                "cached_tokens": trace.get("cached_tokens", 0),
+                "calls": trace.get("calls", []),
+                "answer_cache": debug.get("answer_cache"),
+            })
+
+            # 다음 턴 세션 상태 (뷰의 백그라운드 요약 갱신을 동기로 재현)
+            user_profile = state.get("user_profile")
+            state = dict(result.get("session_state", {}), user_profile=user_profile)
+            if summarize:
+                update = update_summary(
+                    state.get("conversation_summary", ""), state.get("chat_history", []), state.get("summarized_count", 0)
+                )
+                if update:
+                    state.update(update)
+        return records
+
+    @staticmethod
+    def build_report(turns: List[dict], errors: List[dict], cache_stats: dict) -> dict:
+        by_intent: Dict[str, List[dict]] = {}
+        by_node: Dict[str, List[float]] = {}
+        llm_seconds, search_seconds, search_rows = [], [], []
+        for turn in turns:
+            by_intent.setdefault(turn["intent"], []).append(turn)
+            for node, seconds in turn["nodes"].items():
+                by_node.setdefault(node, []).append(seconds)
+            for call in turn["calls"]:
+                if call["kind"] == 'llm':
+                    llm_seconds.append(call["seconds"])
+                elif call["kind"] == 'search':
+                    search_seconds.append(call["seconds"])
+                    search_rows.append(call.get("rows", 0))
+
+        def summarize(group: List[dict]) -> dict:
+            return {
+                "latency": distribution([t["seconds"] for t in group]),
+                "db_seconds": distribution([t["db_seconds"] for t in group]),
+                "db_queries": distribution([t["db_queries"] for t in group]),
+                "llm_calls": sum(t["llm_calls"] for t in group),
+                "tokens": {
+                    "prompt": sum(t["prompt_tokens"] for t in group),
+                    "completion": sum(t["completion_tokens"] for t in group),
+                    "cached": sum(t["cached_tokens"] for t in group),
+                    "prompt_per_turn": distribution([t["prompt_tokens"] for t in group]),
+                },
+            }
+
+        return {
+            "overall": summarize(turns),
+            "by_intent": {intent: summarize(group) for intent, group in sorted(by_intent.items())},
+            "by_node": {node: distribution(values) for node, values in sorted(by_node.items())},
+            "llm": distribution(llm_seconds),
+            "search": {"latency": distribution(search_seconds), "rows": distribution(search_rows)},
+            "answer_cache": cache_stats,
+            "errors": errors,
+        }
@@ -0,0 +1,38 @@
+# chatbot/management/commands/check_prompts.py
+"""
+프롬프트 접두어 안정성 검사
+
+graph.py의 실제 노드를 서로 다른 상태 2개로 실행해 LLM 요청을 가로채고,
+두 요청의 공통 접두어가 고정 지침을 모두 포함하는지와 최소 캐시 길이 이상인지 확인합니다.
+(프롬프트 캐싱 회귀 방지 - 지침에 동적 값이 섞이거나 섹션 순서가 바뀌거나 접두어가 너무 짧으면 실패)
+LLM/DB는 호출하지 않습니다. 토큰 수는 tiktoken을 쓸 수 없으면 추정치입니다.
+
+사용 예:
+    python manage.py check_prompts
+    python manage.py check_prompts --min-tokens 0    # 길이 검사 생략 (안정성만)
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from chatbot.prompt_check import PROMPT_CACHE_MIN_TOKENS, check_prefix_stability
+from chatbot.prompts import prompt_versions
+
+
+class Command(BaseCommand):
+    help = "실제 노드 요청의 프롬프트 공통 접두어가 고정 지침을 포함하고 최소 캐시 길이 이상인지 검사"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-tokens", type=int, default=PROMPT_CACHE_MIN_TOKENS,
+            help=f"공통 접두어 최소 토큰 수 (기본 {PROMPT_CACHE_MIN_TOKENS} - OpenAI 프롬프트 캐싱 최소 길이, 0이면 생략)"
+        )
+
+    def handle(self, *args, **options):
+        problems, prefix_tokens = check_prefix_stability(options["min_tokens"])
+
+        for name, version in prompt_versions().items():
+            tokens = prefix_tokens.get(name)
+            self.stdout.write(f"{name}: {version} (공통 접두어 {tokens if tokens is not None else '-'}토큰)")
+
+        if problems:
+            raise CommandError("프롬프트 접두어 검사 실패:\n" + "\n".join(f"- {p}" for p in problems))
+        self.stdout.write(self.style.SUCCESS(f"프롬프트 {len(prompt_versions())}개 접두어 안정성 확인"))
@@ -0,0 +1,213 @@
+# chatbot/metrics.py
+"""
+챗봇 파이프라인 계측
+- LangGraph 노드, LLM/임베딩 호출, 하이브리드 검색의 소요 시간/토큰 수/결과 행 수 기록
+- 요청 단위: chat() 1회의 호출 기록을 debug_info["metrics"]로 첨부
+- 누적: Prometheus 텍스트 형식 히스토그램/카운터를 /api/metrics로 노출
+  (프로세스 단위 누적 - gunicorn 워커마다 따로 집계되므로 워커별 스크레이프 또는 합산 필요)
+"""
+import time
+import threading
+import functools
+import contextvars
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+ROW_BUCKETS = (0, 1, 5, 10, 25, 50, 100)
+
+# 현재 요청의 호출 기록 / 실행 중인 노드 (LLM·검색 호출을 노드별로 구분)
+_trace: contextvars.ContextVar = contextvars.ContextVar('chatbot_trace', default=None)
+_current_node: contextvars.ContextVar = contextvars.ContextVar('chatbot_node', default=None)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_str(names: Tuple[str, ...], values: Tuple, extra: str = '') -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Histogram:
+    """라벨별 누적 히스토그램 (Prometheus histogram)"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.series: Dict[Tuple, list] = {}   # 라벨값 -> [버킷별 개수..., 합계, 개수]
+        self.lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(n, '') for n in self.label_names)
+        idx = bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.series.setdefault(key, [0] * (len(self.buckets) + 2))
+            if idx < len(self.buckets):
+                series[idx] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for key, series in sorted(self.series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, series):
+                    cumulative += count
+                    labels = _label_str(self.label_names, key, 'le="%s"' % bound)
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _label_str(self.label_names, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+                lines.append(f"{self.name}_sum{_label_str(self.label_names, key)} {round(series[-2], 6)}")
+                lines.append(f"{self.name}_count{_label_str(self.label_names, key)} {series[-1]}")
+        return lines
+
+
+class Counter:
+    """라벨별 누적 카운터 (Prometheus counter)"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.values: Dict[Tuple, float] = {}
+        self.lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(n, '') for n in self.label_names)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{_label_str(self.label_names, key)} {value}")
+        return lines
+
+
+REGISTRY: List = []
+# 요청 시점에 값을 읽어 노출하는 수집 함수 (예: 답변 캐시 적중률) - Prometheus 텍스트 줄 리스트 반환
+COLLECTORS: List[Callable[[], List[str]]] = []
+
+CHAT_SECONDS = Histogram('zipfit_chat_duration_seconds', '채팅 요청 전체 처리 시간', ('intent',))
+NODE_SECONDS = Histogram('zipfit_node_duration_seconds', 'LangGraph 노드 실행 시간', ('node',))
+LLM_SECONDS = Histogram('zipfit_llm_duration_seconds', 'OpenAI API 호출 시간', ('kind', 'node'))
+LLM_PROMPT_TOKENS = Histogram('zipfit_llm_prompt_tokens', 'LLM 호출 1회 입력 토큰 수', ('kind', 'node'), TOKEN_BUCKETS)
+LLM_TOKENS = Counter('zipfit_llm_tokens_total', 'OpenAI 토큰 사용량 (type: prompt/completion/cached)', ('kind', 'node', 'type'))
+SEARCH_SECONDS = Histogram('zipfit_search_duration_seconds', '검색 SQL 실행 시간', ('search', 'node'))
+SEARCH_ROWS = Histogram('zipfit_search_rows', '검색 결과 행 수', ('search', 'node'), ROW_BUCKETS)
+
+
+def register_collector(collector: Callable[[], List[str]]):
+    COLLECTORS.append(collector)
+
+
+def render_prometheus() -> str:
+    """누적 지표 -> Prometheus 텍스트 노출 형식"""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.collect())
+    for collector in COLLECTORS:
+        try:
+            lines.extend(collector())
+        except Exception as e:
+            lines.append(f"# collector error: {_escape(e)}")
+    return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# 요청 단위 기록
+# =============================================================================
+def start_trace() -> list:
+    """chat() 시작 시 호출 - 이후 같은 컨텍스트의 호출 기록을 모음"""
+    records = []
+    _trace.set(records)
+    return records
+
+
+def set_usage(rec: dict, usage):
+    """OpenAI 응답 usage -> 기록 (prompt/completion/cached 토큰)"""
+    if usage is None:
+        return
+    rec['prompt_tokens'] = getattr(usage, 'prompt_tokens', 0) or 0
+    rec['completion_tokens'] = getattr(usage, 'completion_tokens', 0) or 0
+    details = getattr(usage, 'prompt_tokens_details', None)
+    rec['cached_tokens'] = getattr(details, 'cached_tokens', 0) or 0
+
+
+def _observe(rec: dict):
+    kind, seconds, node = rec['kind'], rec['seconds'], rec.get('node') or ''
+    if kind == 'node':
+        NODE_SECONDS.observe(seconds, node=rec['name'])
+    elif kind in ('llm', 'embedding'):
+        LLM_SECONDS.observe(seconds, kind=kind, node=node)
+        if 'prompt_tokens' in rec:
+            LLM_PROMPT_TOKENS.observe(rec['prompt_tokens'], kind=kind, node=node)
+            for token_type in ('prompt', 'completion', 'cached'):
+                LLM_TOKENS.inc(rec.get(f'{token_type}_tokens', 0), kind=kind, node=node, type=token_type)
+    elif kind == 'search':
+        SEARCH_SECONDS.observe(seconds, search=rec['name'], node=node)
+        if 'rows' in rec:
+            SEARCH_ROWS.observe(rec['rows'], search=rec['name'], node=node)
+
+
+@contextmanager
+def timed(kind: str, name: str):
+    """
+    구간 시간 측정 - 블록 안에서 반환된 rec에 토큰 수/행 수를 채우면 함께 기록
+
+    :param kind: node / llm / embedding / search
+    :param name: 노드명, 호출 위치 등
+    """
+    rec = {'kind': kind, 'name': name}
+    node = _current_node.get()
+    if node and kind != 'node':
+        rec['node'] = node
+    start = time.perf_counter()
+    try:
+        yield rec
+    finally:
+        rec['seconds'] = round(time.perf_counter() - start, 4)
+        _observe(rec)
+        records = _trace.get()
+        if records is not None:
+            records.append(rec)
+
+
+def instrument_node(name: str, fn: Callable) -> Callable:
+    """LangGraph 노드 함수 래핑 - 실행 시간 기록, 노드 안의 LLM/검색 호출에 노드명 부여"""
+    @functools.wraps(fn)
+    def wrapper(state):
+        token = _current_node.set(name)
+        try:
+            with timed('node', name):
+                return fn(state)
+        finally:
+            _current_node.reset(token)
+    return wrapper
+
+
+def summarize_trace(records: List[dict], total_seconds: Optional[float] = None) -> dict:
+    """요청 1회 기록 -> debug_info용 요약"""
+    summary = {
+        "nodes": {r['name']: r['seconds'] for r in records if r['kind'] == 'node'},
+        "llm_calls": sum(1 for r in records if r['kind'] == 'llm'),
+        "prompt_tokens": sum(r.get('prompt_tokens', 0) for r in records if r['kind'] == 'llm'),
+        "completion_tokens": sum(r.get('completion_tokens', 0) for r in records if r['kind'] == 'llm'),
+        "cached_tokens": sum(r.get('cached_tokens', 0) for r in records if r['kind'] == 'llm'),
+        "calls": [r for r in records if r['kind'] != 'node'],
+    }
+    if total_seconds is not None:
+        summary["total_seconds"] = round(total_seconds, 4)
+    return summary
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="docchunks",
+            name="chunk_text_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                max_length=64,
+                null=True,
+                verbose_name="청크 텍스트 해시",
+            ),
+        ),
+        # 기존 청크 해시 채우기 (embedder.chunk_text_hash와 동일: 공백 통일 후 SHA-256)
+        migrations.RunSQL(
+            sql="""
+                UPDATE doc_chunks
+                SET chunk_text_hash = encode(sha256(convert_to(
+                    regexp_replace(btrim(chunk_text, E' \\t\\n\\r\\f'), '\\s+', ' ', 'g'),
+                    'UTF8')), 'hex')
+                WHERE chunk_text_hash IS NULL;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
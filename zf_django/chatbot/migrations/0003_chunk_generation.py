@@ -0,0 +1,49 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0002_docchunks_chunk_text_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="anncall",
+            name="active_generation",
+            field=models.IntegerField(
+                blank=True, null=True, verbose_name="활성 청크 세대"
+            ),
+        ),
+        migrations.AddField(
+            model_name="anncfiles",
+            name="generation",
+            field=models.IntegerField(default=1, verbose_name="적재 세대"),
+        ),
+        migrations.AddField(
+            model_name="docchunks",
+            name="generation",
+            field=models.IntegerField(default=1, verbose_name="적재 세대"),
+        ),
+        migrations.AddIndex(
+            model_name="anncfiles",
+            index=models.Index(
+                fields=["annc_id", "generation"], name="annc_files_annc_gen_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="docchunks",
+            index=models.Index(
+                fields=["annc_id", "generation"], name="doc_chunks_annc_gen_idx"
+            ),
+        ),
+        # 기존 파일/청크는 모두 1세대 -> 기존 공고의 활성 세대를 1로 지정
+        migrations.RunSQL(
+            sql="""
+                UPDATE annc_all
+                SET active_generation = 1
+                WHERE active_generation IS NULL;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
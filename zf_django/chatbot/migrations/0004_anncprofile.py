@@ -0,0 +1,64 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0003_chunk_generation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnncProfile",
+            fields=[
+                (
+                    "profile_id",
+                    models.BigAutoField(
+                        primary_key=True, serialize=False, verbose_name="프로필 ID"
+                    ),
+                ),
+                ("generation", models.IntegerField(verbose_name="적재 세대")),
+                (
+                    "eligibility",
+                    models.JSONField(blank=True, null=True, verbose_name="신청자격"),
+                ),
+                (
+                    "rent",
+                    models.JSONField(blank=True, null=True, verbose_name="임대조건"),
+                ),
+                (
+                    "area",
+                    models.JSONField(blank=True, null=True, verbose_name="전용면적"),
+                ),
+                (
+                    "schedule",
+                    models.JSONField(blank=True, null=True, verbose_name="신청기간/일정"),
+                ),
+                (
+                    "documents",
+                    models.JSONField(blank=True, null=True, verbose_name="제출서류"),
+                ),
+                ("model_name", models.CharField(max_length=50, verbose_name="추출 모델")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="추출 일시"),
+                ),
+                (
+                    "annc_id",
+                    models.ForeignKey(
+                        db_column="annc_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="chatbot.anncall",
+                        verbose_name="공고 ID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "공고 구조화 프로필",
+                "verbose_name_plural": "공고 구조화 프로필",
+                "db_table": "annc_profile",
+                "unique_together": {("annc_id", "generation")},
+            },
+        ),
+    ]
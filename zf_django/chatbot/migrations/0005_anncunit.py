@@ -0,0 +1,103 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0004_anncprofile"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnncUnit",
+            fields=[
+                (
+                    "unit_id",
+                    models.BigAutoField(
+                        primary_key=True, serialize=False, verbose_name="공급 단위 ID"
+                    ),
+                ),
+                ("generation", models.IntegerField(verbose_name="적재 세대")),
+                (
+                    "complex_name",
+                    models.CharField(
+                        blank=True, max_length=200, null=True, verbose_name="단지명"
+                    ),
+                ),
+                (
+                    "unit_type",
+                    models.CharField(
+                        blank=True, max_length=50, null=True, verbose_name="주택형"
+                    ),
+                ),
+                (
+                    "exclusive_area",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        max_digits=8,
+                        null=True,
+                        verbose_name="전용면적(㎡)",
+                    ),
+                ),
+                (
+                    "supply_area",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=2,
+                        max_digits=8,
+                        null=True,
+                        verbose_name="공급면적(㎡)",
+                    ),
+                ),
+                (
+                    "deposit",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="임대보증금(원)"
+                    ),
+                ),
+                (
+                    "monthly_rent",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="월임대료(원)"
+                    ),
+                ),
+                (
+                    "supply_count",
+                    models.IntegerField(blank=True, null=True, verbose_name="공급호수"),
+                ),
+                ("page_num", models.SmallIntegerField(verbose_name="페이지 번호")),
+                (
+                    "annc_id",
+                    models.ForeignKey(
+                        db_column="annc_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="chatbot.anncall",
+                        verbose_name="공고 ID",
+                    ),
+                ),
+                (
+                    "file_id",
+                    models.ForeignKey(
+                        blank=True,
+                        db_column="file_id",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="chatbot.anncfiles",
+                        verbose_name="공고 파일 ID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "공고 공급 단위",
+                "verbose_name_plural": "공고 공급 단위",
+                "db_table": "annc_unit",
+                "indexes": [
+                    models.Index(
+                        fields=["annc_id", "generation"], name="annc_unit_annc_gen_idx"
+                    )
+                ],
+            },
+        ),
+    ]
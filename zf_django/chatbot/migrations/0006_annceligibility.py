@@ -0,0 +1,81 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0005_anncunit"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnncEligibility",
+            fields=[
+                (
+                    "rule_id",
+                    models.BigAutoField(
+                        primary_key=True, serialize=False, verbose_name="자격 기준 ID"
+                    ),
+                ),
+                ("generation", models.IntegerField(verbose_name="적재 세대")),
+                (
+                    "group_name",
+                    models.CharField(
+                        blank=True, max_length=50, null=True, verbose_name="공급대상"
+                    ),
+                ),
+                (
+                    "min_age",
+                    models.SmallIntegerField(blank=True, null=True, verbose_name="최소 연령"),
+                ),
+                (
+                    "max_age",
+                    models.SmallIntegerField(blank=True, null=True, verbose_name="최대 연령"),
+                ),
+                (
+                    "marital_status",
+                    models.CharField(
+                        blank=True,
+                        choices=[("married", "혼인 중"), ("single", "미혼")],
+                        max_length=10,
+                        null=True,
+                        verbose_name="혼인 조건",
+                    ),
+                ),
+                (
+                    "max_income_pct",
+                    models.SmallIntegerField(
+                        blank=True,
+                        null=True,
+                        verbose_name="소득 상한(도시근로자 월평균소득 대비 %)",
+                    ),
+                ),
+                (
+                    "min_children",
+                    models.SmallIntegerField(
+                        blank=True, null=True, verbose_name="최소 자녀 수"
+                    ),
+                ),
+                (
+                    "annc_id",
+                    models.ForeignKey(
+                        db_column="annc_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="chatbot.anncall",
+                        verbose_name="공고 ID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "공고 자격 기준",
+                "verbose_name_plural": "공고 자격 기준",
+                "db_table": "annc_eligibility",
+                "indexes": [
+                    models.Index(
+                        fields=["annc_id", "generation"], name="annc_elig_annc_gen_idx"
+                    )
+                ],
+            },
+        ),
+    ]
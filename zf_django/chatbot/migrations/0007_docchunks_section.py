@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0006_annceligibility"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="docchunks",
+            name="section_path",
+            field=models.CharField(
+                blank=True, max_length=500, null=True, verbose_name="헤딩 경로"
+            ),
+        ),
+        migrations.AddField(
+            model_name="docchunks",
+            name="section_category",
+            field=models.CharField(
+                blank=True, max_length=20, null=True, verbose_name="섹션 카테고리"
+            ),
+        ),
+        migrations.AddField(
+            model_name="docchunks",
+            name="has_numeric_table",
+            field=models.BooleanField(blank=True, null=True, verbose_name="수치 표 여부"),
+        ),
+        migrations.AddIndex(
+            model_name="docchunks",
+            index=models.Index(
+                fields=["annc_id", "generation", "section_category"],
+                name="doc_chunks_annc_gen_cat_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0007_docchunks_section"),
+    ]
+
+    operations = [
+        # 크롤러 COPY 적재(스테이징 INSERT ... SELECT)에서 미리 계산한 fts_vector는 다시 계산하지 않음
+        # (UPDATE는 chunk_text 변경 반영을 위해 항상 재계산)
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION doc_chunks_fts_trigger() RETURNS trigger
+                LANGUAGE plpgsql
+                AS $$
+                BEGIN
+                    IF TG_OP = 'UPDATE' OR NEW.fts_vector IS NULL THEN
+                        NEW.fts_vector := to_tsvector('simple', NEW.chunk_text);
+                    END IF;
+                    RETURN NEW;
+                END
+                $$;
+            """,
+            reverse_sql="""
+                CREATE OR REPLACE FUNCTION doc_chunks_fts_trigger() RETURNS trigger
+                LANGUAGE plpgsql
+                AS $$
+                BEGIN
+                    NEW.fts_vector := to_tsvector('simple', NEW.chunk_text);
+                    RETURN NEW;
+                END
+                $$;
+            """,
+        ),
+    ]
@@ -86,6 +86,8 @@ class AnncAll(models.Model):
     annc_deadline_dt = models.CharField(max_length=50, verbose_name="마감일")
     annc_status = models.CharField(max_length=20, verbose_name="공고 상태")
     service_status = models.CharField(max_length=20, verbose_name="서비스 상태")
+    # 검색에 노출되는 파일/청크 세대 (NULL이면 아직 적재 완료된 세대 없음)
+    active_generation = models.IntegerField(null=True, blank=True, verbose_name="활성 청크 세대")
     
     class Meta:
         verbose_name = "공고 전체 테이블"
@@ -113,6 +115,8 @@ class AnncFiles(models.Model):
     file_path = models.CharField(max_length=2000, verbose_name="공고 파일 경로", null=True)
     file_ext = models.CharField(max_length=10, verbose_name="공고 파일 확장자")
     file_size = models.IntegerField(verbose_name="공고 파일 사이즈")
+    # 적재 세대 - 새 세대를 기존 세대 옆에 만든 뒤 AnncAll.active_generation 갱신으로 교체
+    generation = models.IntegerField(default=1, verbose_name="적재 세대")
 
     class Meta:
         verbose_name = "공고 파일"
@@ -121,6 +125,9 @@ class AnncFiles(models.Model):
         # 복합 기본 키 역할: FILE_ID와 ANNC_ID의 조합이 고유해야 함 (스키마 기준)
         # Django는 단일 PK를 선호하므로, 고유성 제약만 추가합니다.
         unique_together = ('file_id', 'annc_id')
+        indexes = [
+            models.Index(fields=['annc_id', 'generation'], name='annc_files_annc_gen_idx'),
+        ]
 
 class DocChunks(models.Model):
     """ 공고 파일 청크 벡터 테이블 (DOC_CHUNKS) """
@@ -158,6 +165,17 @@ class DocChunks(models.Model):
 
     # 전문검색용 tsvector 컬럼
     fts_vector = TSVectorField(null=True, blank=True, verbose_name="전문 검색 벡터")
+
+    # 정규화(공백 통일) 청크 텍스트 SHA-256 - 공고 간 동일 문구의 임베딩 재사용 키
+    chunk_text_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True, verbose_name="청크 텍스트 해시")
+
+    # 적재 세대 - 공고의 active_generation과 같은 청크만 검색 대상
+    generation = models.IntegerField(default=1, verbose_name="적재 세대")
+
+    # 청킹 시 기록하는 섹션 정보 - 상세 질문은 질문 유형에 맞는 카테고리 청크만 검색 (이전 적재분은 NULL)
+    section_path = models.CharField(max_length=500, null=True, blank=True, verbose_name="헤딩 경로")
+    section_category = models.CharField(max_length=20, null=True, blank=True, verbose_name="섹션 카테고리")
+    has_numeric_table = models.BooleanField(null=True, blank=True, verbose_name="수치 표 여부")
     
     class Meta:
         verbose_name = "공고 파일 청크 벡터"
@@ -165,6 +183,127 @@ class DocChunks(models.Model):
         db_table = 'doc_chunks'
         # 복합 기본 키 역할
         unique_together = ('chunk_id', 'file_id', 'annc_id')
+        indexes = [
+            models.Index(fields=['annc_id', 'generation'], name='doc_chunks_annc_gen_idx'),
+            models.Index(fields=['annc_id', 'generation', 'section_category'], name='doc_chunks_annc_gen_cat_idx'),
+        ]
+
+
+class AnncProfile(models.Model):
+    """ 공고 구조화 프로필 (ANNC_PROFILE) - 적재 세대별 1건, 항목별 JSONB {summary, detail, pages} """
+
+    # 기본 키 (BIGSERIAL)
+    profile_id = models.BigAutoField(primary_key=True, verbose_name="프로필 ID")
+
+    # 외래 키 (BIGSERIAL)
+    annc_id = models.ForeignKey(
+        'AnncAll',
+        on_delete=models.CASCADE,
+        verbose_name="공고 ID",
+        db_column='annc_id'
+    )
+    # 추출 대상 청크 세대 - 공고의 active_generation과 같은 프로필만 사용
+    generation = models.IntegerField(verbose_name="적재 세대")
+
+    # 항목별 프로필 (공고문에서 찾지 못하면 NULL -> RAG로 대체)
+    eligibility = models.JSONField(null=True, blank=True, verbose_name="신청자격")
+    rent = models.JSONField(null=True, blank=True, verbose_name="임대조건")
+    area = models.JSONField(null=True, blank=True, verbose_name="전용면적")
+    schedule = models.JSONField(null=True, blank=True, verbose_name="신청기간/일정")
+    documents = models.JSONField(null=True, blank=True, verbose_name="제출서류")
+
+    model_name = models.CharField(max_length=50, verbose_name="추출 모델")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="추출 일시")
+
+    class Meta:
+        verbose_name = "공고 구조화 프로필"
+        verbose_name_plural = "공고 구조화 프로필"
+        db_table = 'annc_profile'
+        unique_together = ('annc_id', 'generation')
+
+
+class AnncUnit(models.Model):
+    """ 공고 공급 단위 (ANNC_UNIT) - 공고문 표에서 추출한 단지/주택형별 면적·임대조건 (적재 세대별) """
+
+    # 기본 키 (BIGSERIAL)
+    unit_id = models.BigAutoField(primary_key=True, verbose_name="공급 단위 ID")
+
+    # 외래 키 (BIGSERIAL)
+    annc_id = models.ForeignKey(
+        'AnncAll',
+        on_delete=models.CASCADE,
+        verbose_name="공고 ID",
+        db_column='annc_id'
+    )
+    file_id = models.ForeignKey(
+        'AnncFiles',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name="공고 파일 ID",
+        db_column='file_id'
+    )
+    # 추출 대상 파일 세대 - 공고의 active_generation과 같은 행만 사용
+    generation = models.IntegerField(verbose_name="적재 세대")
+
+    # 데이터 필드 (표에서 찾지 못한 항목은 NULL)
+    complex_name = models.CharField(max_length=200, null=True, blank=True, verbose_name="단지명")
+    unit_type = models.CharField(max_length=50, null=True, blank=True, verbose_name="주택형")
+    exclusive_area = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True, verbose_name="전용면적(㎡)")
+    supply_area = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True, verbose_name="공급면적(㎡)")
+    deposit = models.BigIntegerField(null=True, blank=True, verbose_name="임대보증금(원)")
+    monthly_rent = models.BigIntegerField(null=True, blank=True, verbose_name="월임대료(원)")
+    supply_count = models.IntegerField(null=True, blank=True, verbose_name="공급호수")
+    page_num = models.SmallIntegerField(verbose_name="페이지 번호")
+
+    class Meta:
+        verbose_name = "공고 공급 단위"
+        verbose_name_plural = "공고 공급 단위"
+        db_table = 'annc_unit'
+        indexes = [
+            models.Index(fields=['annc_id', 'generation'], name='annc_unit_annc_gen_idx'),
+        ]
+
+
+class AnncEligibility(models.Model):
+    """ 공고 공급대상별 자격 기준 (ANNC_ELIGIBILITY) - 검색 시 사용자 프로필로 자격 없는 공고를 사전 제외 (적재 세대별)
+
+    공고는 공급대상 행 중 하나라도 사용자 조건을 만족하면 검색 대상 (행이 없는 공고는 항상 대상)
+    """
+
+    MARITAL_CHOICES = [
+        ('married', '혼인 중'),
+        ('single', '미혼'),
+    ]
+
+    # 기본 키 (BIGSERIAL)
+    rule_id = models.BigAutoField(primary_key=True, verbose_name="자격 기준 ID")
+
+    # 외래 키 (BIGSERIAL)
+    annc_id = models.ForeignKey(
+        'AnncAll',
+        on_delete=models.CASCADE,
+        verbose_name="공고 ID",
+        db_column='annc_id'
+    )
+    # 추출 대상 청크 세대 - 공고의 active_generation과 같은 행만 사용
+    generation = models.IntegerField(verbose_name="적재 세대")
+
+    # 자격 조건 (NULL이면 해당 조건 없음)
+    group_name = models.CharField(max_length=50, null=True, blank=True, verbose_name="공급대상")
+    min_age = models.SmallIntegerField(null=True, blank=True, verbose_name="최소 연령")
+    max_age = models.SmallIntegerField(null=True, blank=True, verbose_name="최대 연령")
+    marital_status = models.CharField(max_length=10, choices=MARITAL_CHOICES, null=True, blank=True, verbose_name="혼인 조건")
+    max_income_pct = models.SmallIntegerField(null=True, blank=True, verbose_name="소득 상한(도시근로자 월평균소득 대비 %)")
+    min_children = models.SmallIntegerField(null=True, blank=True, verbose_name="최소 자녀 수")
+
+    class Meta:
+        verbose_name = "공고 자격 기준"
+        verbose_name_plural = "공고 자격 기준"
+        db_table = 'annc_eligibility'
+        indexes = [
+            models.Index(fields=['annc_id', 'generation'], name='annc_elig_annc_gen_idx'),
+        ]
 
 
 
@@ -0,0 +1,175 @@
+# chatbot/prompt_check.py
+"""
+프롬프트 접두어 안정성 검사 (manage.py check_prompts)
+- graph.py의 실제 노드 함수를 서로 다른 상태 2개로 실행하고, LLM에 보내려던 messages를 가로채 비교
+  (LLM/DB 메타데이터/답변 캐시 호출은 검사하는 동안만 고정 값으로 대체 - 네트워크/DB 불필요)
+- 두 요청의 공통 접두어가 템플릿 고정 지침을 모두 포함하는지 확인 (지침에 동적 값이 섞이거나 섹션 순서가 바뀌면 실패)
+- 공통 접두어가 공급자 최소 캐시 길이(OpenAI 1024토큰) 이상인지 확인 (미만이면 자동 프롬프트 캐싱 대상이 아님)
+"""
+import os
+from contextlib import ExitStack
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Tuple
+from unittest import mock
+
+from . import graph, conversation_summary
+from .context_packer import count_tokens
+from .prompts import PROMPTS
+
+# OpenAI 자동 프롬프트 캐싱 최소 접두어 길이 (토큰)
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# 검사용 DB 메타데이터 (ChatbotConfig.get 대체)
+_DB_META = {
+    "statuses": ["공고중", "접수중", "접수마감"],
+    "regions": ["서울특별시", "부산광역시", "경기도", "전라남도"],
+    "dtl_types": ["행복주택", "국민임대", "영구임대"],
+}
+
+
+def _annc(annc_id: int, title: str, region: str, status: str, deadline: str) -> dict:
+    return {
+        "annc_id": annc_id, "annc_title": title, "annc_region": region, "annc_status": status,
+        "annc_deadline_dt": deadline, "annc_dtl_type": "행복주택", "annc_url": f"https://apply.lh.or.kr/{annc_id}",
+    }
+
+
+def _doc(chunk_id: int, annc_id: int, page: int, text: str, score: float) -> dict:
+    return {"chunk_id": chunk_id, "annc_id": annc_id, "page_num": page, "chunk_text": text, "rrf_score": score}
+
+
+def _states() -> Tuple[dict, dict]:
+    """질문/프로필/대화/공고/문서가 모두 다른 그래프 상태 2개"""
+    first_anncs = [
+        _annc(101, "서울 가양 행복주택 입주자 모집", "서울특별시", "접수중", "2099-01-31"),
+        _annc(102, "경기 화성동탄 행복주택 예비입주자 모집", "경기도", "공고중", "2099-02-15"),
+    ]
+    second_anncs = [
+        _annc(201, "부산 명지 국민임대 입주자 모집", "부산광역시", "접수중", "2099-03-10"),
+        _annc(202, "나주이창 행복주택 추가 모집", "전라남도", "접수마감", "2099-03-20"),
+        _annc(203, "익산부송 영구임대 예비입주자 모집", "전라남도", "공고중", ""),
+    ]
+    first = {
+        "question": "서울 행복주택 공고 알려줘",
+        "chat_history": [
+            {"role": "user", "content": "안녕하세요"},
+            {"role": "assistant", "content": "무엇을 도와드릴까요?"},
+        ],
+        "conversation_summary": "",
+        "intent_data": {},
+        "search_history": [],
+        "prev_anncs": first_anncs,
+        "selected_annc": first_anncs[0],
+        "selected_anncs": first_anncs,
+        "retrieved_docs": [
+            _doc(1, 101, 3, "신청자격: 무주택 청년(만 19~39세), 소득 100% 이하", 0.03),
+            _doc(2, 102, 5, "| 주택형 | 전용면적 | 임대보증금 |\n|---|---|---|\n| 26A | 26.0 | 30,000,000 |", 0.02),
+        ],
+        "user_profile": {"ref_hope_area": "서울", "ref_age": 29},
+        "debug_info": {},
+    }
+    second = {
+        "question": "2번 신청자격은?",
+        "chat_history": [
+            {"role": "user", "content": "부산 국민임대 찾아줘"},
+            {"role": "assistant", "content": "부산 공고 3건을 찾았습니다."},
+            {"role": "user", "content": "나주도 같이 보여줘"},
+            {"role": "assistant", "content": "나주이창 공고를 추가했습니다."},
+        ],
+        "conversation_summary": "- 희망 지역: 부산, 전라남도\n- 대상: 신혼부부",
+        "intent_data": {"auto_select_first": True},
+        "search_history": [{"query": "부산 국민임대"}, {"query": "나주 행복주택"}],
+        "prev_anncs": second_anncs,
+        "selected_annc": second_anncs[1],
+        "selected_anncs": second_anncs[:2],
+        "retrieved_docs": [
+            _doc(11, 202, 2, "입주자격: 혼인 7년 이내 신혼부부 " * 20, 0.05),
+            _doc(12, 201, 7, "임대조건: 월 임대료 180,000원", 0.04),
+            _doc(13, 202, 9, "제출서류: 주민등록등본, 가족관계증명서", 0.01),
+        ],
+        "user_profile": {"ref_marriged": "Y", "ref_children": 1, "ref_income": 5000},
+        "debug_info": {},
+    }
+    return first, second
+
+
+# 템플릿별 실제 노드 실행 경로 (PROMPTS의 모든 템플릿이 있어야 함)
+_NODE_RUNNERS: Dict[str, Callable[[dict], object]] = {
+    "intent": graph.classify_intent,
+    "expand_query": lambda state: graph.expand_query(state["question"]),
+    "chat": graph.general_chat,
+    "search_response": graph.generate_search_response,
+    "detail_response": graph.generate_detail_response,
+    "compare_response": graph.generate_compare_response,
+    "conversation_summary": lambda state: conversation_summary.summarize(
+        state["conversation_summary"], state["chat_history"]
+    ),
+}
+
+
+def _capture_messages(runner: Callable[[dict], object], state: dict) -> List[dict]:
+    """노드를 실행하고 LLM에 보내려던 마지막 messages를 반환"""
+    captured = []
+
+    def fake_completion(**kwargs):
+        captured.append(kwargs["messages"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))])
+
+    answer_cache = SimpleNamespace(get=lambda key: None, set=lambda *args, **kwargs: None, stats=dict)
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(graph, "create_chat_completion", fake_completion))
+        stack.enter_context(mock.patch.object(graph, "get_answer_cache", lambda: answer_cache))
+        stack.enter_context(mock.patch.object(
+            graph.ChatbotConfig, "get", classmethod(lambda cls, key: list(_DB_META.get(key, [])))
+        ))
+        stack.enter_context(mock.patch.object(
+            graph.AnncAllService, "get_active_generation", staticmethod(lambda annc_id: 1)
+        ))
+        runner(state)
+    if not captured:
+        raise RuntimeError("LLM 호출 없음")
+    return captured[-1]
+
+
+def _request_text(messages: List[dict]) -> str:
+    """messages를 순서대로 이어 붙인 요청 본문 (캐시 접두어 비교용)"""
+    return "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+
+
+def check_prefix_stability(min_tokens: int = PROMPT_CACHE_MIN_TOKENS) -> Tuple[List[str], Dict[str, int]]:
+    """
+    모든 템플릿을 실제 노드로 2번 실행해 요청 공통 접두어를 검사
+
+    :param min_tokens: 공통 접두어 최소 토큰 수 (0이면 길이 검사 생략)
+    :return: (문제 목록 - 비어 있으면 통과, {템플릿 이름: 공통 접두어 토큰 수})
+    """
+    problems, prefix_tokens = [], {}
+    for name, template in PROMPTS.items():
+        if name != template.name:
+            problems.append(f"{name}: 레지스트리 키와 템플릿 이름({template.name})이 다름")
+        runner = _NODE_RUNNERS.get(name)
+        if runner is None:
+            problems.append(f"{name}: 검사할 노드 실행 경로가 없음 (prompt_check._NODE_RUNNERS에 추가)")
+            continue
+
+        try:
+            requests = [_capture_messages(runner, state) for state in _states()]
+        except Exception as e:
+            problems.append(f"{name}: 노드 실행 실패 ({e})")
+            continue
+
+        if not all(messages[0]["content"].startswith(template.instructions) for messages in requests):
+            problems.append(f"{name}: 시스템 프롬프트가 고정 지침으로 시작하지 않음")
+            continue
+
+        first, second = (_request_text(messages) for messages in requests)
+        common = os.path.commonprefix([first, second])
+        fixed = len(_request_text([{"role": "system", "content": template.instructions}]))
+        if len(common) < fixed:
+            problems.append(f"{name}: 공통 접두어 {len(common)}자 < 고정 지침 {fixed}자")
+            continue
+
+        prefix_tokens[name] = count_tokens(common)
+        if prefix_tokens[name] < min_tokens:
+            problems.append(f"{name}: 공통 접두어 {prefix_tokens[name]}토큰 < 최소 캐시 길이 {min_tokens}토큰")
+    return problems, prefix_tokens
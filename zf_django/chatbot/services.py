@@ -7,9 +7,11 @@ Django ORM 기반 서비스 레이어
 
 import re
 from typing import List, Dict, Any, Optional
-from django.db.models import Q, F
+from django.conf import settings
+from django.db.models import Q, F, Exists, OuterRef
 from django.db import connection
-from .models import AnncAll, DocChunks, AnncFiles, Chat, ChatMessage
+from . import metrics
+from .models import AnncAll, DocChunks, AnncFiles, AnncProfile, AnncUnit, AnncEligibility, Chat, ChatMessage
 
 
 # 한국어 조사 제거 패턴
@@ -103,6 +105,17 @@ class AnncAllService:
             'annc_deadline_dt', 'annc_status', 'service_status'
         ).order_by('annc_id'))
 
+    @staticmethod
+    def get_active_generation(annc_id: int) -> Optional[int]:
+        """공고의 활성 청크 세대 (답변 캐시의 코퍼스 버전)"""
+        return AnncAll.objects.filter(annc_id=annc_id).values_list('active_generation', flat=True).first()
+
+
+# 공고의 활성 세대 청크만 검색 (재적재 중인 새 세대/교체된 이전 세대 제외)
+ACTIVE_GENERATION_JOIN = """
+    JOIN annc_all a ON a.annc_id = dc.annc_id AND dc.generation = a.active_generation
+"""
+
 
 class DocChunkService:
     """문서 청크 관련 서비스"""
@@ -118,15 +131,16 @@ class DocChunkService:
         """
         # annc_id 필터 조건
         if annc_id_filter:
-            annc_filter = f"AND annc_id IN ({','.join(map(str, annc_id_filter))})"
+            annc_filter = f"AND dc.annc_id IN ({','.join(map(str, annc_id_filter))})"
         else:
             annc_filter = ""
 
         query = f"""
-            SELECT chunk_id, chunk_text, chunk_type, page_num,
-                   annc_id, file_id, embedding <-> %s::vector AS distance
-            FROM doc_chunks
-            WHERE embedding IS NOT NULL {annc_filter}
+            SELECT dc.chunk_id, dc.chunk_text, dc.chunk_type, dc.page_num,
+                   dc.annc_id, dc.file_id, dc.embedding <-> %s::vector AS distance
+            FROM doc_chunks dc
+            {ACTIVE_GENERATION_JOIN}
+            WHERE dc.embedding IS NOT NULL {annc_filter}
             ORDER BY distance
             LIMIT %s
         """
@@ -146,7 +160,8 @@ class DocChunkService:
         fts_weight: float = 0.4,
         vec_weight: float = 0.6,
         rrf_k: int = 60,
-        annc_id_filter: Optional[List[int]] = None
+        annc_id_filter: Optional[List[int]] = None,
+        section_categories: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         FTS와 벡터 검색을 결합한 하이브리드 검색 (RRF 리랭킹).
@@ -158,7 +173,8 @@ class DocChunkService:
         :param vec_weight: 벡터 유사도 가중치
         :param rrf_k: RRF 상수 (기본 60)
         :param annc_id_filter: 특정 공고 ID만 검색 (None이면 전체 검색)
-        :return: 검색 결과 리스트
+        :param section_categories: 해당 섹션 카테고리 청크만 검색 (None이면 전체, doc_chunks_annc_gen_cat_idx 사용)
+        :return: 검색 결과 리스트 (section_path, section_category 포함)
         """
         # 한국어 조사 제거 후 FTS 쿼리 생성
         processed_query = strip_particles(query_text)
@@ -174,26 +190,32 @@ class DocChunkService:
         # annc_id 필터 조건 생성
         if annc_id_filter:
             annc_ids_str = ','.join(map(str, annc_id_filter))
-            annc_filter_fts = f"AND annc_id IN ({annc_ids_str})"
-            annc_filter_vec = f"AND annc_id IN ({annc_ids_str})"
+            annc_filter_fts = f"AND dc.annc_id IN ({annc_ids_str})"
+            annc_filter_vec = f"AND dc.annc_id IN ({annc_ids_str})"
         else:
             annc_filter_fts = ""
             annc_filter_vec = ""
 
+        # 섹션 카테고리 필터 (문자열이므로 파라미터로 전달)
+        category_filter = "AND dc.section_category = ANY(%s)" if section_categories else ""
+        category_params = [list(section_categories)] if section_categories else []
+
         query = f"""
             WITH fts_results AS (
-                SELECT chunk_id,
-                       ts_rank(fts_vector, to_tsquery('simple', %s)) AS fts_score,
-                       ROW_NUMBER() OVER (ORDER BY ts_rank(fts_vector, to_tsquery('simple', %s)) DESC) AS fts_rank
-                FROM doc_chunks
-                WHERE fts_vector @@ to_tsquery('simple', %s) {annc_filter_fts}
+                SELECT dc.chunk_id,
+                       ts_rank(dc.fts_vector, to_tsquery('simple', %s)) AS fts_score,
+                       ROW_NUMBER() OVER (ORDER BY ts_rank(dc.fts_vector, to_tsquery('simple', %s)) DESC) AS fts_rank
+                FROM doc_chunks dc
+                {ACTIVE_GENERATION_JOIN}
+                WHERE dc.fts_vector @@ to_tsquery('simple', %s) {annc_filter_fts} {category_filter}
             ),
             vec_results AS (
-                SELECT chunk_id,
-                       1 - (embedding <=> %s::vector) AS vec_score,
-                       ROW_NUMBER() OVER (ORDER BY embedding <=> %s::vector) AS vec_rank
-                FROM doc_chunks
-                WHERE embedding IS NOT NULL {annc_filter_vec}
+                SELECT dc.chunk_id,
+                       1 - (dc.embedding <=> %s::vector) AS vec_score,
+                       ROW_NUMBER() OVER (ORDER BY dc.embedding <=> %s::vector) AS vec_rank
+                FROM doc_chunks dc
+                {ACTIVE_GENERATION_JOIN}
+                WHERE dc.embedding IS NOT NULL {annc_filter_vec} {category_filter}
                 LIMIT 100
             ),
             combined AS (
@@ -211,6 +233,8 @@ class DocChunkService:
                    d.page_num,
                    d.annc_id,
                    d.file_id,
+                   d.section_path,
+                   d.section_category,
                    c.fts_score,
                    c.vec_score,
                    (%s / (c.fts_rank + %s) + %s / (c.vec_rank + %s)) AS rrf_score
@@ -221,20 +245,143 @@ class DocChunkService:
         """
 
         params = [
-            fts_query, fts_query, fts_query,
-            query_embedding, query_embedding,
+            fts_query, fts_query, fts_query, *category_params,
+            query_embedding, query_embedding, *category_params,
             fts_weight, rrf_k, vec_weight, rrf_k,
             top_k
         ]
 
-        with connection.cursor() as cursor:
+        with metrics.timed('search', 'hybrid_search') as rec, connection.cursor() as cursor:
             cursor.execute(query, params)
             columns = [col[0] for col in cursor.description]
             results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            rec['rows'] = len(results)
 
         return results
 
 
+class AnncProfileService:
+    """공고 구조화 프로필 서비스 (수집 시 세대별로 추출된 ANNC_PROFILE)"""
+
+    FIELDS = ('eligibility', 'rent', 'area', 'schedule', 'documents')
+
+    @staticmethod
+    def get_active_profiles(annc_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        공고별 활성 세대 프로필 조회 (DB 1회)
+
+        :return: {annc_id: {항목: {summary, detail, pages} | None}} (프로필 없는 공고는 제외)
+        """
+        if not annc_ids:
+            return {}
+
+        rows = AnncProfile.objects.filter(
+            annc_id__in=annc_ids,
+            generation=F('annc_id__active_generation')
+        ).values('annc_id', *AnncProfileService.FIELDS)
+        return {row.pop('annc_id'): row for row in rows}
+
+
+class AnncUnitService:
+    """공고 공급 단위 서비스 (수집 시 공고문 표에서 추출된 ANNC_UNIT - 단지/주택형별 면적·임대조건)"""
+
+    FIELDS = (
+        'complex_name', 'unit_type', 'exclusive_area', 'supply_area',
+        'deposit', 'monthly_rent', 'supply_count', 'page_num'
+    )
+
+    @staticmethod
+    def get_active_units(annc_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        공고별 활성 세대 공급 단위 조회 (DB 1회, annc_unit_annc_gen_idx 사용)
+
+        :return: {annc_id: [공급 단위 딕셔너리 (페이지/추출 순)]} (공급 단위 없는 공고는 제외)
+        """
+        if not annc_ids:
+            return {}
+
+        rows = AnncUnit.objects.filter(
+            annc_id__in=annc_ids,
+            generation=F('annc_id__active_generation')
+        ).order_by('annc_id', 'page_num', 'unit_id').values('annc_id', *AnncUnitService.FIELDS)
+
+        units: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            for field in ('exclusive_area', 'supply_area'):
+                if row[field] is not None:
+                    row[field] = float(row[field])
+            units.setdefault(row.pop('annc_id'), []).append(row)
+        return units
+
+
+class AnncEligibilityService:
+    """공고 자격 기준 서비스 (수집 시 추출된 ANNC_ELIGIBILITY - 공급대상별 연령/혼인/소득/자녀 조건)"""
+
+    @staticmethod
+    def income_pct(annual_income: int, household_size: int) -> int:
+        """
+        연소득(만원) -> 도시근로자 가구원수별 월평균소득 대비 % (소수점 버림)
+        (기준표: settings.URBAN_WORKER_MONTHLY_INCOME[ELIGIBILITY_INCOME_YEAR])
+        """
+        table = settings.URBAN_WORKER_MONTHLY_INCOME[settings.ELIGIBILITY_INCOME_YEAR]
+        base = table[min(max(household_size, 1), max(table))]
+        return int(annual_income * 10000 / 12 / base * 100)
+
+    @staticmethod
+    def filter_eligible(queryset, user_profile: Optional[dict], check_marital: bool = True):
+        """
+        사용자 프로필로 자격이 없는 공고를 제외 (AnncAll 쿼리셋에 EXISTS 조건 추가, DB 1회)
+
+        - 공급대상 행 중 하나라도 모든 조건을 만족하면 대상, 자격 기준이 없는 공고는 항상 대상
+        - 값이 없거나 0인 연령/자녀 수/소득, 'Y'/'N'이 아닌 혼인 여부는 조건 확인 생략 (입력하지 않은 항목)
+
+        :param check_marital: False면 혼인 조건 확인 생략 (질문에 혼인 관련 조건을 직접 명시한 경우)
+        :return: (필터된 쿼리셋, 적용된 조건 딕셔너리) - 적용할 조건이 없으면 원래 쿼리셋
+        """
+        if not user_profile:
+            return queryset, {}
+
+        def to_int(value):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+
+        age = to_int(user_profile.get('ref_age'))
+        children = to_int(user_profile.get('ref_children'))
+        income = to_int(user_profile.get('ref_income'))
+        married = user_profile.get('ref_marriged')  # 가구원 수 계산에는 혼인 조건 확인 여부와 무관하게 사용
+
+        applied = {}
+        rules = AnncEligibility.objects.filter(
+            annc_id=OuterRef('annc_id'),
+            generation=OuterRef('active_generation')
+        )
+        passing = rules
+        if age:
+            passing = passing.filter(
+                Q(min_age__isnull=True) | Q(min_age__lte=age),
+                Q(max_age__isnull=True) | Q(max_age__gte=age)
+            )
+            applied['age'] = age
+        if check_marital and married in ('Y', 'N'):
+            passing = passing.exclude(marital_status='single' if married == 'Y' else 'married')
+            applied['marital'] = married
+        if children:
+            passing = passing.filter(Q(min_children__isnull=True) | Q(min_children__lte=children))
+            applied['children'] = children
+        if income:
+            household_size = 1 + (1 if married == 'Y' else 0) + (children or 0)
+            pct = AnncEligibilityService.income_pct(income, household_size)
+            passing = passing.filter(Q(max_income_pct__isnull=True) | Q(max_income_pct__gte=pct))
+            applied['income_pct'] = pct
+            applied['income_year'] = settings.ELIGIBILITY_INCOME_YEAR
+
+        if not applied:
+            return queryset, {}
+        return queryset.filter(~Exists(rules) | Exists(passing)), applied
+
+
 class ChatHistoryService:
     """채팅 기록 관련 서비스 (Chat + ChatMessage 모델 사용)"""
 
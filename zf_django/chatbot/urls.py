@@ -8,6 +8,7 @@ urlpatterns = [
     path('schema/', SpectacularAPIView.as_view(), name='schema'),
     path('docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('test/', views.TestApiView.as_view(), name='test_api'),
+    path('metrics', views.metrics_view, name='metrics'),
     
     # 채팅
     path('chat', chat_message, name='chat-message'),
@@ -6,8 +6,13 @@ from rest_framework import status
 
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from django.db.models import Q
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
 import math
 
+from . import metrics
+from . import answer_cache  # noqa: F401 - 답변 캐시 지표 수집 함수 등록
 from .models import AnncAll, Chat, ChatMessage
 from .serializers import (
     AnnouncementListResponseSerializer, AnncSummaryResponseSerializer,
@@ -239,6 +244,17 @@ def annc_summary(request):
     }
     return Response(response_data)
 
+# ---------------------------------------------------
+# 챗봇 계측 지표 (GET /api/metrics) - Prometheus 스크레이프용 텍스트 형식
+# ---------------------------------------------------
+@require_GET
+def metrics_view(request):
+    """노드/LLM/검색 소요 시간·토큰 히스토그램과 답변 캐시 통계 (워커 프로세스 단위, METRICS_ALLOWED_IPS만 허용)"""
+    if request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_IPS:
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 class TestApiView(APIView):
     """
     테스트용 REST API View. GET 요청 시 Hello World 메시지를 반환합니다.
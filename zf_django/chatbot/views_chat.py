@@ -18,6 +18,7 @@ from .serializers import (
     ChatHistoriesResponseSerializer, ChatHistoryDetailResponseSerializer
 )
 from .graph import chat as langgraph_chat
+from .conversation_summary import schedule_summary_update
 
 logger = logging.getLogger(__name__)
 
@@ -98,13 +99,15 @@ def _restore_session_state(chat_session) -> dict:
         chat_session: Chat 모델 인스턴스
 
     Returns:
-        복원된 세션 상태 딕셔너리 (prev_anncs, selected_annc, search_history)
+        복원된 세션 상태 딕셔너리 (prev_anncs, selected_annc, search_history, 대화 요약)
     """
     default_state = {
         'search_history': [],
         'prev_anncs': [],
         'selected_annc': None,
-        'selected_anncs': []  # 비교용 다중 선택 공고
+        'selected_anncs': [],  # 비교용 다중 선택 공고
+        'conversation_summary': '',
+        'summarized_count': 0
     }
 
     if not chat_session:
@@ -126,7 +129,9 @@ def _restore_session_state(chat_session) -> dict:
             'search_history': saved_state.get('search_history', []),
             'prev_anncs': saved_state.get('prev_anncs', []),
             'selected_annc': saved_state.get('selected_annc'),
-            'selected_anncs': saved_state.get('selected_anncs', [])  # 비교용 다중 선택 공고
+            'selected_anncs': saved_state.get('selected_anncs', []),  # 비교용 다중 선택 공고
+            'conversation_summary': saved_state.get('conversation_summary', ''),
+            'summarized_count': saved_state.get('summarized_count', 0)
         }
     except (json.JSONDecodeError, TypeError):
         return default_state
@@ -214,6 +219,8 @@ def chat_message(request):
             'prev_anncs': restored_state['prev_anncs'],
             'selected_annc': restored_state['selected_annc'],
             'selected_anncs': restored_state['selected_anncs'],  # 비교용 다중 선택 공고
+            'conversation_summary': restored_state['conversation_summary'],
+            'summarized_count': restored_state['summarized_count'],
             'user_profile': user_profile
         }
 
@@ -227,7 +234,9 @@ def chat_message(request):
             'search_history': updated_session_state.get('search_history', []),
             'prev_anncs': updated_session_state.get('prev_anncs', []),
             'selected_annc': updated_session_state.get('selected_annc'),
-            'selected_anncs': updated_session_state.get('selected_anncs', [])  # 비교용 다중 선택 공고
+            'selected_anncs': updated_session_state.get('selected_anncs', []),  # 비교용 다중 선택 공고
+            'conversation_summary': restored_state['conversation_summary'],
+            'summarized_count': restored_state['summarized_count']
         }
 
         # 현재 최대 sequence 조회
@@ -252,6 +261,19 @@ def chat_message(request):
             message_type='bot'
         )
 
+        # 오래된 메시지를 롤링 요약에 합쳐 이번 bot 메시지의 세션 상태에 저장 (응답 후 백그라운드)
+        def _save_summary(update: dict):
+            ChatMessage.objects.filter(id=bot_message.id).update(
+                prompt=json.dumps({**state_to_save, **update}, ensure_ascii=False)
+            )
+
+        schedule_summary_update(
+            restored_state['conversation_summary'],
+            chat_history + [{'role': 'user', 'content': user_msg}, {'role': 'assistant', 'content': ai_response}],
+            restored_state['summarized_count'],
+            _save_summary
+        )
+
         response_data = {
             "message": "성공적으로 메시지를 등록하고 AI 응답을 받았습니다.",
             "status": "success",
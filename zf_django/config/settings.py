@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 from pathlib import Path
 
-from decouple import config # 임포트
+from decouple import config, Csv # 임포트
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -143,6 +143,38 @@ STATIC_ROOT = BASE_DIR / 'static'
 SESSION_COOKIE_AGE = 60 * 60 * 24 * 7  # 7일
 SESSION_SAVE_EVERY_REQUEST = True
 
+# Eligibility Settings (공고 자격 필터 - 소득 기준)
+# 도시근로자 가구원수별 가구당 월평균소득 (원) - 적용연도별 표 (통계는 적용연도 전년 기준)
+# 새 기준표가 공고되면 표를 추가하고 ELIGIBILITY_INCOME_YEAR로 전환
+URBAN_WORKER_MONTHLY_INCOME = {
+    2024: {  # 2023년 통계
+        1: 3_482_964,
+        2: 5_415_712,
+        3: 7_198_649,
+        4: 8_248_467,
+        5: 8_775_071,
+        6: 9_563_282,
+    },
+}
+ELIGIBILITY_INCOME_YEAR = config('ELIGIBILITY_INCOME_YEAR', default=2024, cast=int)
+
+# Cache Settings
+# answers: 상세 질문 답변 캐시 (gunicorn 워커 간 공유를 위해 파일 기반)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'answers': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': config('ANSWER_CACHE_DIR', default=str(BASE_DIR / '.cache' / 'answers')),
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+# Metrics Settings (GET /api/metrics 접근 허용 IP - 스크레이퍼 주소만 허용)
+METRICS_ALLOWED_IPS = config('METRICS_ALLOWED_IPS', default='127.0.0.1,::1', cast=Csv())
+
 # REST Framework Settings
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
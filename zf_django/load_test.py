@@ -0,0 +1,338 @@
+# load_test.py
+"""
+HTTP API 부하 테스트 (표준 라이브러리만 사용)
+
+gunicorn으로 띄운 서버(로컬 OpenAI 스텁 + 픽스처 DB 권장)에 실제 사용 패턴에 가까운 요청을 섞어 보내고,
+동시 사용자 수를 단계별로 올리며 처리량/지연시간 곡선을 JSON/CSV로 기록합니다.
+워커 모델, 캐시, 비동기 전환 등 변경 전후 비교의 기준선으로 사용합니다.
+
+    python openai_stub.py --port 8081 &
+    OPENAI_BASE_URL=http://localhost:8081/v1 gunicorn config.wsgi -c gunicorn.conf.py &
+    python load_test.py --base-url http://localhost:8000 --concurrency 1,2,4,8,16 --duration 60 \\
+        --output bench/load_baseline.json --label "gunicorn sync x3"
+
+시나리오 (--mix로 가중치 지정, 가상 사용자가 반복 선택):
+    chat     새 세션에서 2~5턴 대화 (POST /api/chat, session_id 이어감) 후 대화 기록 다시 불러오기
+    browse   공고 요약 + 공고 목록 1~3페이지 (상태 필터 섞음)
+    history  사용자 채팅 목록 조회 후 첫 세션 상세 조회
+
+채팅 질문은 기본 질문 세트 또는 --sessions 픽스처(chat_benchmark --export 형식 JSONL)에서 가져옵니다.
+부하 테스트는 채팅 세션을 DB에 기록하므로 운영 DB가 아닌 픽스처 DB에서 실행하세요.
+"""
+import csv
+import json
+import time
+import uuid
+import random
+import argparse
+import threading
+import subprocess
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_SESSIONS = [
+    ["서울 행복주택 공고 알려줘", "1번", "신청자격이 뭐야?", "임대료는 얼마야?"],
+    ["신혼부부 대상 공고 있어?", "2번 공고 자세히", "면적 정보 알려줘"],
+    ["경기도 접수중인 공고", "1번이랑 2번 비교해줘", "1번", "신청기간 언제까지야?", "필요서류 알려줘"],
+    ["행복주택이 뭐야?", "청년 대상 공고 보여줘", "1번", "보증금 얼마야?"],
+    ["전라도 영구임대 공고", "광주도 보여줘", "첫번째 공고 마감일"],
+]
+ANNC_STATUSES = [None, None, '접수중', '공고중']
+DEFAULT_MIX = 'chat=3,browse=5,history=2'
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """선형 보간 백분위수 (q: 0~100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return round(ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower), 4)
+
+
+class Recorder:
+    """단계별 요청 기록 (엔드포인트 -> 지연시간/오류)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.error_samples: List[str] = []
+        self.scenarios: Dict[str, int] = {}
+        self.recording = False
+
+    def add(self, endpoint: str, seconds: float, error: Optional[str] = None):
+        if not self.recording:
+            return
+        with self.lock:
+            self.latencies.setdefault(endpoint, []).append(seconds)
+            if error:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+                if len(self.error_samples) < 20:
+                    self.error_samples.append(f"{endpoint}: {error}")
+
+    def scenario_done(self, name: str):
+        if not self.recording:
+            return
+        with self.lock:
+            self.scenarios[name] = self.scenarios.get(name, 0) + 1
+
+    def summary(self, elapsed: float) -> dict:
+        def stats(values: List[float], errors: int) -> dict:
+            return {
+                "requests": len(values),
+                "errors": errors,
+                "error_rate": round(errors / len(values), 4) if values else 0.0,
+                "rps": round(len(values) / elapsed, 3) if elapsed else 0.0,
+                "mean": round(sum(values) / len(values), 4) if values else None,
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "max": round(max(values), 4) if values else None,
+            }
+
+        with self.lock:
+            endpoints = {ep: stats(values, self.errors.get(ep, 0)) for ep, values in sorted(self.latencies.items())}
+            all_values = [v for values in self.latencies.values() for v in values]
+            return {
+                "overall": stats(all_values, sum(self.errors.values())),
+                "endpoints": endpoints,
+                "scenarios_completed": dict(self.scenarios),
+                "error_samples": list(self.error_samples),
+            }
+
+
+class Client:
+    """가상 사용자 1명의 HTTP 클라이언트 (요청마다 지연시간 기록)"""
+
+    def __init__(self, base_url: str, recorder: Recorder, timeout: float):
+        self.base_url = base_url.rstrip('/')
+        self.recorder = recorder
+        self.timeout = timeout
+
+    def request(self, method: str, path: str, endpoint: str, params: dict = None, body: dict = None) -> Optional[dict]:
+        url = self.base_url + path
+        if params:
+            url += '?' + urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8') if body is not None else None
+        req = urllib.request.Request(url, data=data, method=method, headers={'Content-Type': 'application/json'})
+
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                payload = json.loads(resp.read() or b'{}')
+            self.recorder.add(endpoint, time.perf_counter() - start)
+            return payload
+        except urllib.error.HTTPError as e:
+            self.recorder.add(endpoint, time.perf_counter() - start, f"HTTP {e.code}")
+        except Exception as e:
+            self.recorder.add(endpoint, time.perf_counter() - start, type(e).__name__)
+        return None
+
+
+# =============================================================================
+# 시나리오
+# =============================================================================
+def scenario_chat(client: Client, rng: random.Random, user_key: str, sessions: List[List[str]], deadline: float):
+    """멀티턴 대화 + 대화 기록 다시 불러오기"""
+    questions = rng.choice(sessions)
+    session_id = None
+    for question in questions:
+        if time.monotonic() >= deadline:
+            return
+        body = {'user_message': question, 'user_key': user_key}
+        if session_id:
+            body['session_id'] = session_id
+        payload = client.request('POST', '/api/chat', 'POST /api/chat', body=body)
+        if not payload:
+            return
+        session_id = ((payload.get('data') or {}).get('ai_response') or {}).get('session_id') or session_id
+    if session_id:
+        client.request('GET', f'/api/chathistories/{session_id}', 'GET /api/chathistories/{id}',
+                       params={'user_key': user_key})
+
+
+def scenario_browse(client: Client, rng: random.Random, user_key: str, sessions, deadline: float):
+    """공고 요약 + 목록 페이지 넘기기"""
+    client.request('GET', '/api/annc_summary', 'GET /api/annc_summary')
+    status = rng.choice(ANNC_STATUSES)
+    for page in range(1, rng.randint(1, 3) + 1):
+        if time.monotonic() >= deadline:
+            return
+        client.request('GET', '/api/anncs', 'GET /api/anncs',
+                       params={'items_per_page': 10, 'current_page': page, 'annc_status': status})
+
+
+def scenario_history(client: Client, rng: random.Random, user_key: str, sessions, deadline: float):
+    """채팅 목록 -> 첫 세션 상세"""
+    payload = client.request('GET', '/api/chathistories', 'GET /api/chathistories', params={'user_key': user_key})
+    histories = (payload or {}).get('data') or []
+    if histories and time.monotonic() < deadline:
+        client.request('GET', f"/api/chathistories/{histories[0]['session_id']}", 'GET /api/chathistories/{id}',
+                       params={'user_key': user_key})
+
+
+SCENARIOS = {
+    'chat': scenario_chat,
+    'browse': scenario_browse,
+    'history': scenario_history,
+}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"알 수 없는 시나리오: {name} (가능: {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def load_sessions(path: Optional[str]) -> List[List[str]]:
+    """chat_benchmark 픽스처(JSONL) -> 질문 리스트들"""
+    if not path:
+        return DEFAULT_SESSIONS
+    with open(path, encoding='utf-8') as f:
+        sessions = [json.loads(line)["messages"] for line in f if line.strip()]
+    return [s for s in sessions if s] or DEFAULT_SESSIONS
+
+
+# =============================================================================
+# 단계 실행
+# =============================================================================
+def run_stage(args, concurrency: int, mix: Dict[str, float], sessions: List[List[str]], seed: int) -> dict:
+    """동시 사용자 concurrency명으로 warmup + duration 동안 시나리오 반복"""
+    recorder = Recorder()
+    names, weights = list(mix), list(mix.values())
+    start = time.monotonic()
+    record_from = start + args.warmup
+    deadline = record_from + args.duration
+
+    def virtual_user(idx: int):
+        rng = random.Random(seed * 1000 + idx)
+        # 사용자 키를 사용자 수보다 적게 두어 채팅 목록에 이전 세션이 쌓이도록 함
+        user_key = f"loadtest-{idx % max(1, args.users)}"
+        client = Client(args.base_url, recorder, args.timeout)
+        while time.monotonic() < deadline:
+            name = rng.choices(names, weights)[0]
+            SCENARIOS[name](client, rng, user_key, sessions, deadline)
+            recorder.scenario_done(name)
+            if args.think_time:
+                time.sleep(rng.uniform(0, args.think_time))
+
+    threads = [threading.Thread(target=virtual_user, args=(i,), daemon=True) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    time.sleep(max(0.0, record_from - time.monotonic()))
+    recorder.recording = True
+    recorded_at = time.monotonic()
+    for t in threads:
+        t.join(timeout=max(0.0, deadline - time.monotonic()) + args.timeout)
+    recorder.recording = False
+    elapsed = time.monotonic() - recorded_at
+
+    result = recorder.summary(elapsed)
+    result.update(concurrency=concurrency, seconds=round(elapsed, 2))
+    return result
+
+
+def fetch_json(url: Optional[str]) -> Optional[dict]:
+    if not url:
+        return None
+    try:
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            return json.loads(resp.read())
+    except Exception:
+        return None
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def write_csv(path: str, stages: List[dict]):
+    """처리량/지연시간 곡선용 CSV (단계 x 엔드포인트)"""
+    columns = ['concurrency', 'endpoint', 'requests', 'rps', 'error_rate', 'mean', 'p50', 'p95', 'p99', 'max']
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for stage in stages:
+            rows = [('ALL', stage['overall'])] + list(stage['endpoints'].items())
+            for endpoint, stats in rows:
+                writer.writerow([stage['concurrency'], endpoint] + [stats.get(c) for c in columns[2:]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API 부하 테스트 (동시 사용자 수 단계별 처리량/지연시간)")
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--concurrency', default='1,2,4,8,16', help="단계별 동시 사용자 수 (쉼표 구분)")
+    parser.add_argument('--duration', type=float, default=60, help="단계별 측정 시간 (초)")
+    parser.add_argument('--warmup', type=float, default=5, help="단계별 측정 전 예열 시간 (초)")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f"시나리오 가중치 (기본 {DEFAULT_MIX})")
+    parser.add_argument('--sessions', help="채팅 질문 픽스처 (chat_benchmark --export JSONL)")
+    parser.add_argument('--users', type=int, default=20, help="가상 사용자 키 수 (채팅 목록 크기에 영향)")
+    parser.add_argument('--think-time', type=float, default=0.0, help="시나리오 사이 최대 대기 시간 (초)")
+    parser.add_argument('--timeout', type=float, default=60, help="요청 타임아웃 (초)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--stub-url', help="OpenAI 스텁 주소 (예: http://localhost:8081) - 단계별 /stats 기록")
+    parser.add_argument('--label', help="결과에 기록할 서버 구성 설명 (예: 'gunicorn sync x3')")
+    parser.add_argument('--output', help="결과 JSON 경로 (같은 이름의 .csv도 저장)")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    sessions = load_sessions(args.sessions)
+    levels = [int(c) for c in args.concurrency.split(',') if c.strip()]
+    stub_stats_url = args.stub_url.rstrip('/') + '/stats' if args.stub_url else None
+    run_id = uuid.uuid4().hex[:8]
+
+    stages = []
+    print(f"{'동시':>5} {'req/s':>8} {'p50':>7} {'p95':>7} {'p99':>7} {'오류율':>7}")
+    for idx, concurrency in enumerate(levels):
+        stub_before = fetch_json(stub_stats_url)
+        stage = run_stage(args, concurrency, mix, sessions, seed=args.seed + idx)
+        stub_after = fetch_json(stub_stats_url)
+        if stub_before and stub_after:
+            stage['stub'] = {k: stub_after.get(k, 0) - stub_before.get(k, 0) for k in stub_after}
+        stages.append(stage)
+        o = stage['overall']
+        print(f"{concurrency:>5} {o['rps']:>8} {o['p50'] or '-':>7} {o['p95'] or '-':>7} {o['p99'] or '-':>7} {o['error_rate']:>7}")
+
+    report = {
+        "meta": {
+            "run_id": run_id,
+            "started_at": datetime.now().isoformat(timespec='seconds'),
+            "git_commit": git_commit(),
+            "label": args.label,
+            "base_url": args.base_url,
+            "mix": mix,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "think_time": args.think_time,
+            "sessions": args.sessions or "default",
+        },
+        "stages": stages,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        csv_path = args.output.rsplit('.', 1)[0] + '.csv'
+        write_csv(csv_path, stages)
+        print(f"결과 저장: {args.output}, {csv_path}")
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,387 @@
+# openai_stub.py
+"""
+로컬 OpenAI 호환 스텁 서버 (개발/벤치마크용, 표준 라이브러리만 사용)
+
+챗봇(zf_django)과 크롤러(zf_crawler)를 OpenAI API 없이 실행/부하 테스트하기 위한 대역입니다.
+두 패키지 모두 OPENAI_BASE_URL 설정으로 이 서버를 사용합니다.
+
+    python openai_stub.py --port 8081 --chat-latency lognormal:-1.2,0.5 --rate-limit-prob 0.02
+    OPENAI_BASE_URL=http://localhost:8081/v1 python manage.py chat_benchmark --fixture ...
+
+지원 엔드포인트:
+    POST /v1/chat/completions  일반/스트리밍(stream=true, SSE)/json_object 모드
+                                - 의도 분류 프롬프트: 질문 키워드로 고른 고정 의도 JSON
+                                - 공고 프로필 추출 프롬프트: 모든 항목 null 프로필 JSON
+                                - 그 외: 마지막 사용자 메시지 기반 결정적 텍스트
+    POST /v1/embeddings        입력 해시를 시드로 한 결정적 단위 벡터 (float/base64, dimensions 지원)
+    GET  /v1/models            모델 목록
+    GET  /stats                요청/429 응답 수 (벤치마크 확인용)
+
+지연시간 분포 (--chat-latency / --embedding-latency, 초 단위):
+    fixed:0.3 | uniform:0.1,0.8 | normal:0.5,0.1 | lognormal:mu,sigma (exp(N(mu, sigma)))
+레이트 리밋 주입:
+    --rate-limit-prob 확률로 429 응답, --rpm 분당 요청 수 초과 시 429 (Retry-After 헤더 포함)
+프롬프트 캐싱 흉내:
+    같은 시스템 프롬프트가 1024토큰 이상이면 두 번째 요청부터 usage.prompt_tokens_details.cached_tokens 보고
+"""
+import re
+import json
+import time
+import uuid
+import base64
+import random
+import struct
+import hashlib
+import argparse
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_EMBEDDING_DIMENSIONS = {
+    'text-embedding-3-small': 1536,
+    'text-embedding-3-large': 3072,
+    'text-embedding-ada-002': 1536,
+}
+MODELS = ('gpt-4o-mini', 'gpt-4o', *DEFAULT_EMBEDDING_DIMENSIONS)
+
+# 의도 분류 보정용 키워드 (graph.classify_intent와 같은 계열)
+DETAIL_KEYWORDS = ('신청자격', '자격', '면적', '평수', '임대료', '보증금', '월세', '신청기간', '마감', '서류', '입주', '당첨', '소득', '자산')
+CHAT_KEYWORDS = ('안녕', '고마워', '감사', '뭐야', '이란', '란?', '어떻게 해')
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_BLOCK = 128
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (UTF-8 바이트 / 2)"""
+    return max(1, len(text.encode('utf-8')) // 2) if text else 0
+
+
+class LatencyDistribution:
+    """'종류:파라미터' 문자열 -> 지연시간 샘플러"""
+
+    def __init__(self, spec: str, rng: random.Random):
+        self.spec = spec
+        self.rng = rng
+        kind, _, params = (spec or 'fixed:0').partition(':')
+        self.kind = kind
+        self.params = [float(p) for p in params.split(',') if p]
+        expected = {'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2}
+        if kind not in expected or len(self.params) != expected[kind]:
+            raise ValueError(f"지연시간 분포 형식 오류: {spec} (예: fixed:0.3, uniform:0.1,0.8, lognormal:-1.2,0.5)")
+
+    def sample(self) -> float:
+        if self.kind == 'fixed':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return self.rng.uniform(*self.params)
+        if self.kind == 'normal':
+            return max(0.0, self.rng.gauss(*self.params))
+        return self.rng.lognormvariate(*self.params)
+
+
+class StubState:
+    """서버 설정 + 통계 (핸들러 스레드 간 공유)"""
+
+    def __init__(self, args):
+        self.rng = random.Random(args.seed)
+        self.chat_latency = LatencyDistribution(args.chat_latency, self.rng)
+        self.embedding_latency = LatencyDistribution(args.embedding_latency, self.rng)
+        self.stream_token_delay = args.stream_token_delay
+        self.rate_limit_prob = args.rate_limit_prob
+        self.rpm = args.rpm
+        self.completion_words = args.completion_words
+        self.lock = threading.Lock()
+        self.request_times = deque()
+        self.seen_prefixes = set()
+        self.stats = {'chat': 0, 'embeddings': 0, 'streams': 0, 'rate_limited': 0, 'embedded_inputs': 0}
+
+    def count(self, key: str, amount: int = 1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def latency(self, endpoint: str) -> float:
+        with self.lock:
+            dist = self.chat_latency if endpoint == 'chat' else self.embedding_latency
+            return dist.sample()
+
+    def should_rate_limit(self) -> bool:
+        """확률 주입 또는 분당 요청 수 초과"""
+        with self.lock:
+            if self.rate_limit_prob and self.rng.random() < self.rate_limit_prob:
+                self.stats['rate_limited'] += 1
+                return True
+            if self.rpm:
+                now = time.monotonic()
+                while self.request_times and now - self.request_times[0] > 60:
+                    self.request_times.popleft()
+                if len(self.request_times) >= self.rpm:
+                    self.stats['rate_limited'] += 1
+                    return True
+                self.request_times.append(now)
+            return False
+
+    def cached_tokens(self, system_prompt: str) -> int:
+        """같은 시스템 프롬프트(접두어) 재요청이면 캐시 토큰 수 (1024토큰 이상, 128토큰 단위)"""
+        tokens = estimate_tokens(system_prompt)
+        if tokens < PROMPT_CACHE_MIN_TOKENS:
+            return 0
+        digest = hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()
+        with self.lock:
+            if digest not in self.seen_prefixes:
+                self.seen_prefixes.add(digest)
+                return 0
+        return tokens // PROMPT_CACHE_BLOCK * PROMPT_CACHE_BLOCK
+
+
+# =============================================================================
+# 응답 생성
+# =============================================================================
+def message_text(message: dict) -> str:
+    content = message.get('content') or ''
+    if isinstance(content, list):  # [{"type": "text", "text": ...}]
+        return ' '.join(part.get('text', '') for part in content if isinstance(part, dict))
+    return str(content)
+
+
+def canned_intent(question: str) -> dict:
+    """질문 키워드로 고른 의도 분류 결과 (classify_intent 응답 형식)"""
+    question = question.replace('질문:', '').strip()
+    indices = [int(n) for n in re.findall(r'(\d+)\s*번', question)]
+    intent = {
+        "intent": "search", "search_mode": "new", "restore_query": None,
+        "select_indices": [], "select_annc_name": None, "compare_annc_names": [],
+        "rdb_filters": {"annc_status": None, "annc_dtl_type": None, "annc_region": []},
+        "rag_keywords": question, "needs_web_search": False, "reasoning": "stub",
+    }
+    if '비교' in question:
+        intent.update(intent="compare", select_indices=indices or [1, 2])
+    elif indices:
+        intent.update(intent="select", select_indices=indices[:1])
+    elif any(kw in question for kw in DETAIL_KEYWORDS):
+        intent.update(intent="detail")
+    elif any(kw in question for kw in CHAT_KEYWORDS):
+        intent.update(intent="chat", rag_keywords=None)
+    elif re.search(r'\S도\s*(보여|추가|포함)', question):
+        intent.update(search_mode="add")
+    return intent
+
+
+def canned_json(system_prompt: str, user_text: str) -> dict:
+    if '의도 분류기' in system_prompt:
+        return canned_intent(user_text)
+    if '공고문 발췌에서 아래 항목을 추출' in system_prompt + user_text:
+        profile = {key: None for key in ('eligibility', 'rent', 'area', 'schedule', 'documents')}
+        profile['eligibility_rules'] = []
+        return profile
+    return {}
+
+
+def canned_text(user_text: str, words: int) -> str:
+    """마지막 사용자 메시지 기반 결정적 텍스트 (같은 입력 -> 같은 출력)"""
+    seed = int(hashlib.sha256(user_text.encode('utf-8')).hexdigest()[:8], 16)
+    rng = random.Random(seed)
+    keywords = [w for w in re.split(r'\s+', user_text) if w][:8] or ['안내']
+    body = ' '.join(rng.choice(keywords) for _ in range(words))
+    return f"[stub] {body}"
+
+
+def build_completion(body: dict, state: StubState) -> tuple:
+    """(응답 본문 텍스트, usage)"""
+    messages = body.get('messages') or []
+    system_prompt = '\n'.join(message_text(m) for m in messages if m.get('role') == 'system')
+    user_messages = [message_text(m) for m in messages if m.get('role') == 'user']
+    user_text = user_messages[-1] if user_messages else ''
+
+    if (body.get('response_format') or {}).get('type') in ('json_object', 'json_schema'):
+        content = json.dumps(canned_json(system_prompt, user_text), ensure_ascii=False)
+    else:
+        content = canned_text(user_text, state.completion_words)
+
+    prompt_tokens = sum(estimate_tokens(message_text(m)) for m in messages)
+    completion_tokens = estimate_tokens(content)
+    usage = {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens,
+        'prompt_tokens_details': {'cached_tokens': state.cached_tokens(system_prompt)},
+    }
+    return content, usage
+
+
+def embedding_vector(item, dimensions: int) -> list:
+    """입력(문자열 또는 토큰 ID 리스트) 해시를 시드로 한 결정적 단위 벡터"""
+    key = item if isinstance(item, str) else json.dumps(item)
+    seed = int(hashlib.sha256(key.encode('utf-8')).hexdigest()[:16], 16)
+    rng = random.Random(seed)
+    vec = [rng.gauss(0, 1) for _ in range(dimensions)]
+    norm = sum(v * v for v in vec) ** 0.5 or 1.0
+    return [v / norm for v in vec]
+
+
+# =============================================================================
+# HTTP 핸들러
+# =============================================================================
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = 'OpenAIStub/1.0'
+    protocol_version = 'HTTP/1.1'
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: int, message: str, error_type: str, headers: dict = None, code: str = None):
+        self._send_json(status, {'error': {'message': message, 'type': error_type, 'param': None, 'code': code}}, headers)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b'{}'
+        return json.loads(raw or b'{}')
+
+    def do_GET(self):
+        if self.path.rstrip('/') in ('/v1/models', '/models'):
+            self._send_json(200, {'object': 'list', 'data': [
+                {'id': m, 'object': 'model', 'created': 0, 'owned_by': 'stub'} for m in MODELS
+            ]})
+        elif self.path.rstrip('/') == '/stats':
+            with self.state.lock:
+                self._send_json(200, dict(self.state.stats))
+        else:
+            self._send_error(404, f"Unknown path: {self.path}", 'invalid_request_error')
+
+    def do_POST(self):
+        path = self.path.split('?')[0].rstrip('/')
+        try:
+            body = self._read_body()
+        except ValueError as e:
+            self._send_error(400, f"Invalid JSON body: {e}", 'invalid_request_error')
+            return
+
+        if path.endswith('/chat/completions'):
+            endpoint = 'chat'
+        elif path.endswith('/embeddings'):
+            endpoint = 'embeddings'
+        else:
+            self._send_error(404, f"Unknown path: {self.path}", 'invalid_request_error')
+            return
+
+        if self.state.should_rate_limit():
+            self._send_error(429, 'Rate limit reached (stub)', 'requests', {'Retry-After': '1'}, code='rate_limit_exceeded')
+            return
+
+        time.sleep(self.state.latency(endpoint))
+        if endpoint == 'chat':
+            self.handle_chat(body)
+        else:
+            self.handle_embeddings(body)
+
+    def handle_chat(self, body: dict):
+        self.state.count('chat')
+        content, usage = build_completion(body, self.state)
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = body.get('model', 'gpt-4o-mini')
+
+        if not body.get('stream'):
+            self._send_json(200, {
+                'id': completion_id, 'object': 'chat.completion', 'created': created, 'model': model,
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+                'usage': usage,
+            })
+            return
+
+        # 스트리밍: 토큰(공백 단위) 청크를 SSE로 전송, 연결 종료로 응답 끝 표시
+        self.state.count('streams')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        def send_chunk(delta: dict, finish_reason=None, chunk_usage=None):
+            chunk = {
+                'id': completion_id, 'object': 'chat.completion.chunk', 'created': created, 'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}] if delta is not None else [],
+            }
+            if chunk_usage is not None:
+                chunk['usage'] = chunk_usage
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+
+        send_chunk({'role': 'assistant', 'content': ''})
+        pieces = re.findall(r'\S+\s*', content) or [content]
+        for piece in pieces:
+            if self.state.stream_token_delay:
+                time.sleep(self.state.stream_token_delay)
+            send_chunk({'content': piece})
+        send_chunk({}, finish_reason='stop')
+        if (body.get('stream_options') or {}).get('include_usage'):
+            send_chunk(None, chunk_usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def handle_embeddings(self, body: dict):
+        inputs = body.get('input', [])
+        # 문자열 1개, 문자열 리스트, 토큰 ID 리스트, 토큰 ID 리스트의 리스트
+        if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        model = body.get('model', 'text-embedding-3-small')
+        dimensions = body.get('dimensions') or DEFAULT_EMBEDDING_DIMENSIONS.get(model, 1536)
+        as_base64 = body.get('encoding_format') == 'base64'
+
+        data = []
+        for idx, item in enumerate(inputs):
+            vec = embedding_vector(item, dimensions)
+            embedding = base64.b64encode(struct.pack(f'<{dimensions}f', *vec)).decode('ascii') if as_base64 else vec
+            data.append({'object': 'embedding', 'index': idx, 'embedding': embedding})
+
+        prompt_tokens = sum(len(item) if isinstance(item, list) else estimate_tokens(item) for item in inputs)
+        self.state.count('embeddings')
+        self.state.count('embedded_inputs', len(inputs))
+        self._send_json(200, {
+            'object': 'list', 'data': data, 'model': model,
+            'usage': {'prompt_tokens': prompt_tokens, 'total_tokens': prompt_tokens},
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 OpenAI 호환 스텁 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--chat-latency', default='fixed:0.3', help="채팅 응답 지연시간 분포 (초)")
+    parser.add_argument('--embedding-latency', default='fixed:0.05', help="임베딩 응답 지연시간 분포 (초)")
+    parser.add_argument('--stream-token-delay', type=float, default=0.01, help="스트리밍 청크 간격 (초)")
+    parser.add_argument('--rate-limit-prob', type=float, default=0.0, help="429 응답 확률 (0~1)")
+    parser.add_argument('--rpm', type=int, default=0, help="분당 요청 수 한도 (0이면 제한 없음)")
+    parser.add_argument('--completion-words', type=int, default=60, help="텍스트 응답 단어 수")
+    parser.add_argument('--seed', type=int, default=0, help="지연시간/429 주입 난수 시드")
+    parser.add_argument('--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args()
+
+    StubHandler.state = StubState(args)
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    server.daemon_threads = True
+    server.verbose = args.verbose
+    print(f"OpenAI 스텁 서버: http://{args.host}:{args.port}/v1 "
+          f"(chat {args.chat_latency}, embeddings {args.embedding_latency}, 429 {args.rate_limit_prob}, rpm {args.rpm or '-'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()